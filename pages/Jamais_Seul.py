@@ -8,15 +8,26 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Now import all other libraries
+# Now import all other libraries. plotly.express and plotly.graph_objects are
+# only needed to build a figure missing from the figure cache: they are
+# imported by the first build (see utils/lazy.py)
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
-import base64
-import time
-from datetime import datetime, timedelta
-from streamlit_extras.metric_cards import style_metric_cards
+from utils import profiling, theme
+from utils.lazy import LazyModule
+from utils.assets import base64_cache
+from utils.figure_cache import cached_figure, figure_cache
+from utils.data_cache import data_cache
+from utils.data_sources import DATA_SOURCE, ProjectDataLoader, open_data_source
+from utils.critical_path import CPM_TABLES, critical_path
+from utils.budget_simulation import DRAW_OPTIONS, budget_simulation, summarize_simulation
+from utils.earned_value import CPI_ALERT, EVM_TABLES, TOTAL, earned_value
+from utils.period_views import build_period_view
+from utils.schedule_risk import SCHEDULE_TABLES, schedule_risk
+from utils.wbs import phase_progress
+from utils.shared_cache import shared_cache
+
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
 
 # Définir la palette de couleurs globale au début du fichier, juste après les imports
 
@@ -51,310 +62,64 @@ COLOR_PALETTE = {
     "neutral": "#f5933c"   # orange
 }
 
+# Shared dashboard styles (metric cards), see assets/css/dashboard.css
+st.markdown(theme.stylesheet_html("dashboard"), unsafe_allow_html=True)
+
+# Top level navigation tabs, the selected label is kept in st.session_state.active_tab
+TAB_TITLES = ["📊 Tableau de bord", "📅 Planning", "💰 Budget", "⚠️ Risques", "👥 Équipe"]
+
 # Initialize session state
 if "dashboard_period" not in st.session_state:
     st.session_state.dashboard_period = "S9"
 if "active_tab" not in st.session_state:
-    st.session_state.active_tab = 0
+    st.session_state.active_tab = TAB_TITLES[0]
 
 # Helper functions
-@st.cache_data
+@st.cache_resource(show_spinner=False)
+def get_data_loader(source_spec):
+    """Return the incremental loader of a data source, shared by all sessions"""
+    return ProjectDataLoader(open_data_source(source_spec), caches=(shared_cache, data_cache),
+                             cache_key=source_spec)
+
 def load_project_data():
-    """Load all project data and return as dictionary"""
-    # Generate periods - S1 à S14
-    periods = ["S1", "S2", "S3", "S4", "S5", "S6", "S7", "S8", "S9", "S10", "S11", "S12", "S13", "S14"]
-    
-    # Project progress data
-    project_progress = {
-        "S1": 7, "S2": 14, "S3": 21, "S4": 28, 
-        "S5": 35, "S6": 42, "S7": 50, "S8": 60, 
-        "S9": 70, "S10": 80, "S11": 86, "S12": 92,
-        "S13": 96, "S14": 100
-    }
-    
-    # Budget data with realistic scaled increases
-    budget_categories_new = [
-    "Logistique", "Sécurité & secours", "Communication", "Inscriptions/plateforme", 
-    "Animation", "Prévention des risques", "Imprévus"
-    ]   
-
-    budget_data = {}
-    # Structure: period -> {category -> [budget_initial, dernier_budget, estime, consomme]}
-    fixed_budgets = {
-        "Logistique": [2000, 1900, 1900],
-        "Sécurité & secours": [900, 900, 900],
-        "Communication": [1490, 1490, 1490],
-        "Inscriptions/plateforme": [600, 600, 600],
-        "Animation": [1000, 1100, 1100],
-        "Prévention des risques": [1000, 1000, 1000],
-        "Imprévus": [200, 200, 200]
-    }
-
-    for period in periods:
-        # Calculate spending scale factor - increases with each period
-        spend_factor = (periods.index(period) + 1) / len(periods)
-        budget_data[period] = {}
-        
-        for category, values in fixed_budgets.items():
-            budget_initial, budget_valide, estime = values
-            
-            # Calculate spending based on period progress
-            # Special case for communication which might exceed budget
-            if category == "Communication":
-                max_spend = 2070  # Known communication overspend
-                spend = min(max_spend, max_spend * spend_factor)
-            else:
-                # For other categories, spending increases proportionally, up to the validated budget
-                spend = min(budget_valide, budget_valide * spend_factor * 1.1)  # 1.1 to allow some overspend
-            
-            budget_data[period][category] = [budget_initial, budget_valide, estime, spend]
-    
-    # Risk data with evolving profile
-    # Risk data with evolving profile
-    risk_levels = ["Mineur", "Modéré", "Majeur"]
-    risk_trends = ["↓", "→", "↑"]
-    risk_data = {}
-
-    # Define risk evolution patterns - Replace with specific risks
-    risk_patterns = {
-        "R01_Désistement des bénévoles": [0, 0, 0, 1, 1, 2, 2, 2, 1, 1, 0, 0, 0, 0],
-        "R02_Risques sanitaires": [2, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "R03_Nombre de participants": [0, 0, 1, 1, 2, 2, 2, 2, 1, 1, 0, 0, 0, 0],
-        "R04_Conditions extremes": [0, 0, 0, 0, 1, 2, 2, 1, 1, 0, 0, 0, 0, 0]
-    }
-    
-    for i, period in enumerate(periods):
-        risk_data[period] = {}
-        for risk, pattern in risk_patterns.items():
-            level = risk_levels[pattern[i]]
-            # Determine trend
-            if i < len(periods) - 1:
-                if pattern[i] < pattern[i+1]:
-                    trend = risk_trends[2]  # Upward
-                elif pattern[i] > pattern[i+1]:
-                    trend = risk_trends[0]  # Downward
-                else:
-                    trend = risk_trends[1]  # Stable
-            else:
-                trend = risk_trends[1]  # Stable for last period
-                
-            impact = 9 - pattern[i] * 2 + np.random.randint(-1, 2)
-            impact = max(1, min(10, impact))
-            
-            priority = "Urgent" if level == "Majeur" else "Élevé" if level == "Modéré" and impact > 6 else "Normal" if level == "Modéré" else "Faible"
-            
-            risk_data[period][risk] = {
-                "niveau": level, 
-                "tendance": trend, 
-                "impact": impact, 
-                "priorité": priority
-            }
-    
-    # Objectives data with realistic progression
-    # Objectives data with SMART objectives
-    objectives_data = {}
-    objectives = {
-        "Participants": {"cible": 700, "max": 1000},
-        "Bénévoles": {"cible": 40},
-        "Partenaires": {"cible": 10},
-        "Satisfaction": {"cible": 100}
-    }
-
-    # Define growth curves for 14 periods based on SMART criteria
-    growth_curves = {
-        # Progressive increase up to potentially 1000 participants
-        "Participants": [0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80, 0.90, 1.00, 1.20, 1.30],
-        # Steady recruitment of volunteers
-        "Bénévoles": [0.10, 0.20, 0.25, 0.30, 0.40, 0.50, 0.60, 0.75, 0.80, 0.85, 0.90, 0.95, 1.00, 1.05],
-        # 5 partners by S8 (50%), then growing to target
-        "Partenaires": [0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.45, 0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 1.00],
-        # Zero until S10, then rapid growth
-        "Satisfaction": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.60, 0.70, 0.80, 0.90]
-    }
-
-    for i, period in enumerate(periods):
-        objectives_data[period] = {}
-        for obj, details in objectives.items():
-            target = details["cible"]
-            percentage = growth_curves[obj][i] * 100
-            actual = int(target * growth_curves[obj][i])
-            objectives_data[period][obj] = {
-                "cible": target,
-                "actuel": actual,
-                "pourcentage": int(percentage)
-            }
-    
-    # Team performance data (1=Formation, 2=Confrontation, 3=Normalisation, 4=Performance, 0=Absent)
-    team_states = {
-        "Adèle": [1, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],     
-        "Alexia": [1, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4],    
-        "Hoang": [1, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],     
-        "Margaux": [1, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],   
-        "Salma": [1, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],     
-        "Nordine": [1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4],   
-        "Antoine": [1, 1, 1, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4],   
-        "Alexandre": [1, 1, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 4, 4], 
-        "Moumene": [1, 1, 0, 2, 2, 0, 3, 3, 0, 3, 0, 4, 0, 4]    
-    }
-    
-    # Create detailed GANTT data with the exact task specifications provided
-    gantt_data = []
-    
-    # Task definitions with start and end dates
-    task_definitions = [
-        # Phase 1
-        {"name": "1 Conception et mise en route du projet", "start": "2025-02-24", "end": "2025-03-14", "phase": "Phase 1", "level": "Main"},
-        {"name": "1.1 Identification des besoins des bénéficiaires", "start": "2025-02-24", "end": "2025-02-26", "phase": "Phase 1", "level": "Sub"},
-        {"name": "1.2 Création d'un canal de communication interne", "start": "2025-02-26", "end": "2025-02-28", "phase": "Phase 1", "level": "Sub"},
-        {"name": "1.3 Estimation des coûts par poste", "start": "2025-02-27", "end": "2025-03-06", "phase": "Phase 1", "level": "Sub"},
-        {"name": "1.4 Rédaction de la charte du projet", "start": "2025-03-07", "end": "2025-03-10", "phase": "Phase 1", "level": "Sub"},
-        {"name": "1.5 Elaboration d'un plan de contact", "start": "2025-03-07", "end": "2025-03-11", "phase": "Phase 1", "level": "Sub"},
-        {"name": "1.6 Mise en route du projet", "start": "2025-03-12", "end": "2025-03-14", "phase": "Phase 1", "level": "Sub"},
-        
-        # Phase 2
-        {"name": "2 Définition et planification du projet", "start": "2025-03-17", "end": "2025-04-04", "phase": "Phase 2", "level": "Main"},
-        {"name": "2.1 Définition des critères d'éligibilité", "start": "2025-03-17", "end": "2025-03-17", "phase": "Phase 2", "level": "Sub"},
-        {"name": "2.2 Définition des indicateurs de succès", "start": "2025-03-17", "end": "2025-03-19", "phase": "Phase 2", "level": "Sub"},
-        {"name": "2.3 Mise en place d'un diagramme de GANTT", "start": "2025-03-20", "end": "2025-03-21", "phase": "Phase 2", "level": "Sub"},
-        {"name": "2.4 Attribution des rôles et des responsabilités", "start": "2025-03-21", "end": "2025-03-28", "phase": "Phase 2", "level": "Sub"},
-        {"name": "2.5 Repérage terrain", "start": "2025-03-28", "end": "2025-04-01", "phase": "Phase 2", "level": "Sub"},
-        {"name": "2.6 Préparation des dossiers de demande", "start": "2025-04-02", "end": "2025-04-04", "phase": "Phase 2", "level": "Sub"},
-        {"name": "2.7 Planification des réunions régulières", "start": "2025-04-04", "end": "2025-04-04", "phase": "Phase 2", "level": "Sub"},
-        
-        # Phase 3
-        {"name": "3 Mise en œuvre du projet", "start": "2025-04-07", "end": "2025-05-10", "phase": "Phase 3", "level": "Main"},
-        {"name": "3.1 Réservation des lieux", "start": "2025-04-07", "end": "2025-04-08", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.2 Conception graphique des affiches", "start": "2025-04-08", "end": "2025-04-09", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.3 Enregistrement et appariement selon centre d'intérêt", "start": "2025-04-08", "end": "2025-04-10", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.4 Suivi des validations administratives", "start": "2025-04-09", "end": "2025-04-11", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.5 Location de matériel (barnums, barrières, etc.)", "start": "2025-04-14", "end": "2025-04-14", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.6 Réalisation de vidéos promotionnelles", "start": "2025-04-10", "end": "2025-04-15", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.7 Recrutement des bénévoles", "start": "2025-04-16", "end": "2025-04-22", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.8 Session de présentation du parcours", "start": "2025-04-23", "end": "2025-04-23", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.9 Organisation d'ateliers de préparation", "start": "2025-04-23", "end": "2025-04-23", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.10 Coordination avec les pompiers et SAMU", "start": "2025-04-23", "end": "2025-04-28", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.11 Mises en relation avant l'évènement", "start": "2025-04-30", "end": "2025-05-02", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.12 Briefing des bénévoles sur la sécurité", "start": "2025-05-05", "end": "2025-05-06", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.13 Installation technique (signalétique, barrières…)", "start": "2025-05-07", "end": "2025-05-10", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.14 Installation de stands thématiques", "start": "2025-05-09", "end": "2025-05-10", "phase": "Phase 3", "level": "Sub"},
-        {"name": "3.15 Journée de l'évènement", "start": "2025-05-10", "end": "2025-05-10", "phase": "Phase 3", "level": "Sub"},
-        
-        # Phase 4
-        {"name": "4 Performances/contrôle du projet", "start": "2025-05-12", "end": "2025-05-21", "phase": "Phase 4", "level": "Main"},
-        {"name": "4.1 Création d'un questionnaire de satisfaction", "start": "2025-05-12", "end": "2025-05-13", "phase": "Phase 4", "level": "Sub"},
-        {"name": "4.2 Analyse des retours", "start": "2025-05-14", "end": "2025-05-16", "phase": "Phase 4", "level": "Sub"},
-        {"name": "4.3 Performances du projet", "start": "2025-05-15", "end": "2025-05-16", "phase": "Phase 4", "level": "Sub"},
-        {"name": "4.4 Présentation aux parties prenantes", "start": "2025-05-19", "end": "2025-05-21", "phase": "Phase 4", "level": "Sub"},
-    ]
-    
-    # Add tasks to gantt data
-    for task in task_definitions:
-        gantt_data.append({
-            "Task": task["name"],
-            "Start": task["start"],
-            "Finish": task["end"],
-            "Resource": task["phase"],
-            "Level": task["level"]
-        })
-    # Ajouter après la section GANTT data dans la fonction load_project_data
-
-    # Map periods to dates for GANTT chart reference
-    period_dates = {
-        "S1": "2025-02-24", "S2": "2025-03-03", "S3": "2025-03-10",
-        "S4": "2025-03-17", "S5": "2025-03-24", "S6": "2025-03-31",
-        "S7": "2025-04-07", "S8": "2025-04-14", "S9": "2025-04-21",
-        "S10": "2025-04-28", "S11": "2025-05-05", "S12": "2025-05-12", 
-        "S13": "2025-05-19", "S14": "2025-05-26"
-    }
-    
-    # Satisfaction data
-    satisfaction_data = {}
-    for i, period in enumerate(periods):
-        very_satisfied_base = 3 + i * 2
-        satisfied_base = 3 - i * 0.3
-        neutral_base = max(0, 1 - i * 0.1)
-        unsatisfied_base = max(0, 1 - i * 0.08)
-        very_unsatisfied_base = max(0, 1 - i * 0.07)
-        
-        # Make sure none are negative and they add up to 100
-        very_unsatisfied = max(0, round(very_unsatisfied_base))
-        unsatisfied = max(0, round(unsatisfied_base))
-        neutral = max(0, round(neutral_base))
-        satisfied = max(0, round(satisfied_base))
-        very_satisfied = 100 - (satisfied + neutral + unsatisfied + very_unsatisfied)
-        
-        satisfaction_data[period] = {
-            "Très satisfait": very_satisfied,
-            "Satisfait": satisfied,
-            "Neutre": neutral,
-            "Insatisfait": unsatisfied,
-            "Très insatisfait": very_unsatisfied
-        }
-    
-    # Return complete dataset
-    data = {
-        "periods": periods,
-        "project_progress": project_progress,
-        "budget_data": budget_data,
-        "risk_data": risk_data,
-        "objectives_data": objectives_data,
-        "team_states": team_states,
-        "satisfaction_data": satisfaction_data,
-        "gantt_data": gantt_data,
-        "period_dates": period_dates
-    }
-
-    # Définition des jalons clés du projet
-    milestones = [
-        {"Milestone": "Validation de la charte", "Date": "2025-03-14", "Phase": "Phase 1"},
-        {"Milestone": "Planification complétée", "Date": "2025-04-04", "Phase": "Phase 2"},
-        {"Milestone": "Recrutement bénévoles finalisé", "Date": "2025-04-22", "Phase": "Phase 3"},
-        {"Milestone": "Jour de l'événement", "Date": "2025-05-10", "Phase": "Phase 3"},
-        {"Milestone": "Rapport final", "Date": "2025-05-21", "Phase": "Phase 4"}
-    ]
-
-    # Ajouter les jalons aux données
-    data["milestones"] = milestones
-    
-    return data
+    """Load all project data and return it as ProjectData (only changed tables are re-read)"""
+    return get_data_loader(DATA_SOURCE).load()
+
+def select_period():
+    """Slider callback: store the new period before the fragment reruns"""
+    st.session_state.dashboard_period = st.session_state["sidebar-period-selector"]
 
-def calculate_delta(current_value, previous_value):
-    """Calculate difference and percentage change"""
-    delta = current_value - previous_value
-    delta_percent = (delta / previous_value) * 100 if previous_value != 0 else 0
-    return delta, delta_percent
+def plotly_chart(fig, figure_id):
+    """Display a figure, its serialization being timed when profiling is on"""
+    with profiling.span(f"plotly_chart:{figure_id}"):
+        st.plotly_chart(fig, use_container_width=True)
 
-# Load data
-data = load_project_data()
-periods = data["periods"]
-selected_period = st.session_state.dashboard_period
-selected_period_index = periods.index(selected_period)
+# Opt-in profiling (?profile=1 or JAMAIS_SEUL_PROFILE=1), see utils/profiling.py
+PROFILE_COUNTERS = {
+    "figure_cache": figure_cache.stats,
+    "base64_cache": base64_cache.stats,
+    "loader_reads": lambda: get_data_loader(DATA_SOURCE).reads,
+}
+if shared_cache is not None:
+    PROFILE_COUNTERS["shared_cache"] = shared_cache.stats
+if data_cache is not None:
+    PROFILE_COUNTERS["data_cache"] = data_cache.stats
+profiling.start_rerun("Jamais_Seul", counters=PROFILE_COUNTERS)
 
 # Page header
 st.title("🏃‍♂️ Gestion de projet pour la course Jamais Seul 🏃‍♀️")
 
-# Top level navigation with tabs
-tab_titles = ["📊 Tableau de bord", "📅 Planning", "💰 Budget", "⚠️ Risques", "👥 Équipe"]
-tabs = st.tabs(tab_titles)
+# Top level navigation with tabs. With on_change="rerun" the tabs track their
+# state, so only the open tab's body runs (see the end of the script)
+tabs = st.tabs(TAB_TITLES, key="active_tab", on_change="rerun")
 
 # Sidebar
 with st.sidebar:
     st.title("Jamais Seul")
     
-    # Period selector
-    st.header("⚙️ Contrôles")
-    period_selector = st.select_slider(
-        "Période d'analyse",
-        options=periods,
-        value=selected_period,
-        key="sidebar-period-selector"
-    )
-    if period_selector != selected_period:
-        st.session_state.dashboard_period = period_selector
-        st.rerun()
-    
-    # Date reference
-    st.caption(f"Date de référence: {data['period_dates'][selected_period]}")
+    # Period selector and date reference, written by the period fragment
+    # (see render_period_sections)
+    period_controls = st.container()
     
     # Quick filters
     st.header("Filtres rapides")
@@ -386,59 +151,29 @@ with st.sidebar:
         unsafe_allow_html=True
     )
 
+    # Per-rerun profiling breakdown, written by the fragments (see utils/profiling.py)
+    profile_placeholder = st.container()
+
 # Tab 1: General Overview - Keep compact to fit on one page without scrolling
-with tabs[0]:
+def render_dashboard_tab():
+    """Render the general overview tab"""
     st.header("📊 Tableau de bord")
     # Top level metrics in compact layout
     col1, col2, col3, col4 = st.columns(4)
 
-    # Calculate current metrics and deltas
-    current_progress = data["project_progress"][selected_period]
-    prev_progress = data["project_progress"][periods[max(0, selected_period_index-1)]]
-    progress_delta, progress_delta_percent = calculate_delta(current_progress, prev_progress)
-
-    current_objectives = data["objectives_data"][selected_period]
-    avg_objective = int(sum(obj['pourcentage'] for obj in current_objectives.values()) / len(current_objectives))
-    prev_period = periods[max(0, selected_period_index-1)]
-    prev_avg = int(sum(obj['pourcentage'] for obj in data['objectives_data'][prev_period].values()) / len(data['objectives_data'][prev_period]))
-    objective_delta, objective_delta_percent = calculate_delta(avg_objective, prev_avg)
-
-    current_risks = data["risk_data"][selected_period]
-    high_risks = sum(1 for risk in current_risks.values() if risk["niveau"] == "Majeur")
-    prev_high_risks = sum(1 for risk in data["risk_data"][periods[max(0, selected_period_index-1)]].values() if risk["niveau"] == "Majeur")
-    risk_delta, risk_delta_percent = calculate_delta(high_risks, prev_high_risks)
-
-    current_participants = current_objectives['Participants']['actuel']
-    prev_participants = data['objectives_data'][periods[max(0, selected_period_index-1)]]['Participants']['actuel']
-    participants_delta, participants_delta_percent = calculate_delta(current_participants, prev_participants)
-
     # Display metrics with customized styling
     with col1:
-        st.metric("Progression", f"{current_progress}%", f"{progress_delta:+.0f}%", delta_color="normal")
+        st.metric("Progression", f"{view['progress']}%", f"{view['progress_delta']:+.0f}%", delta_color="normal")
         
     with col2:
-        st.metric("Objectifs SMART", f"{avg_objective}%", f"{objective_delta:+.0f}%", delta_color="normal")
+        st.metric("Objectifs SMART", f"{view['avg_objective']}%", f"{view['objective_delta']:+.0f}%", delta_color="normal")
         
     with col3:
-        st.metric("Risques majeurs", high_risks, f"{risk_delta:+.0f}", delta_color="inverse")
+        st.metric("Risques majeurs", view["high_risks"], f"{view['risk_delta']:+.0f}", delta_color="inverse")
         
     with col4:
-        st.metric("Participants", current_participants, f"{participants_delta:+.0f}", delta_color="normal")
-
-    # Apply metric styling
-    style_metric_cards(
-        background_color="#FFFFFF",
-        border_left_color={
-            "normal": COLOR_PALETTE["vert"],
-            "inverse-normal": COLOR_PALETTE["orange"],
-            "up": COLOR_PALETTE["vert"],
-            "down": COLOR_PALETTE["orange"],
-            "off": COLOR_PALETTE["jaune"]
-        },
-        border_color="#FFFFFF",
-        box_shadow=True
-    )
-    
+        st.metric("Participants", view["participants"], f"{view['participants_delta']:+.0f}", delta_color="normal")
+
     # Main dashboard in two columns - Top row
     col1, col2 = st.columns(2)
     
@@ -449,147 +184,156 @@ with tabs[0]:
         st.subheader("GANTT - Phases principales")
         st.caption("Phases principales du projet avec jalons clés")
         
-        # Create GANTT data for main phases only
-        main_phases = [
-            {"Task": "1. Conception et mise en route", "Start": "2025-02-24", "Finish": "2025-03-14", "Phase": "Phase 1"},
-            {"Task": "2. Définition et planification", "Start": "2025-03-17", "Finish": "2025-04-04", "Phase": "Phase 2"},
-            {"Task": "3. Mise en œuvre", "Start": "2025-04-07", "Finish": "2025-05-10", "Phase": "Phase 3"},
-            {"Task": "4. Performances/contrôle", "Start": "2025-05-12", "Finish": "2025-05-21", "Phase": "Phase 4"}
-        ]
-        
-        mini_gantt_df = pd.DataFrame(main_phases)
-        mini_gantt_df["Start"] = pd.to_datetime(mini_gantt_df["Start"])
-        mini_gantt_df["Finish"] = pd.to_datetime(mini_gantt_df["Finish"])
-        
-        # Créer le diagramme de Gantt
-        fig = px.timeline(
-            mini_gantt_df,
-            x_start="Start",
-            x_end="Finish",
-            y="Task",
-            color="Phase",
-            color_discrete_map={
-                "Phase 1": COLOR_PALETTE["phase1"],
-                "Phase 2": COLOR_PALETTE["phase2"],
-                "Phase 3": COLOR_PALETTE["phase3"],
-                "Phase 4": COLOR_PALETTE["phase4"]
-            }
-        )
-        
-        # Add vertical line for current period
-        current_date = data['period_dates'][selected_period]
-        fig.add_vline(x=current_date, line_width=2, line_dash="dash", line_color="#444444")
-        
-        # Add vertical line for race day - May 9, 2025
-        race_day = "2025-05-09"
-        fig.add_vline(x=race_day, line_width=3, line_color=COLOR_PALETTE["rouge"])
-        
-        # Add annotation for race day
-        fig.add_annotation(
-            x=race_day,
-            y=4,
-            text="Jour J",
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1,
-            arrowwidth=2,
-            arrowcolor=COLOR_PALETTE["rouge"],
-            font=dict(color=COLOR_PALETTE["rouge"]),
-            xanchor="left"
-        )
-        
-        # Ajouter les jalons comme des points sur le diagramme
-        for milestone in data["milestones"]:
-            milestone_date = pd.to_datetime(milestone["Date"])
-            for i, phase in enumerate(main_phases):
-                phase_start = pd.to_datetime(phase["Start"])
-                phase_end = pd.to_datetime(phase["Finish"])
-                
-                # Afficher le jalon sur sa phase correspondante
-                if milestone["Phase"] == phase["Phase"] and phase_start <= milestone_date <= phase_end:
-                    y_position = i
-                    
-                    # Ajouter un marqueur pour le jalon
-                    fig.add_trace(go.Scatter(
-                        x=[milestone_date],
-                        y=[y_position],
-                        mode="markers",
-                        marker=dict(symbol="diamond", size=12, color=COLOR_PALETTE["jaune"]),
-                        name=milestone["Milestone"],
-                        showlegend=False
-                    ))
+        def build_mini_gantt():
+            # Create GANTT data for main phases only
+            main_phases = [
+                {"Task": "1. Conception et mise en route", "Start": "2025-02-24", "Finish": "2025-03-14", "Phase": "Phase 1"},
+                {"Task": "2. Définition et planification", "Start": "2025-03-17", "Finish": "2025-04-04", "Phase": "Phase 2"},
+                {"Task": "3. Mise en œuvre", "Start": "2025-04-07", "Finish": "2025-05-10", "Phase": "Phase 3"},
+                {"Task": "4. Performances/contrôle", "Start": "2025-05-12", "Finish": "2025-05-21", "Phase": "Phase 4"}
+            ]
+            
+            mini_gantt_df = pd.DataFrame(main_phases)
+            mini_gantt_df["Start"] = pd.to_datetime(mini_gantt_df["Start"])
+            mini_gantt_df["Finish"] = pd.to_datetime(mini_gantt_df["Finish"])
+            
+            # Créer le diagramme de Gantt
+            fig = px.timeline(
+                mini_gantt_df,
+                x_start="Start",
+                x_end="Finish",
+                y="Task",
+                color="Phase",
+                color_discrete_map={
+                    "Phase 1": COLOR_PALETTE["phase1"],
+                    "Phase 2": COLOR_PALETTE["phase2"],
+                    "Phase 3": COLOR_PALETTE["phase3"],
+                    "Phase 4": COLOR_PALETTE["phase4"]
+                }
+            )
+            
+            # Add vertical line for current period
+            fig.add_vline(x=view["date"], line_width=2, line_dash="dash", line_color="#444444")
+            
+            # Add vertical line for race day - May 9, 2025
+            race_day = "2025-05-09"
+            fig.add_vline(x=race_day, line_width=3, line_color=COLOR_PALETTE["rouge"])
+            
+            # Add annotation for race day
+            fig.add_annotation(
+                x=race_day,
+                y=4,
+                text="Jour J",
+                showarrow=True,
+                arrowhead=2,
+                arrowsize=1,
+                arrowwidth=2,
+                arrowcolor=COLOR_PALETTE["rouge"],
+                font=dict(color=COLOR_PALETTE["rouge"]),
+                xanchor="left"
+            )
+            
+            # Ajouter les jalons comme des points sur le diagramme
+            with profiling.span("milestones"):
+                for milestone in data.milestones.to_dict("records"):
+                    milestone_date = pd.to_datetime(milestone["Date"])
+                    for i, phase in enumerate(main_phases):
+                        phase_start = pd.to_datetime(phase["Start"])
+                        phase_end = pd.to_datetime(phase["Finish"])
                     
-                    # Ajouter une annotation pour le jalon
-                    fig.add_annotation(
-                        x=milestone_date,
-                        y=y_position - 0.3,
-                        text=milestone["Milestone"],
-                        showarrow=False,
-                        font=dict(size=8, color=COLOR_PALETTE["jaune_pale"]),
-                        bgcolor=COLOR_PALETTE["vert_fonce"],
-                        bordercolor=COLOR_PALETTE["jaune"],
-                        borderwidth=1,
-                        borderpad=2,
-                        opacity=0.8,
-                        yanchor="top"
-                    )
-        
-        fig.update_layout(
-            height=200,
-            margin=dict(l=10, r=10, t=10, b=10),
-            showlegend=False,
-            xaxis=dict(
-                tickformat="%d %b",
-                tickangle=45,
+                        # Afficher le jalon sur sa phase correspondante
+                        if milestone["Phase"] == phase["Phase"] and phase_start <= milestone_date <= phase_end:
+                            y_position = i
+                        
+                            # Ajouter un marqueur pour le jalon
+                            fig.add_trace(go.Scatter(
+                                x=[milestone_date],
+                                y=[y_position],
+                                mode="markers",
+                                marker=dict(symbol="diamond", size=12, color=COLOR_PALETTE["jaune"]),
+                                name=milestone["Milestone"],
+                                showlegend=False
+                            ))
+                        
+                            # Ajouter une annotation pour le jalon
+                            fig.add_annotation(
+                                x=milestone_date,
+                                y=y_position - 0.3,
+                                text=milestone["Milestone"],
+                                showarrow=False,
+                                font=dict(size=8, color=COLOR_PALETTE["jaune_pale"]),
+                                bgcolor=COLOR_PALETTE["vert_fonce"],
+                                bordercolor=COLOR_PALETTE["jaune"],
+                                borderwidth=1,
+                                borderpad=2,
+                                opacity=0.8,
+                                yanchor="top"
+                            )
+            
+            fig.update_layout(
+                height=200,
+                margin=dict(l=10, r=10, t=10, b=10),
+                showlegend=False,
+                xaxis=dict(
+                    tickformat="%d %b",
+                    tickangle=45,
+                )
             )
-        )
+            return fig
         
-        st.plotly_chart(fig, use_container_width=True)
+        fig = cached_figure("mini_gantt", build_mini_gantt, data.tables_version("period_dates", "milestones"), period=selected_period)
+        
+        plotly_chart(fig, "mini_gantt")
     
     with col2:
         # Objectives - compact chart - RENAMED
         st.subheader("Objectifs SMART")
         st.caption("Suivi des objectifs SMART du projet")
-        objectives_df = pd.DataFrame({
-            'Objectif': list(current_objectives.keys()),
-            'Pourcentage': [obj['pourcentage'] for obj in current_objectives.values()]
-        })
-        
-        # Add reference lines to show targets vs actuals
-        fig = px.bar(
-            objectives_df, 
-            y='Objectif', 
-            x='Pourcentage',
-            orientation='h',
-            text='Pourcentage',
-            color_discrete_sequence=[COLOR_PALETTE["vert"]]
-        )
+        def build_objectives():
+            objectives_df = pd.DataFrame({
+                'Objectif': list(view["objectives"].keys()),
+                'Pourcentage': list(view["objectives"].values())
+            })
+            
+            # Add reference lines to show targets vs actuals
+            fig = px.bar(
+                objectives_df, 
+                y='Objectif', 
+                x='Pourcentage',
+                orientation='h',
+                text='Pourcentage',
+                color_discrete_sequence=[COLOR_PALETTE["vert"]]
+            )
+            
+            # Add visual cues for targets
+            for i, objective in enumerate(objectives_df['Objectif']):
+                if objective == "Participants":
+                    # Add a dashed line at 100% to show target
+                    fig.add_shape(
+                        type="line",
+                        x0=100, y0=i-0.4, x1=100, y1=i+0.4,
+                        line=dict(color=COLOR_PALETTE["rouge"], width=2, dash="dash"),
+                        layer="above"
+                    )
+                    # Add a marker at max capacity
+                    fig.add_shape(
+                        type="line",
+                        x0=142.86, y0=i-0.4, x1=142.86, y1=i+0.4,
+                        line=dict(color=COLOR_PALETTE["vert_fonce"], width=2),
+                        layer="above"
+                    )
+            
+            fig.update_layout(
+                height=200, 
+                margin=dict(l=5, r=5, t=5, b=5),
+                xaxis=dict(range=[0, 150])  # Ensure max of 150% to show the 1000 participant max
+            )
+            fig.update_traces(texttemplate='%{text}%', textposition='outside')
+            return fig
         
-        # Add visual cues for targets
-        for i, objective in enumerate(objectives_df['Objectif']):
-            if objective == "Participants":
-                # Add a dashed line at 100% to show target
-                fig.add_shape(
-                    type="line",
-                    x0=100, y0=i-0.4, x1=100, y1=i+0.4,
-                    line=dict(color=COLOR_PALETTE["rouge"], width=2, dash="dash"),
-                    layer="above"
-                )
-                # Add a marker at max capacity
-                fig.add_shape(
-                    type="line",
-                    x0=142.86, y0=i-0.4, x1=142.86, y1=i+0.4,
-                    line=dict(color=COLOR_PALETTE["vert_fonce"], width=2),
-                    layer="above"
-                )
+        fig = cached_figure("objectives", build_objectives, data.tables_version("objectives"), period=selected_period)
         
-        fig.update_layout(
-            height=200, 
-            margin=dict(l=5, r=5, t=5, b=5),
-            xaxis=dict(range=[0, 150])  # Ensure max of 150% to show the 1000 participant max
-        )
-        fig.update_traces(texttemplate='%{text}%', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, "objectives")
     
     # Main dashboard in two columns - Bottom row
     # Main dashboard in two columns - Bottom row
@@ -601,67 +345,9 @@ with tabs[0]:
         # Risk overview - compact chart with specific risks
         st.subheader("Aperçu des risques")
         st.caption("Évaluation et suivi des risques du projet")
-        risk_counts = {"Mineur": 0, "Modéré": 0, "Majeur": 0}
-        
-        # Evaluate specific risk conditions based on current period
-        risk_warnings = []
-        
-        # R01: État critique si tous les bénévoles n'ont pas répondu aux relances
-        benevoles_objectif = current_objectives['Bénévoles']['cible']
-        benevoles_actuels = current_objectives['Bénévoles']['actuel']
-        benevoles_ratio = benevoles_actuels / benevoles_objectif if benevoles_objectif > 0 else 0
-        
-        if benevoles_ratio < 0.75:  # Moins de 75% des bénévoles ont répondu
-            risk_warnings.append({
-                "Risque": "R01_Désistement des bénévoles",
-                "Statut": "Critique",
-                "Description": f"Seulement {benevoles_actuels}/{benevoles_objectif} bénévoles confirmés"
-            })
-        
-        # R02: État critique si les mesures de prévention ne sont pas en place
-        prevention_complete = selected_period_index >= 9  
-        if not prevention_complete:
-            risk_warnings.append({
-                "Risque": "R02_Risques sanitaires", 
-                "Statut": "Critique",
-                "Description": "Mesures de prévention incomplètes" 
-            })
-        
-        # R03: État critique si le nombre de participants est inférieur à l'objectif
-        participants_objectif = current_objectives['Participants']['cible']
-        participants_actuels = current_objectives['Participants']['actuel']
-        participants_ratio = participants_actuels / participants_objectif if participants_objectif > 0 else 0
-        
-        if participants_ratio < 0.7:  
-            risk_warnings.append({
-                "Risque": "R03_Nombre de participants", 
-                "Statut": "Critique",
-                "Description": f"Seulement {participants_actuels}/{participants_objectif} participants inscrits" 
-            })
-        
-        # R04: État critique si météo non validée en S9-S11
-        meteo_validee = selected_period_index < 8 or selected_period_index > 10 
-        if not meteo_validee:
-            risk_warnings.append({
-                "Risque": "R04_Conditions extremes", 
-                "Statut": "Critique",
-                "Description": "Prévisions météo non validées" 
-            })
-        
-        # Count risk levels for the pie chart
-        for risk_data in current_risks.values():
-            risk_counts[risk_data["niveau"]] += 1
-        
-        # Create a more compact horizontal bar chart instead of a pie chart
-        risk_df = pd.DataFrame({
-            "Niveau": list(risk_counts.keys()),
-            "Nombre": list(risk_counts.values())
-        })
-        
-        
         # Display critical risks as alerts (pas besoin de colonnes imbriquées)
-        if risk_warnings:
-            for risk in risk_warnings:
+        if view["risk_warnings"]:
+            for risk in view["risk_warnings"]:
                 st.warning(f"⚠️ {risk['Risque']}: {risk['Description']}")
         else:
             st.success("✅ Aucun risque critique identifié")
@@ -669,80 +355,72 @@ with tabs[0]:
     with bottom_col2:
     # Budget overview - compact chart
         st.subheader("Aperçu du budget")
-        current_budget = data["budget_data"][selected_period]
+        budget_totals = view["budget_totals"]
+        total_budget = budget_totals["valide"]
+        total_depense = budget_totals["depense"]
         
-        # Calculer les totaux
-        total_budget = sum(item[1] for item in current_budget.values())  # Dernier budget validé
-        total_depense = sum(item[3] for item in current_budget.values())  # Consommé
-        
-        # Créer un dataframe pour afficher la comparaison budget vs dépenses
-        budget_vs_depense = pd.DataFrame({
-            "Type": ["Budget validé", "Dépenses"],
-            "Montant": [total_budget, total_depense]
-        })
-        
-        # Créer le graphique en barres
-        fig1 = go.Figure()
-        fig1.add_trace(go.Bar(
-            x=["Budget"],
-            y=[total_budget],
-            name="Budget validé",
-            marker_color=COLOR_PALETTE["vert_fonce"]
-        ))
-        fig1.add_trace(go.Bar(
-            x=["Budget"],
-            y=[total_depense],
-            name="Dépensé",
-            marker_color=COLOR_PALETTE["orange"]
-        ))
-        
-        fig1.update_layout(
-            height=200,
-            margin=dict(l=5, r=5, t=5, b=5),
-            barmode="group"
-        )
-        
-        # Créer un dataframe pour les catégories de dépenses
-        categories_data = []
-        for category, values in current_budget.items():
-            categories_data.append({
-                "Catégorie": category,
-                "Dépensé": values[3],
-                "Pourcentage": (values[3] / total_depense) * 100 if total_depense > 0 else 0
-            })
+        def build_budget_overview():
+            # Créer le graphique en barres
+            fig1 = go.Figure()
+            fig1.add_trace(go.Bar(
+                x=["Budget"],
+                y=[total_budget],
+                name="Budget validé",
+                marker_color=COLOR_PALETTE["vert_fonce"]
+            ))
+            fig1.add_trace(go.Bar(
+                x=["Budget"],
+                y=[total_depense],
+                name="Dépensé",
+                marker_color=COLOR_PALETTE["orange"]
+            ))
+            
+            fig1.update_layout(
+                height=200,
+                margin=dict(l=5, r=5, t=5, b=5),
+                barmode="group"
+            )
+            return fig1
         
-        categories_df = pd.DataFrame(categories_data)
-        categories_df = categories_df.sort_values(by="Pourcentage", ascending=False)
+        fig1 = cached_figure("budget_overview", build_budget_overview, data.tables_version("budget"), period=selected_period)
         
         # Afficher les deux graphiques côte à côte
         budget_cols = st.columns([1, 1])
         
         with budget_cols[0]:
             st.caption("Budget validé vs Dépenses")
-            st.plotly_chart(fig1, use_container_width=True)
+            plotly_chart(fig1, "budget_overview")
             # Afficher le pourcentage d'utilisation du budget
-            pourcentage = (total_depense / total_budget) * 100 if total_budget else 0
+            pourcentage = budget_totals["pourcentage"]
             st.caption(f"Utilisation du budget: {pourcentage:.1f}%")
-            st.progress(pourcentage/100)
+            st.progress(min(pourcentage/100, 1.0))  # barre pleine en cas de dépassement
         
         with budget_cols[1]:
             # Créer un donut chart pour les catégories de dépenses
             st.caption("Répartition des dépenses par catégorie")
-            fig2 = px.pie(
-                categories_df, 
-                values="Pourcentage", 
-                names="Catégorie",
-                hole=0.4,
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            fig2.update_layout(
-                height=200,
-                margin=dict(l=5, r=5, t=5, b=5),
-                showlegend=True
-            )
+            def build_budget_overview_pie():
+                # Créer un dataframe pour les catégories de dépenses
+                categories_df = pd.DataFrame(view["budget_categories"])
+                categories_df = categories_df.sort_values(by="% des dépenses", ascending=False)
+                
+                fig2 = px.pie(
+                    categories_df, 
+                    values="% des dépenses", 
+                    names="Catégorie",
+                    hole=0.4,
+                    color_discrete_sequence=px.colors.qualitative.Pastel
+                )
+                fig2.update_layout(
+                    height=200,
+                    margin=dict(l=5, r=5, t=5, b=5),
+                    showlegend=True
+                )
+                return fig2
+            
+            fig2 = cached_figure("budget_overview_pie", build_budget_overview_pie, data.tables_version("budget"), period=selected_period)
             
             # Afficher le graphique
-            st.plotly_chart(fig2, use_container_width=True)
+            plotly_chart(fig2, "budget_overview_pie")
             
             # Afficher un indicateur pour montrer si on est au-dessus ou en-dessous du budget
             if pourcentage > 100:
@@ -751,7 +429,8 @@ with tabs[0]:
                 st.success(f"✅ Reste: {100 - pourcentage:.1f}%")
 
 # Tab 2: Planning with detailed GANTT chart
-with tabs[1]:
+def render_planning_tab():
+    """Render the planning tab"""
     # Remplacer la section GANTT dans l'onglet Planning (Tab 2)
     # Planning du Projet
     st.header("Planning du Projet")
@@ -759,211 +438,467 @@ with tabs[1]:
     # GANTT chart with full task structure from CSV
     st.subheader("Calendrier complet")
     st.caption("Détails des tâches et jalons clés")
-    
-    # Afficher les filtres pour les phases
-    phases = ["Phase 1", "Phase 2", "Phase 3", "Phase 4"]
-    selected_phases = st.multiselect("Filtrer par phase", phases, default=phases)
-    
-    # Option pour afficher tous les détails ou seulement les tâches principales
-    show_details = st.checkbox("Afficher les sous-tâches", value=True)
-    
-    # Filtrer le DataFrame selon les options choisies
-    gantt_df = pd.DataFrame(data["gantt_data"])
+
+
+@profiling.counted_cache("gantt_tasks", st.cache_resource(show_spinner=False, max_entries=64))
+def gantt_tasks(tables_version, phases, show_details, slip, _gantt):
+    """Return the Gantt tasks filtered by phase and detail level, dates parsed
+
+    Une entrée par version de la table gantt, par filtres et par glissement
+    simulé (tâche, jours) ; le DataFrame est partagé entre les sessions, ne pas
+    le modifier.
+    """
+    gantt_df = _gantt
     
     # Filtrer par phase
-    if selected_phases:
-        gantt_df = gantt_df[gantt_df["Resource"].isin(selected_phases)]
+    if phases:
+        gantt_df = gantt_df[gantt_df["Resource"].isin(phases)]
     
     # Filtrer par niveau de détail
     if not show_details:
         gantt_df = gantt_df[gantt_df["Level"] == "Main"]
     
     # Convert date strings to datetime objects
-    gantt_df["Start"] = pd.to_datetime(gantt_df["Start"])
-    gantt_df["Finish"] = pd.to_datetime(gantt_df["Finish"])
-    
-    # Create Gantt chart
-    fig = px.timeline(
-        gantt_df,
-        x_start="Start",
-        x_end="Finish",
-        y="Task",
-        color="Resource",
-        color_discrete_map={
-            "Phase 1": "#3498db",
-            "Phase 2": "#2ecc71",
-            "Phase 3": "#f39c12",
-            "Phase 4": "#9b59b6"
-        }
-    )
-    
-    # Highlight current period
-    current_date = data['period_dates'][selected_period]
-    fig.add_vline(x=current_date, line_width=2, line_dash="dash", line_color="#444444")
-    
-    # Add vertical line for race day - May 9, 2025
-    race_day = "2025-05-09"
-    fig.add_vline(x=race_day, line_width=3, line_color=COLOR_PALETTE["rouge"])
-    
-    # Add annotation for race day
-    fig.add_annotation(
-        x=race_day,
-        y=0,
-        text="Jour de la course",
-        showarrow=True,
-        arrowhead=2,
-        arrowsize=1,
-        arrowwidth=2,
-        arrowcolor=COLOR_PALETTE["rouge"],
-        font=dict(color=COLOR_PALETTE["rouge"]),
-        xanchor="right"
-    )
-    
+    return gantt_df.assign(Start=pd.to_datetime(gantt_df["Start"]), Finish=pd.to_datetime(gantt_df["Finish"]))
+
+
+@st.fragment
+def render_gantt_section():
+    """Render the Gantt filters and chart, a filter change only reruns this fragment"""
+    with profiling.profiled_fragment("Jamais_Seul", "gantt", profile_placeholder, PROFILE_COUNTERS) as profile_context:
+        render_gantt_chart()
+        profile_context.update(period=selected_period, tab=TAB_TITLES[1])
+
+
+def render_gantt_chart():
+    """Render the Gantt filters and chart"""
+    # Afficher les filtres pour les phases
+    phases = ["Phase 1", "Phase 2", "Phase 3", "Phase 4"]
+    selected_phases = st.multiselect("Filtrer par phase", phases, default=phases)
     
-    # Ajouter les jalons comme des marqueurs
-    milestone_traces = []
-    for milestone in data["milestones"]:
-        milestone_date = pd.to_datetime(milestone["Date"])
+    # Option pour afficher tous les détails ou seulement les tâches principales
+    show_details = st.checkbox("Afficher les sous-tâches", value=True)
+
+    # Glissement d'une tâche : les tâches suivantes sont replanifiées d'après leurs
+    # prédécesseurs (utils/critical_path.py), sans retoucher les dates à la main
+    with profiling.span("critical_path"):
+        schedule = critical_path(data)
+    slip = None
+    if schedule is not None:
+        task_names = list(schedule.tasks["Task"])
+        default_task = next((i for i, task in enumerate(task_names) if task.startswith("3.7 ")), 0)
+        col1, col2 = st.columns([3, 1])
+        slipped_task = col1.selectbox("Simuler le glissement d'une tâche", task_names, index=default_task,
+                                      key="gantt-slip-task")
+        slip_days = col2.number_input("Jours de retard", min_value=0, max_value=60, value=0, key="gantt-slip-days")
+        if slip_days:
+            position = schedule.position(slipped_task)
+            with profiling.span("reschedule"):
+                schedule = schedule.reschedule(position, duration=schedule.duration[position] + slip_days)
+            slip = (slipped_task, slip_days)
+    
+    def build_gantt():
+        # Filtrer le DataFrame selon les options choisies ; sans chemin critique (cycle), les dates prévues
+        scheduled = schedule.gantt(data.gantt) if schedule is not None else data.gantt.assign(Slack=None, Critical=False)
+        with profiling.span("gantt_tasks"):
+            gantt_df = gantt_tasks(data.tables_version(*CPM_TABLES), tuple(selected_phases), show_details, slip,
+                                   scheduled)
         
-        # Ajouter un marqueur pour chaque jalon
-        milestone_traces.append(
-            go.Scatter(
-                x=[milestone_date],
-                y=[milestone["Milestone"]],
-                mode="markers+text",
-                marker=dict(
-                    symbol="diamond",
-                    size=16,
-                    color=COLOR_PALETTE["jaune"],
-                    line=dict(color=COLOR_PALETTE["vert_fonce"], width=2)
-                ),
-                text=milestone["Milestone"],
-                textposition="middle right",
-                textfont=dict(color=COLOR_PALETTE["jaune_pale"]),
-                name=milestone["Milestone"],
-                hoverinfo="text",
-                hovertext=f"{milestone['Milestone']} - {milestone['Date']}",
-            )
+        # Create Gantt chart
+        fig = px.timeline(
+            gantt_df,
+            x_start="Start",
+            x_end="Finish",
+            y="Task",
+            color="Resource",
+            color_discrete_map={
+                "Phase 1": "#3498db",
+                "Phase 2": "#2ecc71",
+                "Phase 3": "#f39c12",
+                "Phase 4": "#9b59b6"
+            },
+            hover_data={"Slack": True},
+            labels={"Slack": "Marge (jours)"}
         )
 
-    # Ajouter les traces de jalons au graphique
-    for trace in milestone_traces:
-        fig.add_trace(trace)
+        # Chemin critique : contour rouge des tâches sans marge
+        def outline_critical(trace):
+            critical = gantt_df.loc[gantt_df["Resource"] == trace.name, "Critical"].to_numpy()
+            trace.marker.line.color = [COLOR_PALETTE["danger"] if c else "rgba(0,0,0,0)" for c in critical]
+            trace.marker.line.width = [3 if c else 0 for c in critical]
+        fig.for_each_trace(outline_critical)
+        
+        # Highlight current period
+        current_date = data.period_dates[selected_period]
+        fig.add_vline(x=current_date, line_width=2, line_dash="dash", line_color="#444444")
+        
+        # Add vertical line for race day - May 9, 2025
+        race_day = "2025-05-09"
+        fig.add_vline(x=race_day, line_width=3, line_color=COLOR_PALETTE["rouge"])
+        
+        # Add annotation for race day
+        fig.add_annotation(
+            x=race_day,
+            y=0,
+            text="Jour de la course",
+            showarrow=True,
+            arrowhead=2,
+            arrowsize=1,
+            arrowwidth=2,
+            arrowcolor=COLOR_PALETTE["rouge"],
+            font=dict(color=COLOR_PALETTE["rouge"]),
+            xanchor="right"
+        )
+        
+        
+        # Ajouter les jalons comme des marqueurs
+        with profiling.span("milestones"):
+            milestone_traces = []
+            for milestone in data.milestones.to_dict("records"):
+                milestone_date = pd.to_datetime(milestone["Date"])
+            
+                # Ajouter un marqueur pour chaque jalon
+                milestone_traces.append(
+                    go.Scatter(
+                        x=[milestone_date],
+                        y=[milestone["Milestone"]],
+                        mode="markers+text",
+                        marker=dict(
+                            symbol="diamond",
+                            size=16,
+                            color=COLOR_PALETTE["jaune"],
+                            line=dict(color=COLOR_PALETTE["vert_fonce"], width=2)
+                        ),
+                        text=milestone["Milestone"],
+                        textposition="middle right",
+                        textfont=dict(color=COLOR_PALETTE["jaune_pale"]),
+                        name=milestone["Milestone"],
+                        hoverinfo="text",
+                        hovertext=f"{milestone['Milestone']} - {milestone['Date']}",
+                    )
+                )
+
+            # Ajouter les traces de jalons au graphique
+            for trace in milestone_traces:
+                fig.add_trace(trace)
 
-    fig.update_layout(
-        height=600 if show_details else 300,
-        xaxis_title="",
-        yaxis_title="",
-        margin=dict(l=10, r=10, t=10, b=10)
-    )
+        fig.update_layout(
+            height=600 if show_details else 300,
+            xaxis_title="",
+            yaxis_title="",
+            margin=dict(l=10, r=10, t=10, b=10)
+        )
+        return fig
     
-    st.plotly_chart(fig, use_container_width=True)
+    figure_id = f"gantt:{slip[0]}:{slip[1]}" if slip else "gantt"
+    fig = cached_figure(figure_id, build_gantt, data.tables_version("period_dates", "gantt", "milestones"), period=selected_period, phases=selected_phases, show_details=show_details)
+    
+    plotly_chart(fig, "gantt")
+
+    if schedule is None:
+        return
+    critical = schedule.critical
+    st.caption(
+        f"Chemin critique (contour rouge) : {critical.sum()} tâches sans marge sur {len(critical)}, "
+        f"dépendances {'déclarées' if schedule.declared else 'déduites des dates'}"
+    )
+    if slip:
+        finish = pd.Timestamp(schedule.origin) + pd.Timedelta(days=schedule.project_finish)
+        shift = schedule.project_finish - critical_path(data).project_finish
+        st.caption(f"{len(schedule.moved)} tâche(s) replanifiée(s), fin du projet le {finish:%d/%m/%Y} ({shift:+.0f} j)")
+        late = schedule.slack < 0
+        if late.any():
+            st.warning(f"⚠️ {late.sum()} tâche(s) dépassent leur échéance (jour de l'événement), "
+                       f"jusqu'à {-schedule.slack.min():.0f} jour(s) de retard")
+
+
+# Planning tab, period-dependent part: the Gantt fragment and the phase progress
+def render_planning_schedule():
+    """Render the Gantt section and the progress of each phase"""
+    render_gantt_section()
     
     # Task progress
     st.subheader("Avancement des phases")
+    st.caption("Part de la durée des sous-tâches écoulée à la fin de la période, agrégée de l'arbre WBS")
     
-    # Create realistic task progress data
-    phases = ["Phase 1", "Phase 2", "Phase 3", "Phase 4"]
-    progress_data = {
-        "Phase 1": 100 if selected_period_index >= 3 else min(100, (selected_period_index + 1) * 33.33),
-        "Phase 2": 0 if selected_period_index < 3 else (
-                   100 if selected_period_index >= 6 else min(100, (selected_period_index - 2) * 33.33)),
-        "Phase 3": 0 if selected_period_index < 6 else (
-                   100 if selected_period_index >= 11 else min(100, (selected_period_index - 5) * 20)),
-        "Phase 4": 0 if selected_period_index < 11 else min(100, (selected_period_index - 10) * 33.33)
-    }
+    with profiling.span("wbs_progress"):
+        progress_data = phase_progress(data, selected_period)
     
     for phase, progress in progress_data.items():
         col1, col2 = st.columns([4, 1])
         with col1:
-            st.progress(progress/100)
+            st.progress(progress/100, text=phase)
         with col2:
             st.write(f"{progress:.0f}%")
 
+    render_schedule_risk_section()
+
+@st.fragment
+def render_schedule_risk_section():
+    """Render the schedule risk analysis, a parameter change only reruns this fragment"""
+    with profiling.profiled_fragment("Jamais_Seul", "schedule_risk", profile_placeholder,
+                                     PROFILE_COUNTERS) as profile_context:
+        render_schedule_risk()
+        profile_context.update(period=selected_period, tab=TAB_TITLES[1])
+
+def render_schedule_risk():
+    """Render the Monte Carlo schedule simulation: chance of each phase finishing before the event"""
+    st.subheader("Risque de retard")
+    st.caption("Tirages PERT des durées des tâches, retards propagés aux tâches suivantes : "
+               "chances de finir chaque phase avant le jour de l'événement")
+
+    col1, col2 = st.columns(2)
+    draws = col1.select_slider("Tirages", options=DRAW_OPTIONS, value=DRAW_OPTIONS[0],
+                               format_func=lambda n: f"{n:,}".replace(",", " "), key="schedule-risk-draws")
+    uncertainty = col2.slider("Incertitude sur les durées", 5, 60, 25, step=5, format="%d%%",
+                              help="Durée pessimiste : durée prévue + 2 x ce pourcentage",
+                              key="schedule-risk-uncertainty") / 100
+
+    with profiling.span("schedule_risk"):
+        simulation = schedule_risk(data, draws, uncertainty)
+    if simulation is None:
+        return
+    targets = simulation["targets"]
+
+    columns = st.columns(len(targets))
+    for col, (target, row) in zip(columns, targets.iterrows()):
+        col.metric(
+            target.split(" (")[0], f"{row['probability']:.0%}",
+            help=f"Fin prévue le {row['planned']:%d/%m}, médiane le {row['p50']:%d/%m}, P90 le {row['p90']:%d/%m}"
+                 + ("" if row["before_event"] else " (planifiée après l'événement : échéance = fin prévue)")
+        )
+
+    def build_schedule_risk():
+        dates = simulation["bin_dates"]
+        colors = [COLOR_PALETTE["phase1"], COLOR_PALETTE["phase2"], COLOR_PALETTE["phase3"],
+                  COLOR_PALETTE["phase4"], COLOR_PALETTE["jaune"]]
+        fig = go.Figure()
+        for i, (target, counts) in enumerate(simulation["histograms"].items()):
+            fig.add_trace(go.Bar(
+                x=dates[:-1], y=counts / simulation["draws"] * 100, offset=0, width=86_400_000,
+                name=target.split(" (")[0], opacity=0.6, marker_color=colors[i % len(colors)]
+            ))
+        fig.add_vline(x=simulation["event_date"], line_width=3, line_color=COLOR_PALETTE["rouge"])
+        fig.add_annotation(x=simulation["event_date"], y=1, yref="paper", text="Jour de l'événement",
+                           showarrow=False, xanchor="right", font=dict(color=COLOR_PALETTE["rouge"]))
+        fig.update_layout(
+            height=350,
+            barmode="overlay",
+            bargap=0,
+            margin=dict(l=10, r=10, t=30, b=10),
+            xaxis_title="Date de fin",
+            yaxis_title="% des tirages",
+            legend=dict(orientation="h", yanchor="bottom", y=-0.4)
+        )
+        return fig
+
+    fig = cached_figure(f"schedule_risk:{draws}:{uncertainty}", build_schedule_risk,
+                        data.tables_version(*SCHEDULE_TABLES))
+    plotly_chart(fig, "schedule_risk")
+    st.caption(
+        f"{simulation['draws']:,} tirages de {simulation['tasks']} tâches et {simulation['dependencies']} dépendances "
+        f"({'déclarées' if simulation['declared_dependencies'] else 'déduites des dates'}) "
+        f"en {simulation['elapsed_ms']:.0f} ms".replace(",", " ")
+    )
+
+# Catégories en alerte détaillées dans la section valeur acquise
+MAX_EVM_ALERTS = 5
+
+def render_earned_value():
+    """Render the earned value section of the budget tab: indices, forecasts and early overrun alerts"""
+    st.subheader("Valeur acquise")
+    st.caption("Performance des coûts (CPI) et des délais (SPI) : le travail réalisé rapporté à la dépense et au planning")
+
+    with profiling.span("earned_value"):
+        evm = earned_value(data)
+    total = {measure: evm[measure].at[selected_period, TOTAL] for measure in ("bac", "cpi", "spi", "eac", "vac")}
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("CPI", f"{total['cpi']:.2f}", help="Valeur acquise / coût réel (< 1 : surcoût)")
+    col2.metric("SPI", f"{total['spi']:.2f}", help="Valeur acquise / valeur planifiée (< 1 : retard)")
+    col3.metric("Estimation à terminaison", f"{total['eac']:,.0f} €",
+                delta=f"{total['eac'] - total['bac']:+,.0f} €", delta_color="inverse")
+    col4.metric("Écart à terminaison", f"{total['vac']:,.0f} €")
+
+    # Alertes : catégories dont le CPI est sous le seuil à la période choisie, les plus en surcoût d'abord
+    cpi_now = evm["cpi"].loc[selected_period].drop(TOTAL)
+    alerts = cpi_now[cpi_now < CPI_ALERT].sort_values()
+    for category, cpi in alerts.head(MAX_EVM_ALERTS).items():
+        st.warning(
+            f"⚠️ {category} : CPI {cpi:.2f}, dépense prévue à terminaison "
+            f"{evm['eac'].at[selected_period, category]:,.0f} € pour "
+            f"{evm['bac'].at[selected_period, category]:,.0f} € validés "
+            f"(alerte depuis {evm['first_alerts'][category]})"
+        )
+    if len(alerts) > MAX_EVM_ALERTS:
+        st.caption(f"… et {len(alerts) - MAX_EVM_ALERTS} autres catégories sous le seuil (voir le tableau)")
+
+    def build_earned_value_indices():
+        # Total et catégories en alerte : une courbe par catégorie serait illisible sur un gros budget
+        shown = [TOTAL, *alerts.head(MAX_EVM_ALERTS).index]
+        cpi = evm["cpi"].iloc[:selected_period_index + 1][shown]
+        fig = go.Figure()
+        for category in cpi.columns:
+            fig.add_trace(go.Scatter(
+                x=cpi.index, y=cpi[category], name=f"CPI {category}", mode="lines+markers",
+                line=dict(width=3 if category == TOTAL else 1.5)
+            ))
+        fig.add_trace(go.Scatter(
+            x=cpi.index, y=evm["spi"][TOTAL].iloc[:selected_period_index + 1], name="SPI Total",
+            mode="lines+markers", line=dict(width=3, dash="dash", color=COLOR_PALETTE["violet"])
+        ))
+        fig.add_hline(y=1, line_dash="dot", line_color="gray")
+        fig.add_hline(y=CPI_ALERT, line_dash="dot", line_color=COLOR_PALETTE["danger"],
+                      annotation_text="Seuil d'alerte", annotation_position="bottom right")
+        fig.update_layout(
+            height=400,
+            margin=dict(l=10, r=10, t=30, b=10),
+            yaxis_title="Indice",
+            xaxis_title="Période",
+            legend=dict(orientation="h", yanchor="bottom", y=-0.4)
+        )
+        return fig
+
+    fig = cached_figure("earned_value_indices", build_earned_value_indices, data.tables_version(*EVM_TABLES),
+                        period=selected_period)
+    plotly_chart(fig, "earned_value_indices")
+
+    table = pd.DataFrame({
+        "Catégorie": evm["bac"].columns,
+        **{label: evm[measure].loc[selected_period].to_numpy() for measure, label in (
+            ("bac", "BAC"), ("pv", "PV"), ("ev", "EV"), ("ac", "AC"), ("cpi", "CPI"), ("spi", "SPI"),
+            ("eac", "EAC"), ("vac", "VAC"))}
+    })
+    money = {label: st.column_config.NumberColumn(f"{label} (€)", format="%.0f €")
+             for label in ("BAC", "PV", "EV", "AC", "EAC", "VAC")}
+    st.dataframe(
+        table,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            **money,
+            "CPI": st.column_config.NumberColumn("CPI", format="%.2f"),
+            "SPI": st.column_config.NumberColumn("SPI", format="%.2f"),
+        }
+    )
+
+@st.fragment
+def render_budget_simulation_section():
+    """Render the budget simulator, a parameter change only reruns this fragment"""
+    with profiling.profiled_fragment("Jamais_Seul", "budget_simulation", profile_placeholder,
+                                     PROFILE_COUNTERS) as profile_context:
+        render_budget_simulation()
+        profile_context.update(period=selected_period, tab=TAB_TITLES[2])
+
+def render_budget_simulation():
+    """Render the Monte Carlo simulation of the final cost: overrun risk and contingency needed"""
+    st.subheader("Simulation du coût final")
+    st.caption("Tirages du reste à dépenser de chaque catégorie : risque de dépassement et réserve pour imprévus nécessaire")
+
+    col1, col2, col3, col4 = st.columns(4)
+    draws = col1.select_slider("Tirages", options=DRAW_OPTIONS, value=DRAW_OPTIONS[0],
+                               format_func=lambda n: f"{n:,}".replace(",", " "), key="budget-sim-draws")
+    uncertainty = col2.slider("Incertitude sur le reste à dépenser", 5, 60, 20, step=5, format="%d%%",
+                              key="budget-sim-uncertainty") / 100
+    correlation = col3.slider("Corrélation entre catégories", 0, 100, 30, step=10, format="%d%%",
+                              key="budget-sim-correlation") / 100
+    confidence = col4.slider("Niveau de confiance", 50, 99, 90, format="%d%%", key="budget-sim-confidence") / 100
+
+    with profiling.span("budget_simulation"):
+        simulation = budget_simulation(data, selected_period, draws, uncertainty, correlation)
+        summary = summarize_simulation(simulation, confidence)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Risque de dépassement", f"{summary['overrun_probability']:.0%}",
+                help=f"Part des tirages au-dessus du budget validé ({simulation['validated_total']:,.0f} €)")
+    col2.metric("Dépassement médian (P50)", f"{summary['overrun_p50']:+,.0f} €")
+    col3.metric("Dépassement P90", f"{summary['overrun_p90']:+,.0f} €")
+    col4.metric(f"Réserve nécessaire ({confidence:.0%})", f"{summary['reserve_needed']:,.0f} €",
+                delta=f"{summary['reserve_needed'] - simulation['reserve']:+,.0f} € vs imprévus",
+                delta_color="inverse")
+
+    def build_budget_simulation():
+        counts, edges = simulation["histogram"]
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2, y=counts / simulation["draws"] * 100,
+            width=edges[1] - edges[0], marker_color=COLOR_PALETTE["vert"], name="Tirages"
+        ))
+        fig.add_vline(x=simulation["validated_total"], line_dash="dash", line_color=COLOR_PALETTE["danger"],
+                      annotation_text="Budget validé", annotation_position="top left")
+        fig.add_vline(x=summary["total_at_confidence"], line_dash="dot", line_color=COLOR_PALETTE["violet"],
+                      annotation_text=f"P{confidence * 100:.0f}", annotation_position="top right")
+        fig.update_layout(
+            height=350,
+            margin=dict(l=10, r=10, t=30, b=10),
+            xaxis_title="Coût final (€)",
+            yaxis_title="% des tirages",
+            showlegend=False,
+            bargap=0
+        )
+        return fig
+
+    figure_id = f"budget_simulation:{draws}:{uncertainty}:{correlation}:{confidence}"
+    fig = cached_figure(figure_id, build_budget_simulation, data.tables_version(*EVM_TABLES), period=selected_period)
+    plotly_chart(fig, "budget_simulation")
+    st.caption(
+        f"{simulation['draws']:,} tirages en {simulation['elapsed_ms']:.0f} ms · déjà dépensé "
+        f"{simulation['spent']:,.0f} € · imprévus budgétés {simulation['reserve']:,.0f} €".replace(",", " ")
+    )
+
 # Tab 3: Budget
-with tabs[2]:
+def render_budget_tab():
+    """Render the budget tab"""
     st.header("Suivi du Budget")
     st.caption("Analyse des dépenses par rapport au budget")
     
     # Budget KPIs
-    # Budget KPIs
-    current_budget = data["budget_data"][selected_period]
-    total_budget_initial = sum(item[0] for item in current_budget.values())
-    total_budget_valide = sum(item[1] for item in current_budget.values())
-    total_estime = sum(item[2] for item in current_budget.values())
-    total_depense = sum(item[3] for item in current_budget.values())
-    pourcentage_consomme = (total_depense / total_budget_valide) * 100 if total_budget_valide else 0
-    reste_budget = total_budget_valide - total_depense
+    budget_totals = view["budget_totals"]
     
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Budget initial", f"{total_budget_initial:,.0f} €")
-    col2.metric("Budget validé", f"{total_budget_valide:,.0f} €")
-    col3.metric("Reste à dépenser", f"{reste_budget:,.0f} €")
-    col4.metric("Consommation", f"{pourcentage_consomme:.1f}%")
+    col1.metric("Budget initial", f"{budget_totals['initial']:,.0f} €")
+    col2.metric("Budget validé", f"{budget_totals['valide']:,.0f} €")
+    col3.metric("Reste à dépenser", f"{budget_totals['reste']:,.0f} €")
+    col4.metric("Consommation", f"{budget_totals['pourcentage']:.1f}%")
     
     # Budget evolution
     st.subheader("Évolution du budget")
     st.caption("Analyse de l'évolution du budget au fil des périodes")
     
-    # Prepare data
-    budget_evolution = []
-    for period in periods[:selected_period_index+1]:
-        budget_period = data["budget_data"][period]
-        budget_initial = sum(item[0] for item in budget_period.values())
-        budget_valide = sum(item[1] for item in budget_period.values())
-        estime = sum(item[2] for item in budget_period.values())
-        depense = sum(item[3] for item in budget_period.values())
-        budget_evolution.append({
-            "Période": period,
-            "Budget initial": budget_initial,
-            "Budget validé": budget_valide,
-            "Dépensé": depense
-        })
-    
-    budget_df = pd.DataFrame(budget_evolution)
-    
-    fig = px.line(
-        budget_df,
-        x="Période",
-        y=["Budget initial", "Budget validé", "Dépensé"],
-        markers=True,
-        color_discrete_map={
-            "Budget initial": "#3498db",
-            "Budget validé": "#9b59b6",
-            "Dépensé": "#2ecc71"
-        }
-    )
+    def build_budget_evolution():
+        budget_df = pd.DataFrame(view["budget_evolution"])
+        
+        fig = px.line(
+            budget_df,
+            x="Période",
+            y=["Budget initial", "Budget validé", "Dépensé"],
+            markers=True,
+            color_discrete_map={
+                "Budget initial": "#3498db",
+                "Budget validé": "#9b59b6",
+                "Dépensé": "#2ecc71"
+            }
+        )
+        
+        fig.update_layout(
+            height=400,
+            margin=dict(l=10, r=10, t=30, b=10),
+            yaxis_title="Montant (€)",
+            xaxis_title="Période"
+        )
+        return fig
     
-    fig.update_layout(
-        height=400,
-        margin=dict(l=10, r=10, t=30, b=10),
-        yaxis_title="Montant (€)",
-        xaxis_title="Période"
-    )
+    fig = cached_figure("budget_evolution", build_budget_evolution, data.tables_version("budget"), period=selected_period)
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, "budget_evolution")
+
+    render_earned_value()
+    render_budget_simulation_section()
     
     # Budget breakdown
     st.subheader("Répartition des dépenses par catégorie")
     st.caption("Analyse des dépenses par catégorie")
     
-    budget_categories_detail = []
-    for category, values in current_budget.items():
-        budget_initial, budget_valide, estime, depense = values
-        ratio = depense / budget_valide * 100 if budget_valide else 0
-        statut = "Dépassement" if depense > budget_valide else "Dans le budget"
-        
-        budget_categories_detail.append({
-            "Catégorie": category,
-            "Budget initial": budget_initial,
-            "Budget validé": budget_valide,
-            "Estimé": estime,
-            "Dépensé": depense,
-            "% Consommé": ratio,
-            "Statut": statut
-        })
-    
-    budget_cat_df = pd.DataFrame(budget_categories_detail)
+    budget_cat_df = pd.DataFrame(view["budget_categories"]).drop(columns="% des dépenses")
     
     # Afficher le tableau détaillé
     st.dataframe(
@@ -982,236 +917,251 @@ with tabs[2]:
     col1, col2 = st.columns([3, 2])
     
     with col1:
-        # Graphique en anneau pour la répartition des dépenses
-        fig = px.pie(
-            budget_cat_df,
-            values="Dépensé",
-            names="Catégorie",
-            hole=0.4
-        )
-        fig.update_layout(
-            height=350,
-            margin=dict(l=10, r=10, t=30, b=10)
-        )
+        def build_budget_categories_pie():
+            # Graphique en anneau pour la répartition des dépenses
+            fig = px.pie(
+                budget_cat_df,
+                values="Dépensé",
+                names="Catégorie",
+                hole=0.4
+            )
+            fig.update_layout(
+                height=350,
+                margin=dict(l=10, r=10, t=30, b=10)
+            )
+            return fig
+        
+        fig = cached_figure("budget_categories_pie", build_budget_categories_pie, data.tables_version("budget"), period=selected_period)
+        
         st.subheader("Répartition des dépenses par catégorie")
         st.caption("Analyse des dépenses par catégorie")
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, "budget_categories_pie")
     
     with col2:
-        # Graphique en barres pour comparer budget vs dépenses
-        fig = px.bar(
-            budget_cat_df,
-            y="Catégorie",
-            x=["Budget validé", "Dépensé"],
-            orientation="h",
-            barmode="group",
-            color_discrete_map={
-                "Budget validé": "#3498db",
-                "Dépensé": "#2ecc71"
-            }
-        )
-        fig.update_layout(
-            height=350,
-            margin=dict(l=10, r=10, t=30, b=10),
-            xaxis_title="Montant (€)",
-            yaxis_title=""
-        )
+        def build_budget_categories_bar():
+            # Graphique en barres pour comparer budget vs dépenses
+            fig = px.bar(
+                budget_cat_df,
+                y="Catégorie",
+                x=["Budget validé", "Dépensé"],
+                orientation="h",
+                barmode="group",
+                color_discrete_map={
+                    "Budget validé": "#3498db",
+                    "Dépensé": "#2ecc71"
+                }
+            )
+            fig.update_layout(
+                height=350,
+                margin=dict(l=10, r=10, t=30, b=10),
+                xaxis_title="Montant (€)",
+                yaxis_title=""
+            )
+            return fig
+        
+        fig = cached_figure("budget_categories_bar", build_budget_categories_bar, data.tables_version("budget"), period=selected_period)
+        
         st.subheader("Comparaison Budget vs Dépenses")
         st.caption("Analyse de la consommation du budget")
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, "budget_categories_bar")
 
-# Dans l'onglet Risques (Tab 4), ajouter cette section pour afficher des détails supplémentaires
-with tabs[3]:
+# Tab 4: Risks
+def render_risks_tab():
+    """Render the risks tab"""
     st.header("Gestion des Risques")
     # Risk matrix
     st.subheader("Matrice des risques")
     
-    # Use fixed positions for risks regardless of other conditions
-    risks_for_matrix = [
-        {"Risque": "R01_Désistement des bénévoles", "Impact": 3, "Probabilité": 4, "Criticité": 3, "Niveau": "Majeur"},
-        {"Risque": "R02_Risques sanitaires", "Impact": 4, "Probabilité": 3, "Criticité": 3, "Niveau": "Majeur"},
-        {"Risque": "R03_Nombre de participants", "Impact": 4, "Probabilité": 4, "Criticité": 4, "Niveau": "Majeur"},
-        {"Risque": "R04_Conditions extremes", "Impact": 4, "Probabilité": 3, "Criticité": 3, "Niveau": "Majeur"}
-    ]
-    
-    risk_matrix_df = pd.DataFrame(risks_for_matrix)
-    
-    # Create scatter plot with 4x4 scale
-    fig = px.scatter(
-        risk_matrix_df,
-        x="Probabilité",
-        y="Impact",
-        color="Criticité",
-        text="Risque",
-        color_continuous_scale=[COLOR_PALETTE["vert"], COLOR_PALETTE["jaune"], COLOR_PALETTE["orange"], COLOR_PALETTE["rouge"]],
-        size_max=30,
-        size=[20, 20, 25, 20],  # Make R03 (criticité 4) slightly larger
-        range_color=[1, 4]
-    )
-    
-    # Add grid lines for 4x4 matrix
-    for i in range(1, 5):
-        # Vertical grid lines
+    def build_risk_matrix():
+        # Use fixed positions for risks regardless of other conditions
+        risks_for_matrix = [
+            {"Risque": "R01_Désistement des bénévoles", "Impact": 3, "Probabilité": 4, "Criticité": 3, "Niveau": "Majeur"},
+            {"Risque": "R02_Risques sanitaires", "Impact": 4, "Probabilité": 3, "Criticité": 3, "Niveau": "Majeur"},
+            {"Risque": "R03_Nombre de participants", "Impact": 4, "Probabilité": 4, "Criticité": 4, "Niveau": "Majeur"},
+            {"Risque": "R04_Conditions extremes", "Impact": 4, "Probabilité": 3, "Criticité": 3, "Niveau": "Majeur"}
+        ]
+        
+        risk_matrix_df = pd.DataFrame(risks_for_matrix)
+        
+        # Create scatter plot with 4x4 scale
+        fig = px.scatter(
+            risk_matrix_df,
+            x="Probabilité",
+            y="Impact",
+            color="Criticité",
+            text="Risque",
+            color_continuous_scale=[COLOR_PALETTE["vert"], COLOR_PALETTE["jaune"], COLOR_PALETTE["orange"], COLOR_PALETTE["rouge"]],
+            size_max=30,
+            size=[20, 20, 25, 20],  # Make R03 (criticité 4) slightly larger
+            range_color=[1, 4]
+        )
+        
+        # Add grid lines for 4x4 matrix
+        for i in range(1, 5):
+            # Vertical grid lines
+            fig.add_shape(
+                type="line",
+                x0=i, y0=0,
+                x1=i, y1=4.5,
+                line=dict(color="lightgrey", width=1),
+                layer="below"
+            )
+            # Horizontal grid lines
+            fig.add_shape(
+                type="line",
+                x0=0, y0=i,
+                x1=4.5, y1=i,
+                line=dict(color="lightgrey", width=1),
+                layer="below"
+            )
+        
+        # Add risk zones for 4x4 matrix
+        # Criticité 4 (rouge foncé) - top right corner
         fig.add_shape(
-            type="line",
-            x0=i, y0=0,
-            x1=i, y1=4.5,
-            line=dict(color="lightgrey", width=1),
+            type="rect",
+            x0=4, y0=4,
+            x1=4.5, y1=4.5,
+            fillcolor=f"rgba({int(COLOR_PALETTE['rouge'][1:3], 16)}, {int(COLOR_PALETTE['rouge'][3:5], 16)}, {int(COLOR_PALETTE['rouge'][5:7], 16)}, 0.3)",
+            line=dict(width=0),
             layer="below"
         )
-        # Horizontal grid lines
+        
+        # Criticité 3 (rouge) - high impact or probability
         fig.add_shape(
-            type="line",
-            x0=0, y0=i,
-            x1=4.5, y1=i,
-            line=dict(color="lightgrey", width=1),
+            type="rect",
+            x0=3, y0=4,
+            x1=4, y1=4.5,
+            fillcolor=f"rgba({int(COLOR_PALETTE['orange'][1:3], 16)}, {int(COLOR_PALETTE['orange'][3:5], 16)}, {int(COLOR_PALETTE['orange'][5:7], 16)}, 0.3)",
+            line=dict(width=0),
             layer="below"
         )
-    
-    # Add risk zones for 4x4 matrix
-    # Criticité 4 (rouge foncé) - top right corner
-    fig.add_shape(
-        type="rect",
-        x0=4, y0=4,
-        x1=4.5, y1=4.5,
-        fillcolor=f"rgba({int(COLOR_PALETTE['rouge'][1:3], 16)}, {int(COLOR_PALETTE['rouge'][3:5], 16)}, {int(COLOR_PALETTE['rouge'][5:7], 16)}, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    
-    # Criticité 3 (rouge) - high impact or probability
-    fig.add_shape(
-        type="rect",
-        x0=3, y0=4,
-        x1=4, y1=4.5,
-        fillcolor=f"rgba({int(COLOR_PALETTE['orange'][1:3], 16)}, {int(COLOR_PALETTE['orange'][3:5], 16)}, {int(COLOR_PALETTE['orange'][5:7], 16)}, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=4, y0=3,
-        x1=4.5, y1=4,
-        fillcolor="rgba(231, 76, 60, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=3, y0=3,
-        x1=4, y1=4,
-        fillcolor="rgba(231, 76, 60, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    
-    # Criticité 2 (jaune) - medium impact and probability
-    fig.add_shape(
-        type="rect",
-        x0=2, y0=3,
-        x1=3, y1=4.5,
-        fillcolor="rgba(243, 156, 18, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=3, y0=2,
-        x1=4.5, y1=3,
-        fillcolor="rgba(243, 156, 18, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=2, y0=2,
-        x1=3, y1=3,
-        fillcolor="rgba(243, 156, 18, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    
-    # Criticité 1 (vert) - low risk
-    fig.add_shape(
-        type="rect",
-        x0=0, y0=0,
-        x1=2, y1=2,
-        fillcolor="rgba(46, 204, 113, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=0, y0=2,
-        x1=2, y1=4.5,
-        fillcolor="rgba(46, 204, 113, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=2, y0=0,
-        x1=4.5, y1=2,
-        fillcolor="rgba(46, 204, 113, 0.3)",
-        line=dict(width=0),
-        layer="below"
-    )
-    
-    # Add labels for criticality zones
-    fig.add_annotation(
-        x=4.25, y=4.25,
-        text="Criticité 4",
-        showarrow=False,
-        font=dict(color="#7f0000", size=12)
-    )
-    fig.add_annotation(
-        x=3.5, y=3.5,
-        text="Criticité 3",
-        showarrow=False, 
-        font=dict(color="#c0392b", size=12)
-    )
-    fig.add_annotation(
-        x=2.5, y=2.5,
-        text="Criticité 2",
-        showarrow=False,
-        font=dict(color="#e67e22", size=12)
-    )
-    fig.add_annotation(
-        x=1, y=1,
-        text="Criticité 1",
-        showarrow=False,
-        font=dict(color="#27ae60", size=12)
-    )
-    
-    # Configure axis for 4x4 scale
-    fig.update_layout(
-        height=500,
-        margin=dict(l=10, r=10, t=30, b=10),
-        coloraxis_showscale=False,
-        xaxis=dict(
-            title="Probabilité",
-            range=[0.5, 4.5],
-            dtick=1,
-            tickvals=[1, 2, 3, 4],
-            ticktext=["1 - Rare", "2 - Peu probable", "3 - Probable", "4 - Très probable"]
-        ),
-        yaxis=dict(
-            title="Impact",
-            range=[0.5, 4.5],
-            dtick=1,
-            tickvals=[1, 2, 3, 4],
-            ticktext=["1 - Négligeable", "2 - Mineur", "3 - Modéré", "4 - Majeur"]
+        fig.add_shape(
+            type="rect",
+            x0=4, y0=3,
+            x1=4.5, y1=4,
+            fillcolor="rgba(231, 76, 60, 0.3)",
+            line=dict(width=0),
+            layer="below"
         )
-    )
+        fig.add_shape(
+            type="rect",
+            x0=3, y0=3,
+            x1=4, y1=4,
+            fillcolor="rgba(231, 76, 60, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        
+        # Criticité 2 (jaune) - medium impact and probability
+        fig.add_shape(
+            type="rect",
+            x0=2, y0=3,
+            x1=3, y1=4.5,
+            fillcolor="rgba(243, 156, 18, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        fig.add_shape(
+            type="rect",
+            x0=3, y0=2,
+            x1=4.5, y1=3,
+            fillcolor="rgba(243, 156, 18, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        fig.add_shape(
+            type="rect",
+            x0=2, y0=2,
+            x1=3, y1=3,
+            fillcolor="rgba(243, 156, 18, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        
+        # Criticité 1 (vert) - low risk
+        fig.add_shape(
+            type="rect",
+            x0=0, y0=0,
+            x1=2, y1=2,
+            fillcolor="rgba(46, 204, 113, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        fig.add_shape(
+            type="rect",
+            x0=0, y0=2,
+            x1=2, y1=4.5,
+            fillcolor="rgba(46, 204, 113, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        fig.add_shape(
+            type="rect",
+            x0=2, y0=0,
+            x1=4.5, y1=2,
+            fillcolor="rgba(46, 204, 113, 0.3)",
+            line=dict(width=0),
+            layer="below"
+        )
+        
+        # Add labels for criticality zones
+        fig.add_annotation(
+            x=4.25, y=4.25,
+            text="Criticité 4",
+            showarrow=False,
+            font=dict(color="#7f0000", size=12)
+        )
+        fig.add_annotation(
+            x=3.5, y=3.5,
+            text="Criticité 3",
+            showarrow=False, 
+            font=dict(color="#c0392b", size=12)
+        )
+        fig.add_annotation(
+            x=2.5, y=2.5,
+            text="Criticité 2",
+            showarrow=False,
+            font=dict(color="#e67e22", size=12)
+        )
+        fig.add_annotation(
+            x=1, y=1,
+            text="Criticité 1",
+            showarrow=False,
+            font=dict(color="#27ae60", size=12)
+        )
+        
+        # Configure axis for 4x4 scale
+        fig.update_layout(
+            height=500,
+            margin=dict(l=10, r=10, t=30, b=10),
+            coloraxis_showscale=False,
+            xaxis=dict(
+                title="Probabilité",
+                range=[0.5, 4.5],
+                dtick=1,
+                tickvals=[1, 2, 3, 4],
+                ticktext=["1 - Rare", "2 - Peu probable", "3 - Probable", "4 - Très probable"]
+            ),
+            yaxis=dict(
+                title="Impact",
+                range=[0.5, 4.5],
+                dtick=1,
+                tickvals=[1, 2, 3, 4],
+                ticktext=["1 - Négligeable", "2 - Mineur", "3 - Modéré", "4 - Majeur"]
+            )
+        )
+        
+        # Improve hover information
+        fig.update_traces(
+            hovertemplate="<b>%{text}</b><br>Impact: %{y}<br>Probabilité: %{x}<br>Criticité: %{marker.color}<extra></extra>"
+        )
+        return fig
     
-    # Improve hover information
-    fig.update_traces(
-        hovertemplate="<b>%{text}</b><br>Impact: %{y}<br>Probabilité: %{x}<br>Criticité: %{marker.color}<extra></extra>"
-    )
+    fig = cached_figure("risk_matrix", build_risk_matrix)
     
     st.caption("Matrice des risques du projet")
     # Affichage de la figure
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, "risk_matrix")
     
     # Add legend for risk criticality
     st.markdown("""
@@ -1234,210 +1184,188 @@ with tabs[3]:
         </div>
     </div>
     """, unsafe_allow_html=True)
-    
+
+
+# The detailed analysis depends on the period, it reruns with the period fragment
+def render_risk_details():
+    """Render the detailed analysis of the critical risks for the selected period"""
     st.subheader("Analyse détaillée des risques critiques")
 
-    # Create tabs for each risk
+    # Create tabs for each risk, only the open one is computed
     risk_detail_tabs = st.tabs([
         "R01: Désistement des bénévoles", 
         "R02: Risques sanitaires", 
         "R03: Nombre de participants", 
         "R04: Conditions extrêmes"
-    ])
+    ], key="risk_detail_tab", on_change="rerun")
 
-    with risk_detail_tabs[0]:
-        st.markdown("### R01: Désistement des bénévoles")
+    if risk_detail_tabs[0].open:
+        with risk_detail_tabs[0]:
+            st.markdown("### R01: Désistement des bénévoles")
         
-        # Calculate response rate
-        benevoles_objectif = current_objectives['Bénévoles']['cible']
-        benevoles_actuels = current_objectives['Bénévoles']['actuel']
-        response_rate = (benevoles_actuels / benevoles_objectif * 100) if benevoles_objectif > 0 else 0
+            benevoles = view["benevoles"]
+            benevoles_objectif, benevoles_actuels = benevoles["cible"], benevoles["actuel"]
+            response_rate = benevoles["taux"]
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Taux de réponse", f"{response_rate:.1f}%")
-            st.progress(response_rate/100)
-        
-        with col2:
-            st.metric("Bénévoles confirmés", f"{benevoles_actuels}/{benevoles_objectif}")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Taux de réponse", f"{response_rate:.1f}%")
+                st.progress(min(response_rate/100, 1.0))
         
-        # Actions recommandées
-        st.subheader("Actions recommandées")
-        if response_rate < 75:
-            st.error("Niveau d'alerte : CRITIQUE")
-            st.markdown("""
-            - Lancer une campagne de relance urgente
-            - Élargir le recrutement à d'autres réseaux
-            - Prévoir un plan de secours avec moins de bénévoles
-            """)
-        elif response_rate < 90:
-            st.warning("Niveau d'alerte : MODÉRÉ")
-            st.markdown("""
-            - Envoyer des rappels personnalisés
-            - Confirmer la disponibilité des bénévoles déjà engagés
-            """)
-        else:
-            st.success("Niveau d'alerte : MINEUR")
-            st.markdown("""
-            - Maintenir le contact avec les bénévoles confirmés
-            - Prévoir quelques remplaçants en cas de désistement de dernière minute
-            """)
-
-    with risk_detail_tabs[1]:
-        st.markdown("### R02: Risques sanitaires")
+            with col2:
+                st.metric("Bénévoles confirmés", f"{benevoles_actuels}/{benevoles_objectif}")
         
-        # Calculate prevention measures completion
-        prevention_steps = [
-            "Plan de secours établi",
-            "Équipe médicale confirmée",
-            "Matériel de premiers soins préparé",
-            "Formation des bénévoles aux gestes de premiers secours",
-            "Coordination avec hôpitaux locaux"
-        ]
-        
-        # Simulate completion status based on current period
-        prevention_completed = [
-            selected_period_index >= 6,
-            selected_period_index >= 7,
-            selected_period_index >= 8,
-            selected_period_index >= 9,
-            selected_period_index >= 10
-        ]
+            # Actions recommandées
+            st.subheader("Actions recommandées")
+            if response_rate < 75:
+                st.error("Niveau d'alerte : CRITIQUE")
+                st.markdown("""
+                - Lancer une campagne de relance urgente
+                - Élargir le recrutement à d'autres réseaux
+                - Prévoir un plan de secours avec moins de bénévoles
+                """)
+            elif response_rate < 90:
+                st.warning("Niveau d'alerte : MODÉRÉ")
+                st.markdown("""
+                - Envoyer des rappels personnalisés
+                - Confirmer la disponibilité des bénévoles déjà engagés
+                """)
+            else:
+                st.success("Niveau d'alerte : MINEUR")
+                st.markdown("""
+                - Maintenir le contact avec les bénévoles confirmés
+                - Prévoir quelques remplaçants en cas de désistement de dernière minute
+                """)
+
+    if risk_detail_tabs[1].open:
+        with risk_detail_tabs[1]:
+            st.markdown("### R02: Risques sanitaires")
         
-        completion_rate = sum(prevention_completed) / len(prevention_completed) * 100
+            completion_rate = view["prevention"]["taux"]
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Mesures préventives en place", f"{completion_rate:.1f}%")
-            st.progress(completion_rate/100)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Mesures préventives en place", f"{completion_rate:.1f}%")
+                st.progress(completion_rate/100)
         
-        # Display checklist
-        st.subheader("Liste des mesures préventives")
-        for i, step in enumerate(prevention_steps):
-            st.checkbox(step, value=prevention_completed[i], disabled=True)
+            # Display checklist
+            st.subheader("Liste des mesures préventives")
+            for step, completed in view["prevention"]["steps"]:
+                st.checkbox(step, value=completed, disabled=True)
         
-        # Actions recommandées
-        st.subheader("Actions recommandées")
-        if completion_rate < 80:
-            st.error("Niveau d'alerte : CRITIQUE")
-            st.markdown("""
-            - Accélérer la mise en place des mesures de prévention
-            - Réunion d'urgence avec l'équipe de sécurité
-            - Envisager de reporter l'événement si les mesures essentielles ne peuvent être mises en place
-            """)
-        elif completion_rate < 100:
-            st.warning("Niveau d'alerte : MODÉRÉ")
-            st.markdown("""
-            - Finaliser les mesures restantes rapidement
-            - Tester le dispositif de sécurité
-            """)
-        else:
-            st.success("Niveau d'alerte : MINEUR")
-            st.markdown("""
-            - Vérifier une dernière fois tous les dispositifs
-            - Prévoir une simulation de crise
-            """)
-    with risk_detail_tabs[2]:
-        st.markdown("### R03: Nombre de participants")
+            # Actions recommandées
+            st.subheader("Actions recommandées")
+            if completion_rate < 80:
+                st.error("Niveau d'alerte : CRITIQUE")
+                st.markdown("""
+                - Accélérer la mise en place des mesures de prévention
+                - Réunion d'urgence avec l'équipe de sécurité
+                - Envisager de reporter l'événement si les mesures essentielles ne peuvent être mises en place
+                """)
+            elif completion_rate < 100:
+                st.warning("Niveau d'alerte : MODÉRÉ")
+                st.markdown("""
+                - Finaliser les mesures restantes rapidement
+                - Tester le dispositif de sécurité
+                """)
+            else:
+                st.success("Niveau d'alerte : MINEUR")
+                st.markdown("""
+                - Vérifier une dernière fois tous les dispositifs
+                - Prévoir une simulation de crise
+                """)
+    if risk_detail_tabs[2].open:
+        with risk_detail_tabs[2]:
+            st.markdown("### R03: Nombre de participants")
         
-        # Calculate participation rate
-        participants_objectif = current_objectives['Participants']['cible']
-        participants_actuels = current_objectives['Participants']['actuel']
-        participation_rate = (participants_actuels / participants_objectif * 100) if participants_objectif > 0 else 0
+            participation = view["participation"]
+            participants_objectif, participants_actuels = participation["cible"], participation["actuel"]
+            participation_rate = participation["taux"]
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Taux de participation", f"{participation_rate:.1f}%")
-            st.progress(participation_rate/100)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Taux de participation", f"{participation_rate:.1f}%")
+                st.progress(min(participation_rate/100, 1.0))
         
-        with col2:
-            st.metric("Participants inscrits", f"{participants_actuels}/{participants_objectif}")
-            max_participants = 1000
-            st.caption(f"Capacité maximale: {max_participants} personnes")
+            with col2:
+                st.metric("Participants inscrits", f"{participants_actuels}/{participants_objectif}")
+                max_participants = 1000
+                st.caption(f"Capacité maximale: {max_participants} personnes")
         
-        # Actions recommandées
-        st.subheader("Actions recommandées")
-        if participation_rate < 70:
-            st.error("Niveau d'alerte : CRITIQUE")
-            st.markdown("""
-            - Intensifier la communication sur l'événement
-            - Contacter directement les réseaux communautaires
-            - Envisager des incitations pour encourager la participation
-            """)
-        elif participation_rate < 90:
-            st.warning("Niveau d'alerte : MODÉRÉ")
-            st.markdown("""
-            - Relancer la campagne de communication
-            - Demander aux participants confirmés d'inviter d'autres personnes
-            """)
-        else:
-            st.success("Niveau d'alerte : MINEUR")
-            st.markdown("""
-            - Maintenir la communication régulière
-            - Préparer un plan de gestion des flux en cas de forte affluence
-            """)
-    
-    with risk_detail_tabs[3]:
-        st.markdown("### R04: Conditions extrêmes")
+            # Actions recommandées
+            st.subheader("Actions recommandées")
+            if participation_rate < 70:
+                st.error("Niveau d'alerte : CRITIQUE")
+                st.markdown("""
+                - Intensifier la communication sur l'événement
+                - Contacter directement les réseaux communautaires
+                - Envisager des incitations pour encourager la participation
+                """)
+            elif participation_rate < 90:
+                st.warning("Niveau d'alerte : MODÉRÉ")
+                st.markdown("""
+                - Relancer la campagne de communication
+                - Demander aux participants confirmés d'inviter d'autres personnes
+                """)
+            else:
+                st.success("Niveau d'alerte : MINEUR")
+                st.markdown("""
+                - Maintenir la communication régulière
+                - Préparer un plan de gestion des flux en cas de forte affluence
+                """)
+    
+    if risk_detail_tabs[3].open:
+        with risk_detail_tabs[3]:
+            st.markdown("### R04: Conditions extrêmes")
         
-        # Weather validation status
-        meteo_periods = ["S9", "S10", "S11"]
-        current_in_critical = selected_period in meteo_periods
+            # Weather validation status
+            current_in_critical = view["meteo"]["critical"]
         
-        col1, col2 = st.columns(2)
-        with col1:
-            if current_in_critical:
-                st.error("🌩️ Période critique pour validation météo")
-            else:
-                st.success("☀️ Hors période critique pour validation météo")
+            col1, col2 = st.columns(2)
+            with col1:
+                if current_in_critical:
+                    st.error("🌩️ Période critique pour validation météo")
+                else:
+                    st.success("☀️ Hors période critique pour validation météo")
         
-        # Display weather status for critical periods
-        st.subheader("État des prévisions météo")
-        for period in meteo_periods:
-            is_validated = period < selected_period
-            is_current = period == selected_period
+            # Display weather status for critical periods
+            st.subheader("État des prévisions météo")
+            for period, meteo_status in view["meteo"]["statuses"]:
+                is_validated = meteo_status == "validated"
+                is_current = meteo_status == "current"
             
-            status = "✅ Validée" if is_validated else "⏳ En attente" if is_current else "❌ Non validée"
-            color = "green" if is_validated else "orange" if is_current else "red"
+                status = "✅ Validée" if is_validated else "⏳ En attente" if is_current else "❌ Non validée"
+                color = "green" if is_validated else "orange" if is_current else "red"
             
-            st.markdown(f"**{period}**: <span style='color:{color}'>{status}</span>", unsafe_allow_html=True)
+                st.markdown(f"**{period}**: <span style='color:{color}'>{status}</span>", unsafe_allow_html=True)
         
-        # Actions recommandées
-        st.subheader("Actions recommandées")
-        if current_in_critical:
-            st.error("Niveau d'alerte : CRITIQUE")
-            st.markdown("""
-            - Consulter quotidiennement les prévisions météorologiques
-            - Préparer un plan B en cas de météo défavorable
-            - Vérifier la disponibilité d'espaces couverts
-            """)
-        else:
-            st.success("Niveau d'alerte : MINEUR")
-            st.markdown("""
-            - Maintenir une surveillance régulière des prévisions
-            - S'assurer que le plan B est toujours viable si nécessaire
-            """)
+            # Actions recommandées
+            st.subheader("Actions recommandées")
+            if current_in_critical:
+                st.error("Niveau d'alerte : CRITIQUE")
+                st.markdown("""
+                - Consulter quotidiennement les prévisions météorologiques
+                - Préparer un plan B en cas de météo défavorable
+                - Vérifier la disponibilité d'espaces couverts
+                """)
+            else:
+                st.success("Niveau d'alerte : MINEUR")
+                st.markdown("""
+                - Maintenir une surveillance régulière des prévisions
+                - S'assurer que le plan B est toujours viable si nécessaire
+                """)
 
 # Tab 5: Team
-with tabs[4]:
+def render_team_tab():
+    """Render the team tab"""
     st.header("Gestion de l'Équipe")
     
-    # Team state data for current period
-    team_data = data["team_states"]
-    team_period_index = periods.index(selected_period)
-    
-    # Get team stats
-    team_stats = {}
-    total_members = 0
-    for member, states in team_data.items():
-        state = states[team_period_index]
-        total_members += 1 if state != 0 else 0  # Don't count absent members
-        state_name = ["Absent", "Formation", "Confrontation", "Normalisation", "Performance"][state]
-        team_stats[state_name] = team_stats.get(state_name, 0) + 1
+    team = view["team"]
+    team_stats = team["counts"]
     
     # Display team metrics
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Membres actifs", total_members - team_stats.get("Absent", 0))
+    col1.metric("Membres actifs", team["actifs"])
     col2.metric("En performance", team_stats.get("Performance", 0))
     col3.metric("En formation", team_stats.get("Formation", 0) + team_stats.get("Confrontation", 0))
     col4.metric("Absents", team_stats.get("Absent", 0))
@@ -1445,110 +1373,148 @@ with tabs[4]:
     # Team composition pie chart
     st.subheader("Composition de l'équipe par état")
     st.caption("Répartition des membres de l'équipe par état")
-    team_composition = []
-    for state, count in team_stats.items():
-        if state != "Absent":  # Include only active states
-            team_composition.append({
-                "État": state,
-                "Nombre": count
-            })
-    
-    team_comp_df = pd.DataFrame(team_composition)
-    
-    fig = px.pie(
-        team_comp_df,
-        values="Nombre",
-        names="État",
-        color="État",
-        color_discrete_map={
-            "Formation": COLOR_PALETTE["jaune_pale"],
-            "Confrontation": COLOR_PALETTE["jaune"], 
-            "Normalisation": COLOR_PALETTE["orange"],
-            "Performance": COLOR_PALETTE["vert"]
-        }
-    )
+    def build_team_composition():
+        team_composition = []
+        for state, count in team_stats.items():
+            if state != "Absent" and count > 0:  # Include only active states
+                team_composition.append({
+                    "État": state,
+                    "Nombre": count
+                })
+        
+        team_comp_df = pd.DataFrame(team_composition)
+        
+        fig = px.pie(
+            team_comp_df,
+            values="Nombre",
+            names="État",
+            color="État",
+            color_discrete_map={
+                "Formation": COLOR_PALETTE["jaune_pale"],
+                "Confrontation": COLOR_PALETTE["jaune"], 
+                "Normalisation": COLOR_PALETTE["orange"],
+                "Performance": COLOR_PALETTE["vert"]
+            }
+        )
+        
+        fig.update_layout(
+            height=400,
+            margin=dict(l=10, r=10, t=30, b=10)
+        )
+        return fig
     
-    fig.update_layout(
-        height=400,
-        margin=dict(l=10, r=10, t=30, b=10)
-    )
+    fig = cached_figure("team_composition", build_team_composition, data.tables_version("team"), period=selected_period)
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, "team_composition")
     
     # Team evolution
     st.subheader("Évolution de l'équipe")
     st.caption("Analyse de l'évolution des membres de l'équipe au fil des périodes")
     
-    # Calculate team state evolution
-    team_evolution = []
-    for period_idx, period in enumerate(periods[:selected_period_index+1]):
-        period_stats = {"Formation": 0, "Confrontation": 0, "Normalisation": 0, "Performance": 0}
-        for member, states in team_data.items():
-            state = states[period_idx]
-            if state > 0:  # Skip absent members
-                state_name = ["", "Formation", "Confrontation", "Normalisation", "Performance"][state]
-                period_stats[state_name] += 1
-                
-        team_evolution.append({
-            "Période": period,
-            "Performance": period_stats["Performance"],
-            "Normalisation": period_stats["Normalisation"],
-            "Confrontation": period_stats["Confrontation"],
-            "Formation": period_stats["Formation"]
-        })
-    
-    team_evolution_df = pd.DataFrame(team_evolution)
-    
-    fig = px.area(
-        team_evolution_df,
-        x="Période",
-        y=["Performance", "Normalisation", "Confrontation", "Formation"],
-        color_discrete_map={
-            "Performance": "#2ecc71",
-            "Normalisation": "#9b59b6",
-            "Confrontation": "#f39c12",
-            "Formation": "#3498db"
-        }
-    )
+    def build_team_evolution():
+        team_evolution_df = pd.DataFrame(team["evolution"])
+        
+        fig = px.area(
+            team_evolution_df,
+            x="Période",
+            y=["Performance", "Normalisation", "Confrontation", "Formation"],
+            color_discrete_map={
+                "Performance": "#2ecc71",
+                "Normalisation": "#9b59b6",
+                "Confrontation": "#f39c12",
+                "Formation": "#3498db"
+            }
+        )
+        
+        fig.update_layout(
+            height=400,
+            margin=dict(l=10, r=10, t=30, b=10),
+            yaxis_title="Nombre de membres",
+            xaxis_title="Période"
+        )
+        return fig
     
-    fig.update_layout(
-        height=400,
-        margin=dict(l=10, r=10, t=30, b=10),
-        yaxis_title="Nombre de membres",
-        xaxis_title="Période"
-    )
+    fig = cached_figure("team_evolution", build_team_evolution, data.tables_version("team"), period=selected_period)
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, "team_evolution")
     
     # Team member status
     st.subheader("État des membres de l'équipe")
     st.caption("Analyse de l'état des membres de l'équipe pour la période actuelle")
     
-    # Create member status table
-    member_status = []
-    for member, states in team_data.items():
-        state = states[team_period_index]
-        state_name = ["Absent", "Formation", "Confrontation", "Normalisation", "Performance"][state]
-        
-        # Calculate trend by comparing with previous period
-        prev_state = states[max(0, team_period_index-1)]
-        if state > prev_state:
-            trend = "↑"
-        elif state < prev_state:
-            trend = "↓"
-        else:
-            trend = "→"
-            
-        member_status.append({
-            "Membre": member,
-            "État": state_name,
-            "Tendance": trend
-        })
-    
-    member_status_df = pd.DataFrame(member_status)
+    member_status_df = pd.DataFrame(team["members"])
     
     st.dataframe(
         member_status_df,
         hide_index=True,
         use_container_width=True
-    )
\ No newline at end of file
+    )
+
+
+@st.fragment
+def render_period_sections(title, render_period_part):
+    """Render the period controls and the period-dependent part of the open tab
+
+    Un changement de période ne relance que ce fragment : le titre, la barre
+    latérale et les parties statiques des onglets ne sont pas réexécutés.
+    """
+    with profiling.profiled_fragment("Jamais_Seul", "period", profile_placeholder, PROFILE_COUNTERS,
+                                     ends_script=True) as profile_context:
+        select_period_view()
+        render_period_controls()
+        with profiling.span(f"tab:{title}"):
+            render_period_part()
+        profile_context.update(period=selected_period, tab=title)
+
+
+def select_period_view():
+    """Load the data and select the period and its precomputed view"""
+    # Les fonctions render_* lisent la période et sa vue au niveau du module
+    global data, periods, selected_period, selected_period_index, view
+
+    # Load data (only the tables changed since the last run are re-read)
+    with profiling.span("load_project_data"):
+        data = load_project_data()
+    periods = data.periods
+    # Jeu de données sans la période choisie (export partiel, scénario court) : dernière période
+    if st.session_state.dashboard_period not in periods:
+        st.session_state.dashboard_period = periods[-1]
+    selected_period = st.session_state.dashboard_period
+    selected_period_index = periods.index(selected_period)
+
+    # Every KPI, delta and alert of the selected period, precomputed for all
+    # periods once per data version (see utils/period_views.py)
+    with profiling.span("period_view"):
+        view = build_period_view(data, selected_period)
+
+
+def render_period_controls():
+    """Render the period slider and the reference date in the sidebar"""
+    with period_controls:
+        st.header("⚙️ Contrôles")
+        st.select_slider(
+            "Période d'analyse",
+            options=periods,
+            value=selected_period,
+            key="sidebar-period-selector",
+            on_change=select_period
+        )
+        st.caption(f"Date de référence: {data.period_dates[selected_period]}")
+
+
+# Lazy tabs: only the body of the open tab is executed on each rerun. Each tab
+# has a static part (full reruns only) and a part rerun on period changes
+tab_sections = [
+    (None, render_dashboard_tab),
+    (render_planning_tab, render_planning_schedule),
+    (None, render_budget_tab),
+    (render_risks_tab, render_risk_details),
+    (None, render_team_tab),
+]
+for title, tab, (render_static_part, render_period_part) in zip(TAB_TITLES, tabs, tab_sections):
+    if tab.open:
+        with tab:
+            if render_static_part is not None:
+                with profiling.span(f"tab:{title} (statique)"):
+                    render_static_part()
+            render_period_sections(title, render_period_part)
@@ -0,0 +1,358 @@
+"""Mesure la latence des reruns du tableau de bord (Accueil.py et chaque onglet de pages/Jamais_Seul.py).
+
+Les pages sont exécutées sans navigateur par streamlit.testing.v1.AppTest :
+premier affichage de chaque onglet (caches froids), reruns à caches chauds,
+balayage du curseur de période sur toutes les périodes et, dans l'onglet
+Planning, filtre par phase et case "Afficher les sous-tâches". Pour chaque cas :
+temps d'exécution, allocations (tracemalloc, sur un passage séparé pour ne pas
+fausser les temps) et nombre d'éléments affichés par type.
+
+Chaque jeu de données est mesuré dans un processus à part, caches vides (cache
+persistant des données désactivé). Le démarrage à froid de chaque page (premier
+affichage dans un interpréteur neuf, comme un nouveau worker) est mesuré sous
+python -X importtime : le rapport donne le temps passé en imports pendant ce
+premier affichage et les modules les plus coûteux, à comparer à
+COLD_START_TARGETS_MS. dashboard_restart mesure le même démarrage avec le cache
+persistant rempli par un processus précédent, comme après un redéploiement.
+
+Usage :
+    python scripts/benchmark_reruns.py                                    # démo -> dist/benchmarks/reruns.json
+    python scripts/benchmark_reruns.py --data "" --data "scenario:periods=40,budget_lines=300,tasks=3000"
+    python scripts/benchmark_reruns.py --baseline benchmarks/baseline.json --threshold 0.25
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+HOME_PAGE = ROOT / "Accueil.py"
+DASHBOARD_PAGE = ROOT / "pages" / "Jamais_Seul.py"
+DEFAULT_OUTPUT = ROOT / "dist" / "benchmarks" / "reruns.json"
+
+# Libellés des onglets de pages/Jamais_Seul.py (TAB_TITLES)
+TABS = ["📊 Tableau de bord", "📅 Planning", "💰 Budget", "⚠️ Risques", "👥 Équipe"]
+PERIOD_SLIDER_KEY = "sidebar-period-selector"
+PHASE_FILTER_LABEL = "Filtrer par phase"
+DETAILS_CHECKBOX_LABEL = "Afficher les sous-tâches"
+
+# Objectifs de démarrage à froid (ms) : premier affichage de la page dans un worker neuf
+# dashboard_restart : redémarrage avec le cache persistant des données (utils/data_cache.py) déjà rempli
+COLD_START_TARGETS_MS = {"accueil": 750, "dashboard": 2500, "dashboard_restart": 2000}
+IMPORTTIME_MARKER = "benchmark_reruns: first run"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+# Écart minimal (ms) pour signaler une régression : en dessous, c'est du bruit de mesure
+MIN_REGRESSION_MS = 10.0
+RUN_TIMEOUT = 120
+
+
+def count_elements(at):
+    """Return the number of rendered elements of each type, containers included"""
+    counts = {}
+
+    def walk(node):
+        for child in getattr(node, "children", {}).values():
+            counts[child.type] = counts.get(child.type, 0) + 1
+            walk(child)
+
+    walk(at._tree)
+    return dict(sorted(counts.items()))
+
+
+def _run(at, step):
+    step(at)
+    at.run(timeout=RUN_TIMEOUT)
+    if at.exception:
+        raise RuntimeError("; ".join(e.value for e in at.exception))
+
+
+def _time_ms(at, step):
+    start = time.perf_counter()
+    _run(at, step)
+    return (time.perf_counter() - start) * 1000
+
+
+def _traced_kib(at, step):
+    # Pic et solde des allocations Python pendant le rerun
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        _run(at, step)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 1024, (current - before) / 1024
+
+
+def _summary(values):
+    if not values:
+        return None
+    return {
+        "median_ms": round(statistics.median(values), 2),
+        "max_ms": round(max(values), 2),
+        "total_ms": round(sum(values), 2),
+        "runs": len(values),
+    }
+
+
+class Recorder:
+    """Collects the timings, allocations and element counts of each benchmark case"""
+
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.cases = {}
+
+    def measure(self, name, at, steps, cold=False):
+        """Run every step repeat times (plus a traced pass for allocations) and record the case
+
+        Avec cold=True, le premier passage est compté à part : c'est lui qui
+        remplit les caches (vues par période, figures, données).
+        """
+        cold_ms, warm_ms = [], []
+        for attempt in range(self.repeat + (1 if cold else 0)):
+            timings = [_time_ms(at, step) for step in steps]
+            (cold_ms if cold and attempt == 0 else warm_ms).extend(timings)
+        traced = [_traced_kib(at, step) for step in steps]
+        self.cases[name] = {
+            "cold": _summary(cold_ms),
+            "warm": _summary(warm_ms),
+            "alloc_peak_kib": round(max(peak for peak, _ in traced), 1),
+            "alloc_net_kib": round(sum(net for _, net in traced), 1),
+            "elements": count_elements(at),
+        }
+        warm = self.cases[name]["warm"]
+        print(f"  {name:<40} warm {warm['median_ms']:>8.1f} ms (max {warm['max_ms']:.1f})"
+              f"  alloc {self.cases[name]['alloc_peak_kib']:>8.0f} KiB", flush=True)
+
+
+def _noop(at):
+    pass
+
+
+def _open_tab(tab):
+    def step(at):
+        at.session_state["active_tab"] = tab
+    return step
+
+
+def _select_period(period):
+    def step(at):
+        at.select_slider(key=PERIOD_SLIDER_KEY).set_value(period)
+    return step
+
+
+def _set_phases(phases):
+    def step(at):
+        next(m for m in at.multiselect if m.label == PHASE_FILTER_LABEL).set_value(phases)
+    return step
+
+
+def _set_details(checked):
+    def step(at):
+        next(c for c in at.checkbox if c.label == DETAILS_CHECKBOX_LABEL).set_value(checked)
+    return step
+
+
+def run_dataset(repeat):
+    """Benchmark both pages on the data source of JAMAIS_SEUL_DATA, in this process"""
+    recorder = Recorder(repeat)
+
+    home = AppTest.from_file(str(HOME_PAGE), default_timeout=RUN_TIMEOUT)
+    recorder.measure("accueil", home, [_noop], cold=True)
+
+    for tab in TABS:
+        at = AppTest.from_file(str(DASHBOARD_PAGE), default_timeout=RUN_TIMEOUT)
+        recorder.measure(f"{tab}/open", at, [_open_tab(tab)], cold=True)
+
+        periods = list(at.select_slider(key=PERIOD_SLIDER_KEY).options)
+        initial_period = at.select_slider(key=PERIOD_SLIDER_KEY).value
+        recorder.measure(f"{tab}/period_sweep", at,
+                         [_select_period(p) for p in periods] + [_select_period(initial_period)], cold=True)
+
+        if tab == TABS[1]:
+            phases = list(next(m for m in at.multiselect if m.label == PHASE_FILTER_LABEL).options)
+            phase_steps = [_set_phases([p for p in phases if p != removed]) for removed in phases]
+            recorder.measure(f"{tab}/phase_filter", at, phase_steps + [_set_phases(phases)], cold=True)
+            recorder.measure(f"{tab}/subtasks_toggle", at, [_set_details(False), _set_details(True)], cold=True)
+
+    return recorder.cases
+
+
+def cold_start_worker(page, output):
+    """Time the first run of a page in this fresh interpreter (run under -X importtime)"""
+    at = AppTest.from_file(str(HOME_PAGE if page == "accueil" else DASHBOARD_PAGE), default_timeout=RUN_TIMEOUT)
+    # Les imports qui suivent ce repère sont ceux de la page
+    print(IMPORTTIME_MARKER, file=sys.stderr, flush=True)
+    first_run_ms = _time_ms(at, _noop)
+    output.write_text(json.dumps({"first_run_ms": first_run_ms}), encoding="utf-8")
+
+
+def parse_importtime(stderr, top=10):
+    """Summarize the -X importtime lines printed after the first-run marker"""
+    _, _, page_lines = stderr.partition(IMPORTTIME_MARKER)
+    total_us, top_level = 0, []
+    for match in IMPORTTIME_LINE.finditer(page_lines):
+        self_us, cumulative_us, indent, name = match.groups()
+        total_us += int(self_us)
+        if not indent:
+            top_level.append((name, int(cumulative_us)))
+    top_level.sort(key=lambda item: -item[1])
+    return {
+        "total_ms": round(total_us / 1000, 1),
+        "top": [[name, round(cumulative_us / 1000, 1)] for name, cumulative_us in top_level[:top]],
+    }
+
+
+def run_cold_start(spec, page):
+    """Measure the cold start of a page in a fresh interpreter, with its import-time report"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "cold_start.json"
+        command = [sys.executable, "-X", "importtime", __file__, "--cold-start", page, "--worker", str(output)]
+        env = {**os.environ, "JAMAIS_SEUL_DATA": spec, "JAMAIS_SEUL_DATA_CACHE": "off"}
+        if page.endswith("_restart"):
+            # Un premier processus remplit le cache persistant, le second le relit
+            env["JAMAIS_SEUL_DATA_CACHE"] = str(Path(tmp) / "data_cache")
+            subprocess.run(command, env=env, capture_output=True, check=True)
+        start = time.perf_counter()
+        process = subprocess.run(command, env=env, capture_output=True, text=True)
+        process_ms = (time.perf_counter() - start) * 1000
+        if process.returncode:
+            sys.stderr.write("\n".join(line for line in process.stderr.splitlines()
+                                        if not line.startswith("import time:")))
+            process.check_returncode()
+        first_run_ms = json.loads(output.read_text(encoding="utf-8"))["first_run_ms"]
+
+    imports = parse_importtime(process.stderr)
+    case = {
+        "cold": _summary([first_run_ms]),
+        "warm": None,
+        "process_ms": round(process_ms, 1),
+        # Objectifs fixés sur le jeu de démonstration ; les scénarios sont seulement mesurés
+        "target_ms": None if spec else COLD_START_TARGETS_MS[page],
+        "imports": imports,
+    }
+    print(f"  {'cold_start/' + page:<40} first run {first_run_ms:>8.1f} ms (objectif {case['target_ms'] or '-'} ms)"
+          f"  imports {imports['total_ms']:.0f} ms  processus {process_ms:.0f} ms", flush=True)
+    for name, cumulative_ms in imports["top"][:5]:
+        print(f"      {name:<36} {cumulative_ms:>8.1f} ms")
+    return case
+
+
+def run_isolated(spec, repeat):
+    """Run the benchmark of one data source in a fresh interpreter and return its cases"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "cases.json"
+        subprocess.run(
+            [sys.executable, __file__, "--worker", str(output), "--repeat", str(repeat)],
+            env={**os.environ, "JAMAIS_SEUL_DATA": spec, "JAMAIS_SEUL_DATA_CACHE": "off"},
+            check=True,
+        )
+        return json.loads(output.read_text(encoding="utf-8"))
+
+
+def compare(results, baseline, threshold, min_delta_ms=MIN_REGRESSION_MS):
+    """Return the regressions of results against a baseline, as printable lines
+
+    Un cas régresse si sa médiane (froide ou chaude) dépasse celle de la
+    référence de plus de threshold (0.25 = +25 %) et d'au moins min_delta_ms.
+    """
+    regressions = []
+    for dataset, cases in results["datasets"].items():
+        base_cases = baseline.get("datasets", {}).get(dataset)
+        if base_cases is None:
+            print(f"  {dataset or 'demo'} : absent de la référence, non comparé")
+            continue
+        for name, case in cases.items():
+            for phase in ("cold", "warm"):
+                current, reference = case.get(phase), base_cases.get(name, {}).get(phase)
+                if not current or not reference:
+                    continue
+                new, old = current["median_ms"], reference["median_ms"]
+                if new > old * (1 + threshold) and new - old >= min_delta_ms:
+                    regressions.append(
+                        f"{dataset or 'demo'} {name} [{phase}] : {old:.1f} ms -> {new:.1f} ms (+{(new / old - 1) * 100:.0f} %)"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", action="append", metavar="SPEC",
+                        help="source de données (voir JAMAIS_SEUL_DATA), répétable ; défaut : démo")
+    parser.add_argument("--repeat", type=int, default=3, help="passages chauds par cas (défaut : 3)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="fichier JSON des résultats")
+    parser.add_argument("--baseline", type=Path, help="résultats de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="hausse relative tolérée avant de signaler une régression (défaut : 0.25)")
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--cold-start", choices=list(COLD_START_TARGETS_MS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_start:
+        cold_start_worker(args.cold_start, args.worker)
+        return
+    if args.worker:
+        # Sans les avertissements répétés à chaque rerun (AppTest réinitialise les niveaux de log)
+        for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+            logging.getLogger(name).disabled = True
+        args.worker.write_text(json.dumps(run_dataset(args.repeat), ensure_ascii=False), encoding="utf-8")
+        return
+
+    results = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": st.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "datasets": {},
+    }
+    for spec in args.data or [""]:
+        print(f"Jeu de données : {spec or 'démo'}", flush=True)
+        cases = {f"cold_start/{page}": run_cold_start(spec, page) for page in COLD_START_TARGETS_MS}
+        results["datasets"][spec] = {**cases, **run_isolated(spec, args.repeat)}
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Résultats écrits dans {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"  RÉGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"Aucune régression au-delà de {args.threshold:.0%} par rapport à {args.baseline}")
+
+    over_target = [
+        f"{spec or 'demo'} {name} : {case['cold']['median_ms']:.0f} ms > {case['target_ms']} ms"
+        for spec, cases in results["datasets"].items()
+        for name, case in cases.items()
+        if case.get("target_ms") and case["cold"]["median_ms"] > case["target_ms"]
+    ]
+    for line in over_target:
+        print(f"  DÉMARRAGE À FROID HORS OBJECTIF {line}")
+    if over_target:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Export du jeu de données de démonstration (ou d'un scénario) au format attendu par utils.data_sources.
+
+Sert de modèle pour l'export du Google Sheet du projet : une table par fichier
+CSV, par feuille Excel ou par table SQLite, avec les colonnes de utils.project_model.
+
+Usage :
+    python scripts/export_data.py data/jamais_seul            # dossier de CSV
+    python scripts/export_data.py data/jamais_seul.xlsx       # classeur (openpyxl)
+    python scripts/export_data.py data/jamais_seul.sqlite
+    python scripts/export_data.py data/multi_sites.sqlite --scenario periods=40,budget_lines=300,tasks=3000
+    JAMAIS_SEUL_DATA=data/jamais_seul.sqlite streamlit run Accueil.py
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.data_sources import open_data_source  # noqa: E402
+from utils.demo_data import demo_tables  # noqa: E402
+from utils.scenarios import parse_scenario, scenario_tables  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("target", help="dossier (CSV), fichier .xlsx ou .sqlite")
+    parser.add_argument("--scenario", metavar="PARAMS",
+                        help="scénario synthétique au lieu de la démo, ex: periods=40,tasks=3000,seed=1")
+    args = parser.parse_args()
+
+    source = open_data_source(args.target)
+    tables = scenario_tables(**parse_scenario(args.scenario)) if args.scenario else demo_tables()
+    source.write(tables)
+    print(f"{len(tables)} tables exportées vers {args.target} ({type(source).__name__})")
+
+
+if __name__ == "__main__":
+    main()
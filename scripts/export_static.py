@@ -0,0 +1,110 @@
+"""Export de la page d'accueil en site statique autonome.
+
+Rend une fois Accueil.py (sections de utils/landing.py) en dist/site/index.html,
+avec le CSS et les images hachées de static/, pour qu'un simple serveur de
+fichiers ou un CDN serve la page sans processus Python par visiteur. Les liens
+"Projet Jamais Seul" pointent vers l'application Streamlit.
+
+Usage :
+    python scripts/export_static.py --dashboard-url https://jamais-seul.streamlit.app/Jamais_Seul
+"""
+import argparse
+import re
+import shutil
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import landing, theme  # noqa: E402
+from utils.assets import (  # noqa: E402
+    HASHED_DIR_NAME, OPTIMIZED_DIR_NAME, ROOT_DIR, STATIC_DIR, asset_url, get_asset_manifest, img_tag
+)
+
+# Styles de base que Streamlit fournit d'habitude : colonnes et conteneur principal
+EXPORT_STYLE = """
+<style>
+    *, *::before, *::after { box-sizing: border-box; }
+    body { margin: 0; }
+    img { max-width: 100%; height: auto; }
+    .main > .block-container { margin: 20px auto; }
+    .landing-row { display: flex; flex-wrap: wrap; gap: 1rem; }
+    .landing-column { flex: 1; min-width: 250px; }
+</style>
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="icon" href="{icon}">
+{style}
+{export_style}
+</head>
+<body>
+<div class="main">
+<div class="block-container">
+{body}
+</div>
+</div>
+</body>
+</html>
+"""
+
+
+def export_site(output_dir, dashboard_url):
+    """Write index.html and the hashed assets to output_dir and return the index path"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    get_asset_manifest()
+
+    def image(file_path, **attrs):
+        return img_tag(file_path, base_url=".", **attrs)
+
+    html = PAGE_TEMPLATE.format(
+        title=landing.PAGE_TITLE,
+        icon=asset_url("assets/images/logo-icone.png", base_url=".") or "",
+        style=theme.fonts_html(base_url=".") + "\n" + theme.stylesheet_html("landing", base_url="."),
+        export_style=EXPORT_STYLE.strip(),
+        body=landing.render_body(image, dashboard_url),
+    )
+
+    # Copier uniquement les fichiers hachés référencés par la page
+    folders = "|".join((HASHED_DIR_NAME, OPTIMIZED_DIR_NAME, theme.CSS_STATIC_DIR_NAME))
+    referenced = re.findall(r"\./((?:%s)/[^\s\"]+)" % folders, html)
+    for relative_path in sorted(set(referenced)):
+        target = output_dir / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(STATIC_DIR / relative_path, target)
+
+    index_path = output_dir / "index.html"
+    index_path.write_text(html, encoding="utf-8")
+    return index_path
+
+
+def absolute_url(value):
+    """Argparse type: an absolute http(s) URL, the exported page being served from another host"""
+    url = urlparse(value)
+    if url.scheme not in ("http", "https") or not url.netloc:
+        raise argparse.ArgumentTypeError(f"{value!r} : URL absolue attendue (https://hôte/Jamais_Seul)")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=str(ROOT_DIR / "dist" / "site"))
+    parser.add_argument("--dashboard-url", type=absolute_url, required=True,
+                        help="URL absolue du tableau de bord Streamlit (le chemin relatif "
+                             f"{landing.DASHBOARD_URL} ne vaut que sur l'application)")
+    args = parser.parse_args()
+
+    index_path = export_site(args.output, args.dashboard_url)
+    size = sum(f.stat().st_size for f in index_path.parent.rglob("*") if f.is_file())
+    print(f"Page exportée : {index_path} ({size / 1024:.0f} Ko avec les images)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Test de charge local : sessions simultanées du tableau de bord sur 1, 2... N workers.
+
+Chaque utilisateur simulé ouvre une websocket Streamlit (/_stcore/stream),
+affiche le tableau de bord puis change de période en boucle, comme avec le
+curseur (rerun du fragment de période). Le script mesure le débit (reruns par
+seconde) et la latence des reruns. Avec --scaling, il lance lui-même les workers
+(scripts/serve_workers.py) pour chaque nombre demandé et compare les débits :
+le gain attendu est proche du nombre de workers tant qu'il reste des cœurs libres.
+
+Les utilisateurs sont répartis sur les workers comme le ferait le proxy à
+sessions collantes : un utilisateur garde son worker. Avec --url, la charge
+passe par un proxy ou des workers déjà lancés (le cookie de session collante
+est envoyé).
+
+Client websocket : le paquet websockets (>= 14 pour additional_headers), déjà
+installé avec Streamlit et listé dans requirements.txt.
+
+Usage :
+    python scripts/load_test.py --scaling 1,2,4 --users 16 --duration 20
+    python scripts/load_test.py --url ws://localhost:8080 --users 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.serve_workers import STICKY_COOKIE, start_workers, stop_workers  # noqa: E402
+
+DEFAULT_OUTPUT = Path("dist/benchmarks/load_test.json")
+DASHBOARD_PAGE = "Jamais_Seul"
+PERIOD_SLIDER_KEY = "sidebar-period-selector"
+RERUN_TIMEOUT = 120
+
+
+class DashboardSession:
+    """One simulated user: a Streamlit websocket session on the dashboard page"""
+
+    def __init__(self, url, user):
+        self.url = url.rstrip("/") + "/_stcore/stream"
+        self.user = user
+        self.slider = None  # (id du widget, id du fragment, options)
+
+    async def _rerun(self, websocket, widget_states=None, fragment_id=""):
+        back = BackMsg()
+        client_state = back.rerun_script
+        client_state.SetInParent()
+        client_state.page_name = DASHBOARD_PAGE
+        client_state.fragment_id = fragment_id
+        for widget_id, value in (widget_states or {}).items():
+            widget = client_state.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.string_array_value.data.extend([value])
+        start = time.perf_counter()
+        await websocket.send(back.SerializeToString())
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(await asyncio.wait_for(websocket.recv(), RERUN_TIMEOUT))
+            kind = message.WhichOneof("type")
+            if kind == "delta" and message.delta.WhichOneof("type") == "new_element":
+                element = message.delta.new_element
+                inner = getattr(element, element.WhichOneof("type"))
+                if PERIOD_SLIDER_KEY in getattr(inner, "id", ""):
+                    self.slider = (inner.id, message.delta.fragment_id, list(inner.options))
+            elif kind == "script_finished":
+                return (time.perf_counter() - start) * 1000
+
+    async def run(self, deadline, latencies):
+        """Open the dashboard, then change the period until the deadline; return the rerun count"""
+        cookie = {"Cookie": f"{STICKY_COOKIE}=user-{self.user}"}
+        async with websockets.connect(self.url, max_size=None, additional_headers=cookie) as websocket:
+            latencies["open"].append(await self._rerun(websocket))
+            if self.slider is None:
+                raise RuntimeError("period slider not found in the dashboard page")
+            widget_id, fragment_id, options = self.slider
+            reruns = 0
+            while time.monotonic() < deadline:
+                period = random.choice(options)
+                latencies["period"].append(await self._rerun(websocket, {widget_id: period}, fragment_id))
+                reruns += 1
+            return reruns
+
+
+async def run_load(urls, users, duration):
+    """Run users sessions spread over urls for duration seconds and summarize throughput and latency"""
+    # Premier affichage de chaque worker (imports, figures) hors mesure
+    await asyncio.gather(*(DashboardSession(url, f"warmup-{i}").run(0, {"open": []}) for i, url in enumerate(urls)))
+
+    latencies = {"open": [], "period": []}
+    sessions = [DashboardSession(urls[user % len(urls)], user) for user in range(users)]
+    start = time.monotonic()
+    deadline = start + duration
+    reruns = await asyncio.gather(*(session.run(deadline, latencies) for session in sessions))
+    elapsed = time.monotonic() - start
+
+    def percentile(values, q):
+        return round(statistics.quantiles(values, n=100)[q - 1], 1) if len(values) > 1 else None
+
+    return {
+        "users": users,
+        "targets": len(urls),
+        "duration_s": round(elapsed, 1),
+        "reruns": sum(reruns),
+        "reruns_per_s": round(sum(reruns) / elapsed, 1),
+        "open_median_ms": round(statistics.median(latencies["open"]), 1),
+        "period_median_ms": round(statistics.median(latencies["period"]), 1) if latencies["period"] else None,
+        "period_p95_ms": percentile(latencies["period"], 95),
+    }
+
+
+def print_result(label, result, reference=None):
+    line = (f"  {label:<12} {result['reruns_per_s']:>7.1f} reruns/s  période médiane {result['period_median_ms']} ms"
+            f"  p95 {result['period_p95_ms']} ms  ouverture {result['open_median_ms']} ms")
+    if reference:
+        speedup = result["reruns_per_s"] / reference["reruns_per_s"]
+        line += f"  x{speedup:.2f} (efficacité {speedup / result['targets']:.0%})"
+    print(line, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", action="append", help="websocket d'un proxy ou d'un worker (ws://hôte:port), répétable")
+    parser.add_argument("--scaling", help="nombres de workers à lancer et comparer, ex : 1,2,4")
+    parser.add_argument("--users", type=int, default=8, help="utilisateurs simultanés (défaut : 8)")
+    parser.add_argument("--duration", type=float, default=20, help="durée de chaque mesure en secondes (défaut : 20)")
+    parser.add_argument("--base-port", type=int, default=8701, help="port du premier worker lancé (défaut : 8701)")
+    parser.add_argument("--data", default=os.environ.get("JAMAIS_SEUL_DATA", ""),
+                        help="source de données (voir JAMAIS_SEUL_DATA)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="fichier JSON des résultats")
+    args = parser.parse_args()
+    if not args.url and not args.scaling:
+        parser.error("--url ou --scaling est requis")
+
+    results = {"meta": {"cpu_count": os.cpu_count(), "users": args.users, "data": args.data}, "runs": {}}
+    print(f"{args.users} utilisateurs, {args.duration:.0f} s par mesure, {os.cpu_count()} cœur(s)")
+    if args.url:
+        result = asyncio.run(run_load(args.url, args.users, args.duration))
+        results["runs"]["url"] = result
+        print_result("url", result)
+    else:
+        reference = None
+        for count in [int(value) for value in args.scaling.split(",")]:
+            workers, _ = start_workers(count, args.base_port, spec=args.data,
+                                       shared_path=Path("dist/cache/load_test.sqlite"), quiet=True)
+            try:
+                urls = [f"ws://127.0.0.1:{port}" for port in workers]
+                result = asyncio.run(run_load(urls, args.users, args.duration))
+            finally:
+                stop_workers(workers)
+            reference = reference or result
+            results["runs"][f"{count}_workers"] = result
+            print_result(f"{count} worker(s)", result, reference)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Étape de build hors-ligne : variantes redimensionnées des images de assets/images.
+
+Pour chaque image, génère des versions 1x et 2x de sa largeur d'affichage en
+AVIF (si Pillow le supporte), WebP et en format de repli (JPEG, ou PNG pour les
+images avec transparence), puis écrit static/optimized/manifest.json que
+utils.assets.img_tag utilise pour produire des balises <picture>/srcset.
+
+Usage :
+    python scripts/optimize_images.py
+"""
+import argparse
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image, features
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.assets import (  # noqa: E402
+    ASSETS_DIR, HASH_LENGTH, MANIFEST_NAME, OPTIMIZED_DIR_NAME, STATIC_DIR
+)
+
+# Largeur d'affichage (en px CSS) de chaque image sur la page d'accueil
+DISPLAY_WIDTHS = {
+    "logo.png": 60,
+    "course.jpg": 400,
+    "ateliers.jpg": 400,
+    "rencontres.jpg": 400,
+    "affiche.png": 800,
+    "AXA_Logo.png": 150,
+    "Logo-bureau-vallee-2021.png": 150,
+    "logo-cave.jpg": 150,
+    "logo-joseph.png": 150,
+    "logo-Leclerc.jpg": 150,
+    "Logo-Sodebo.png": 150,
+}
+DENSITIES = (1, 2)
+
+QUALITY = {"AVIF": 55, "WEBP": 80, "JPEG": 82}
+MIME_TYPES = {"AVIF": "image/avif", "WEBP": "image/webp", "JPEG": "image/jpeg", "PNG": "image/png"}
+EXTENSIONS = {"AVIF": ".avif", "WEBP": ".webp", "JPEG": ".jpg", "PNG": ".png"}
+
+
+def has_alpha(image):
+    """Return True when the image uses transparency"""
+    if image.mode in ("RGBA", "LA"):
+        return image.getchannel("A").getextrema()[0] < 255
+    return image.mode == "P" and "transparency" in image.info
+
+
+def encode(image, image_format):
+    """Encode an image in memory and return the bytes"""
+    buffer = io.BytesIO()
+    options = {"optimize": True} if image_format in ("JPEG", "PNG") else {}
+    if image_format in QUALITY:
+        options["quality"] = QUALITY[image_format]
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def optimize_image(source, display_width, target_dir):
+    """Write every variant of one image and return its manifest entry"""
+    with Image.open(source) as original:
+        original.load()
+        transparent = has_alpha(original)
+        image = original.convert("RGBA" if transparent else "RGB")
+
+    fallback = "PNG" if transparent else "JPEG"
+    formats = (["AVIF"] if features.check("avif") else []) + ["WEBP", fallback]
+    display_width = min(display_width, image.width)
+    display_height = round(image.height * display_width / image.width)
+
+    sources = {MIME_TYPES[image_format]: [] for image_format in formats}
+    written_widths = set()
+    for density in DENSITIES:
+        width = min(display_width * density, image.width)
+        if width in written_widths:
+            continue  # Pas d'agrandissement au-delà de l'original
+        written_widths.add(width)
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.LANCZOS)
+
+        for image_format in formats:
+            content = encode(resized, image_format)
+            digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+            name = f"{source.stem}-{width}w.{digest}{EXTENSIONS[image_format]}"
+            (target_dir / name).write_bytes(content)
+            sources[MIME_TYPES[image_format]].append([f"{OPTIMIZED_DIR_NAME}/{name}", density])
+
+    return {
+        "width": display_width,
+        "height": display_height,
+        "fallback": MIME_TYPES[fallback],
+        "sources": sources,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--static-dir", default=str(STATIC_DIR))
+    args = parser.parse_args()
+
+    target_dir = Path(args.static_dir) / OPTIMIZED_DIR_NAME
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for old in target_dir.iterdir():
+        old.unlink()
+
+    images_dir = ASSETS_DIR / "images"
+    manifest = {}
+    for file_name, display_width in DISPLAY_WIDTHS.items():
+        source = images_dir / file_name
+        if not source.exists():
+            print(f"Warning: Image not found at {source}")
+            continue
+        key = f"{ASSETS_DIR.name}/images/{file_name}"
+        manifest[key] = optimize_image(source, display_width, target_dir)
+        webp_1x = manifest[key]["sources"]["image/webp"][0][0]
+        size = (Path(args.static_dir) / webp_1x).stat().st_size
+        print(f"{file_name}: {source.stat().st_size / 1024:.0f} Ko -> {size / 1024:.0f} Ko (WebP 1x)")
+
+    with open(target_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Lance N workers Streamlit derrière un reverse proxy à sessions collantes, avec un cache partagé sur disque.
+
+Un processus Streamlit n'utilise qu'un cœur pour exécuter les scripts et ses
+caches meurent avec lui. Ce lanceur démarre un worker par cœur (un port chacun),
+tous branchés sur la même base de cache (utils/shared_cache.py), la préchauffe
+avec les données du projet et les vues par période, puis redémarre un worker qui
+s'arrête : il repart avec le cache des autres.
+
+Une session Streamlit vit dans le worker qui a ouvert sa websocket : le proxy
+doit renvoyer chaque navigateur vers le même worker. --nginx-config écrit une
+configuration nginx qui le fait par cookie.
+
+Usage :
+    python scripts/serve_workers.py --workers 4 --nginx-config dist/deploy/nginx.conf
+    nginx -p "$PWD" -c dist/deploy/nginx.conf     # http://localhost:8080
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.data_cache import data_cache  # noqa: E402
+from utils.data_sources import ProjectDataLoader, open_data_source  # noqa: E402
+from utils.period_views import stored_period_views  # noqa: E402
+from utils.shared_cache import SHARED_CACHE_ENV_VAR, SharedCache  # noqa: E402
+
+DEFAULT_SHARED_CACHE = ROOT_DIR / "dist" / "cache" / "shared.sqlite"
+STICKY_COOKIE = "jamais_seul_worker"
+STARTUP_TIMEOUT = 60
+
+NGINX_TEMPLATE = """\
+# Généré par scripts/serve_workers.py : {workers} workers Streamlit, sessions collantes par cookie
+worker_processes auto;
+pid dist/deploy/nginx.pid;
+error_log dist/deploy/nginx-error.log;
+events {{ worker_connections 4096; }}
+
+http {{
+    access_log off;
+
+    # Premier passage : un identifiant aléatoire, renvoyé ensuite par le navigateur
+    map $cookie_{cookie} $sticky_key {{
+        "" $request_id;
+        default $cookie_{cookie};
+    }}
+    map $http_upgrade $connection_upgrade {{
+        default upgrade;
+        "" close;
+    }}
+
+    upstream streamlit_workers {{
+        hash $sticky_key consistent;
+{servers}
+    }}
+
+    server {{
+        listen {listen};
+
+        location / {{
+            proxy_pass http://streamlit_workers;
+            proxy_http_version 1.1;
+            proxy_set_header Host $host;
+            proxy_set_header Upgrade $http_upgrade;
+            proxy_set_header Connection $connection_upgrade;
+            proxy_read_timeout 86400;
+            proxy_buffering off;
+            add_header Set-Cookie "{cookie}=$sticky_key; Path=/; HttpOnly; SameSite=Lax";
+        }}
+    }}
+}}
+"""
+
+
+def nginx_config(ports, address="127.0.0.1", listen=8080):
+    """Return an nginx configuration balancing the workers with cookie-based sticky sessions"""
+    servers = "\n".join(f"        server {address}:{port};" for port in ports)
+    return NGINX_TEMPLATE.format(workers=len(ports), cookie=STICKY_COOKIE, servers=servers, listen=listen)
+
+
+def warm_shared_cache(shared, spec):
+    """Store the project data and the period views in the shared cache before the workers start"""
+    data = ProjectDataLoader(open_data_source(spec), caches=(shared, data_cache), cache_key=spec).load()
+    stored_period_views((shared, data_cache), data)
+    return data
+
+
+def start_worker(port, address="127.0.0.1", env=None, quiet=False):
+    """Start one Streamlit worker serving the whole app on a port (quiet: discard its logs)"""
+    output = subprocess.DEVNULL if quiet else None
+    return subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "Accueil.py",
+         "--server.port", str(port), "--server.address", address, "--server.headless", "true",
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=output,
+        stderr=output,
+    )
+
+
+def wait_until_healthy(port, address="127.0.0.1", timeout=STARTUP_TIMEOUT):
+    """Wait for the health endpoint of a worker, raise TimeoutError after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://{address}:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"worker on port {port} not healthy after {timeout} s")
+
+
+def start_workers(count, base_port, address="127.0.0.1", shared_path=DEFAULT_SHARED_CACHE, spec="",
+                  keep_cache=False, quiet=False):
+    """Prepare the shared cache and start count workers; return ({port: process}, env) once all are healthy"""
+    shared = SharedCache(shared_path)
+    if not keep_cache:
+        # Entrées d'un déploiement précédent : le code a pu changer
+        shared.clear()
+    start = time.perf_counter()
+    warm_shared_cache(shared, spec)
+    print(f"Cache partagé {shared_path} préchauffé en {(time.perf_counter() - start) * 1000:.0f} ms", flush=True)
+
+    env = {**os.environ, SHARED_CACHE_ENV_VAR: str(shared_path), "JAMAIS_SEUL_DATA": spec}
+    workers = {port: start_worker(port, address, env, quiet) for port in range(base_port, base_port + count)}
+    try:
+        for port in workers:
+            wait_until_healthy(port, address)
+    except TimeoutError:
+        stop_workers(workers)
+        raise
+    return workers, env
+
+
+def stop_workers(workers):
+    """Terminate every worker and wait for them"""
+    for process in workers.values():
+        if process.poll() is None:
+            process.terminate()
+    for process in workers.values():
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="nombre de workers (défaut : un par cœur)")
+    parser.add_argument("--base-port", type=int, default=8601, help="port du premier worker (défaut : 8601)")
+    parser.add_argument("--address", default="127.0.0.1")
+    parser.add_argument("--data", default=os.environ.get("JAMAIS_SEUL_DATA", ""),
+                        help="source de données (voir JAMAIS_SEUL_DATA)")
+    parser.add_argument("--shared-cache", type=Path, default=DEFAULT_SHARED_CACHE, help="base SQLite du cache partagé")
+    parser.add_argument("--keep-cache", action="store_true", help="garder les entrées d'un lancement précédent")
+    parser.add_argument("--nginx-config", type=Path, help="écrire la configuration nginx des workers dans ce fichier")
+    parser.add_argument("--listen", type=int, default=8080, help="port public du proxy (défaut : 8080)")
+    args = parser.parse_args()
+
+    ports = list(range(args.base_port, args.base_port + args.workers))
+    if args.nginx_config:
+        args.nginx_config.parent.mkdir(parents=True, exist_ok=True)
+        args.nginx_config.write_text(nginx_config(ports, args.address, args.listen), encoding="utf-8")
+        print(f"Configuration nginx écrite dans {args.nginx_config}")
+
+    workers, env = start_workers(args.workers, args.base_port, args.address, args.shared_cache, args.data,
+                                 args.keep_cache)
+    print(f"{len(workers)} workers prêts : " + ", ".join(f"http://{args.address}:{port}" for port in workers))
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            time.sleep(1)
+            for port, process in workers.items():
+                if process.poll() is not None:
+                    print(f"Worker {port} arrêté (code {process.returncode}), redémarrage")
+                    workers[port] = start_worker(port, args.address, env)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        stop_workers(workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Petit serveur sidecar pour le dossier static/ avec des en-têtes de cache longue durée.
+
+Le serveur statique de Streamlit ne pose pas de Cache-Control sur app/static/,
+les navigateurs revalident donc chaque image. Les fichiers de static/hashed/
+changent de nom quand leur contenu change : on peut les marquer immutables.
+
+Usage :
+    python scripts/static_server.py --port 8502
+    STATIC_BASE_URL=http://localhost:8502 streamlit run Accueil.py
+"""
+import argparse
+import sys
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.assets import HASHED_NAME_PATTERN, STATIC_DIR, build_asset_manifest  # noqa: E402
+
+ONE_YEAR = 365 * 24 * 3600
+
+
+class CachingStaticHandler(SimpleHTTPRequestHandler):
+    """Serve static/ with immutable caching for content-hashed files"""
+
+    def end_headers(self):
+        file_name = self.path.split("?", 1)[0].rsplit("/", 1)[-1]
+        if HASHED_NAME_PATTERN.match(file_name):
+            self.send_header("Cache-Control", f"public, max-age={ONE_YEAR}, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--directory", default=str(STATIC_DIR))
+    args = parser.parse_args()
+
+    manifest = build_asset_manifest(static_dir=Path(args.directory))
+    print(f"{len(manifest)} fichiers publiés dans {args.directory}")
+
+    handler = partial(CachingStaticHandler, directory=args.directory)
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Serveur statique sur http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Étape de build hors-ligne : sous-ensembles woff2 des polices de la page d'accueil.
+
+Réduit chaque police déclarée dans utils.theme.FONTS aux glyphes de
+FONT_UNICODE_RANGES (Latin-1 et caractères du français) et l'écrit en woff2
+dans assets/fonts/. Les polices sources (licence OFL) se téléchargent depuis
+https://github.com/google/fonts (ofl/anton, ofl/montserrat).
+
+Nécessite fontTools et brotli (pip install fonttools brotli).
+
+Usage :
+    python scripts/subset_fonts.py Anton=Anton-Regular.ttf "Montserrat=Montserrat[wght].ttf"
+"""
+import argparse
+import io
+import sys
+from pathlib import Path
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+from fontTools.varLib import instancer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.theme import FONT_UNICODE_RANGES, FONTS, FONTS_DIR  # noqa: E402
+
+
+def parse_weight_range(weight):
+    """Turn a CSS font-weight ("400" or "300 700") into a (min, max) tuple"""
+    values = [int(value) for value in weight.split()]
+    return values[0], values[-1]
+
+
+def subset_font(source, font, target_dir):
+    """Write the woff2 subset of one font and return its path"""
+    ttfont = TTFont(source)
+    if "fvar" in ttfont:
+        # Police variable : ne garder que la plage de graisses utilisée par la page
+        ttfont = instancer.instantiateVariableFont(ttfont, {"wght": parse_weight_range(font["weight"])})
+        # Relire l'instance : le sous-ensemble échoue sur les tables gvar recalculées en mémoire
+        stream = io.BytesIO()
+        ttfont.save(stream)
+        stream.seek(0)
+        ttfont = TTFont(stream)
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "ccmp", "locl", "mark", "mkmk"]
+    options.name_IDs = [0, 1, 2, 3, 4, 5, 6]
+    options.notdef_outline = True
+    options.hinting = False
+
+    unicodes = [code for start, end in FONT_UNICODE_RANGES for code in range(start, end + 1)]
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(ttfont)
+
+    target = Path(target_dir) / font["file"]
+    target.parent.mkdir(parents=True, exist_ok=True)
+    subset.save_font(ttfont, str(target), options)
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="+", metavar="FAMILLE=FICHIER",
+                        help="police source de chaque famille de utils.theme.FONTS")
+    parser.add_argument("--output", default=str(FONTS_DIR))
+    args = parser.parse_args()
+
+    fonts = {font["family"]: font for font in FONTS}
+    for argument in args.sources:
+        family, _, source = argument.partition("=")
+        if family not in fonts or not source:
+            parser.error(f"{argument!r} : attendu FAMILLE=FICHIER avec FAMILLE parmi {', '.join(fonts)}")
+        target = subset_font(source, fonts[family], args.output)
+        print(f"{family}: {Path(source).stat().st_size / 1024:.0f} Ko -> {target.stat().st_size / 1024:.0f} Ko ({target.name})")
+
+
+if __name__ == "__main__":
+    main()
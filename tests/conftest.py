@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.data_sources import DemoSource, ProjectDataLoader  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def demo_data():
+    """Demo project data, read without the on-disk and shared caches"""
+    return ProjectDataLoader(DemoSource()).load()
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from utils import budget_simulation
+from utils.budget_simulation import (CONTINGENCY_CATEGORY, category_estimates, simulate_budget, simulate_totals,
+                                     summarize_simulation)
+from utils.earned_value import compute_earned_value
+
+PERIOD = "S8"
+
+
+@pytest.fixture(scope="module")
+def estimates(demo_data):
+    return category_estimates(compute_earned_value(demo_data), PERIOD)
+
+
+def test_quantiles_are_ordered(demo_data):
+    simulation = simulate_budget(demo_data, PERIOD, draws=20_000)
+    p50, p80, p95 = (summarize_simulation(simulation, confidence)["total_at_confidence"]
+                     for confidence in (0.5, 0.8, 0.95))
+    assert p50 <= p80 <= p95
+    assert p50 < p95
+
+
+def test_correlation_widens_the_spread(estimates):
+    _, _, spent, remaining, _ = estimates
+    independent = simulate_totals(spent, remaining, 20_000, uncertainty=0.2, correlation=0.0)
+    correlated = simulate_totals(spent, remaining, 20_000, uncertainty=0.2, correlation=1.0)
+    assert correlated.std() > 1.5 * independent.std()
+
+
+@pytest.mark.parametrize("correlation", [0.0, 0.3])
+def test_chunks_give_the_same_draws(estimates, monkeypatch, correlation):
+    _, _, spent, remaining, _ = estimates
+    whole = simulate_totals(spent, remaining, 5_000, 0.2, correlation)
+    monkeypatch.setattr(budget_simulation, "CHUNK_ELEMENTS", 7 * len(remaining))
+    chunked = simulate_totals(spent, remaining, 5_000, 0.2, correlation)
+    np.testing.assert_allclose(chunked, whole)
+
+
+def test_contingency_is_a_reserve_not_a_risk_line(demo_data, estimates):
+    categories, bac, _, remaining, reserve = estimates
+    assert [category for category, is_reserve in zip(categories, reserve) if is_reserve] == [CONTINGENCY_CATEGORY]
+    assert remaining[reserve].sum() == 0
+    simulation = simulate_budget(demo_data, PERIOD)
+    assert simulation["reserve"] == bac[reserve].sum()
+    assert simulation["base_budget"] == bac[~reserve].sum()
+
+    # Doubler la réserve ne change pas le coût final simulé, seulement la réserve disponible
+    budget = demo_data.budget.reset_index()
+    contingency = budget["category"] == CONTINGENCY_CATEGORY
+    budget.loc[contingency, "valide"] *= 2
+    doubled = simulate_budget(demo_data.with_tables(budget=budget), PERIOD)
+    np.testing.assert_allclose(doubled["totals"], simulation["totals"])
+    assert doubled["reserve"] == 2 * simulation["reserve"]
@@ -0,0 +1,65 @@
+import base64
+import copyreg
+from types import MappingProxyType
+
+from utils.assets import Base64Cache
+from utils.data_cache import DataCache
+from utils.period_views import build_all_period_views
+from utils.shared_cache import SharedCache
+
+
+def test_caches_round_trip_frozen_views(tmp_path, demo_data):
+    views = build_all_period_views(demo_data)
+    for cache in (DataCache(tmp_path / "data"), SharedCache(tmp_path / "shared.sqlite")):
+        cache.set_object("period_views", "key", views)
+        loaded = cache.get_object("period_views", "key")
+        assert isinstance(loaded, MappingProxyType)
+        assert loaded.keys() == views.keys()
+    # Le réducteur est propre aux Pickler des caches
+    assert MappingProxyType not in copyreg.dispatch_table
+
+
+def test_unpicklable_value_is_not_stored(tmp_path):
+    cache = DataCache(tmp_path)
+    cache.set_object("period_views", "key", {"callback": lambda: None})
+    assert cache.get_object("period_views", "key") is None
+    assert cache.stats()["writes"] == 0
+
+
+def test_base64_cache_follows_file_changes(tmp_path):
+    image = tmp_path / "logo.png"
+    image.write_bytes(b"first")
+    cache = Base64Cache(max_bytes=1024)
+    first = cache.get(image)
+    assert cache.get(image) == first
+    image.write_bytes(b"second version")
+    assert cache.get(image) == base64.b64encode(b"second version").decode()
+    assert cache.stats()["entries"] == 1
+
+
+def test_base64_cache_evicts_least_recently_used(tmp_path):
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(bytes(30))  # 40 caractères en base64
+        paths.append(path)
+    cache = Base64Cache(max_bytes=100)
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])  # b devient le moins récemment lu
+    cache.get(paths[2])
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] == 80
+    misses = stats["misses"]
+    cache.get(paths[0])
+    assert cache.stats()["misses"] == misses
+    cache.get(paths[1])
+    assert cache.stats()["misses"] == misses + 1
+
+
+def test_base64_cache_never_keeps_a_file_over_budget(tmp_path):
+    large = tmp_path / "large.png"
+    large.write_bytes(bytes(300))
+    cache = Base64Cache(max_bytes=100)
+    assert cache.get(large) == base64.b64encode(bytes(300)).decode()
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
@@ -0,0 +1,55 @@
+import os
+
+from utils.data_sources import TABLE_NAMES, CsvSource, DemoSource, ProjectDataLoader
+
+
+class MissingReaderSource(DemoSource):
+    """Demo source whose tables change but cannot be read anymore, like a workbook without openpyxl"""
+
+    def __init__(self):
+        super().__init__()
+        self.broken = False
+
+    def signatures(self, tables):
+        return {name: int(self.broken) for name in tables}
+
+    def read(self, tables):
+        if self.broken:
+            raise ImportError("Missing optional dependency 'openpyxl'")
+        return super().read(tables)
+
+
+def test_reload_keeps_last_data_when_reader_is_missing():
+    source = MissingReaderSource()
+    loader = ProjectDataLoader(source)
+    data = loader.load()
+    source.broken = True
+    assert loader.load() is data
+    assert loader.reads == {name: 1 for name in TABLE_NAMES}
+
+
+def test_cache_key_follows_the_file_content(tmp_path):
+    source = CsvSource(tmp_path)
+    source.write(DemoSource().read(TABLE_NAMES))
+    loader = ProjectDataLoader(source)
+    key = loader._cache_key()
+    budget = source.path("budget")
+    # Même contenu, autre date : même clé
+    os.utime(budget, ns=(0, 0))
+    assert loader._cache_key() == key
+    budget.write_text(budget.read_text() + "\n")
+    assert loader._cache_key() != key
+
+
+def test_reload_keeps_last_data_when_a_table_is_malformed(tmp_path):
+    source = CsvSource(tmp_path)
+    source.write(DemoSource().read(TABLE_NAMES))
+    loader = ProjectDataLoader(source)
+    data = loader.load()
+    budget = source.path("budget")
+    good = budget.read_text()
+    for broken in (good.replace("period,", "periode,", 1), good.replace(",2000,", ",deux mille,", 1)):
+        budget.write_text(broken)
+        assert loader.load() is data
+    budget.write_text(good.replace(",2000,", ",2100,", 1))
+    assert loader.load() is not data
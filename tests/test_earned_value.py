@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.earned_value import CPI_ALERT, TOTAL, compute_earned_value
+
+
+@pytest.fixture(scope="module")
+def evm(demo_data):
+    return compute_earned_value(demo_data)
+
+
+def test_values_follow_budget_and_progress(demo_data, evm):
+    budget = demo_data.budget
+    bac = budget["valide"].unstack("category")
+    ac = budget["depense"].unstack("category")
+    progress = demo_data.progress / 100
+    np.testing.assert_allclose(evm["bac"].drop(columns=TOTAL), bac)
+    np.testing.assert_allclose(evm["ac"].drop(columns=TOTAL), ac)
+    np.testing.assert_allclose(evm["ev"].to_numpy(), evm["bac"].to_numpy() * progress.to_numpy()[:, None])
+    np.testing.assert_allclose(evm["pv"].to_numpy(),
+                               evm["bac"].to_numpy() * evm["planned_progress"].to_numpy()[:, None])
+    np.testing.assert_allclose(evm["bac"][TOTAL], bac.sum(axis=1))
+    assert evm["planned_progress"].is_monotonic_increasing
+    assert evm["planned_progress"].iloc[-1] == 1.0
+
+
+def test_indices_and_estimate_at_completion(evm):
+    np.testing.assert_allclose(evm["cpi"], evm["ev"] / evm["ac"])
+    np.testing.assert_allclose(evm["spi"], evm["ev"] / evm["pv"])
+    np.testing.assert_allclose(evm["eac"], evm["bac"] / evm["cpi"])
+    np.testing.assert_allclose(evm["vac"], evm["bac"] - evm["eac"])
+
+
+def test_communication_overrun_is_flagged(evm):
+    # L'onglet budget affiche un CPI d'environ 0,71 pour la communication
+    assert evm["cpi"].loc["S1", "Communication"] == pytest.approx(0.71, abs=0.005)
+    assert evm["cpi"]["Communication"].max() < CPI_ALERT
+    assert evm["first_alerts"]["Communication"] == "S1"
+    assert "Logistique" not in evm["first_alerts"]
+
+
+def test_zero_actual_cost(demo_data):
+    budget = demo_data.budget.reset_index()
+    budget.loc[budget["period"] == "S1", "depense"] = 0.0
+    evm = compute_earned_value(demo_data.with_tables(budget=budget))
+    s1 = evm["cpi"].loc["S1"]
+    assert s1.isna().all()
+    pd.testing.assert_series_equal(evm["eac"].loc["S1"], evm["bac"].loc["S1"])
+    assert "S1" not in evm["first_alerts"].values()
+
+
+def test_zero_planned_value(demo_data):
+    gantt = pd.DataFrame({"Task": ["1 Préparation"], "Start": ["2025-03-10"], "Finish": ["2025-05-09"],
+                          "Resource": ["Phase 1"], "Level": ["Main"]})
+    evm = compute_earned_value(demo_data.with_tables(gantt=gantt))
+    assert evm["pv"].loc["S1"].eq(0).all()
+    assert evm["spi"].loc["S1"].isna().all()
+    assert evm["spi"].loc["S3"].notna().all()
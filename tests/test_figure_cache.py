@@ -0,0 +1,59 @@
+import json
+
+import plotly.express as px
+import plotly.graph_objects as go
+
+from utils.figure_cache import FigureCache
+from utils.shared_cache import SharedCache
+
+
+def gantt_like_figure():
+    fig = px.bar(x=["Phase 1", "Phase 2"], y=[3, 5], color=["a", "b"], hover_data={"Marge": [0, 2]})
+    fig.add_vline(x=0.5, line_dash="dash")
+    fig.add_annotation(x=1, y=5, text="Jour de la course", showarrow=True)
+    fig.add_shape(type="rect", x0=0, x1=1, y0=0, y1=1, line=dict(color="red"))
+    fig.update_layout(height=300, margin=dict(l=10, r=10, t=10, b=10))
+    return fig
+
+
+def test_cached_figure_matches_the_original(tmp_path):
+    original = gantt_like_figure()
+    for cache in (FigureCache(), FigureCache(shared=SharedCache(tmp_path / "shared.sqlite"))):
+        assert cache.get("gantt", lambda: original) is original
+        cached = cache.get("gantt", gantt_like_figure)
+        assert isinstance(cached, go.Figure) and cached is not original
+        # Même JSON, à l'ordre des clés du layout près
+        assert json.loads(cached.to_json()) == json.loads(original.to_json())
+        assert cache.stats()["hits"] == 1
+
+    # Relue de la base partagée par un autre processus (cache mémoire vide)
+    other_worker = FigureCache(shared=SharedCache(tmp_path / "shared.sqlite"))
+    assert json.loads(other_worker.get("gantt", lambda: None).to_json()) == json.loads(original.to_json())
+
+
+def test_entries_stay_bounded():
+    cache = FigureCache(max_entries=3)
+    builds = []
+
+    def build(name):
+        builds.append(name)
+        return go.Figure(go.Bar(x=[name], y=[1]))
+
+    for name in "abc":
+        cache.get(name, lambda name=name: build(name))
+    cache.get("a", lambda: build("a"))  # a redevient le plus récent
+    cache.get("d", lambda: build("d"))
+    assert cache.stats()["entries"] == 3 and cache.stats()["evictions"] == 1
+    cache.get("a", lambda: build("a"))
+    cache.get("b", lambda: build("b"))
+    assert builds == ["a", "b", "c", "d", "b"]
+
+
+def test_bytes_stay_bounded():
+    figure = go.Figure(go.Bar(x=list(range(50)), y=list(range(50))))
+    size = len(figure.to_json())
+    cache = FigureCache(max_bytes=int(size * 2.5))
+    for key in range(5):
+        cache.get(key, lambda: figure)
+        assert cache.stats()["bytes"] <= cache.max_bytes
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,36 @@
+import pytest
+
+from utils.data_sources import ProjectDataLoader, open_data_source
+from utils.period_views import build_all_period_views, event_period_index
+
+
+def warnings_of(view):
+    return {warning["Risque"][:3] for warning in view["risk_warnings"]}
+
+
+def test_demo_deadlines(demo_data):
+    views = build_all_period_views(demo_data)
+    assert demo_data.periods[event_period_index(demo_data)] == "S11"
+    assert [p for p, _ in views["S1"]["meteo"]["statuses"]] == ["S9", "S10", "S11"]
+    assert "R02" in warnings_of(views["S9"]) and "R02" not in warnings_of(views["S10"])
+    assert [p for p, view in views.items() if "R04" in warnings_of(view)] == ["S9", "S10", "S11"]
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return ProjectDataLoader(open_data_source("scenario:periods=40")).load()
+
+
+def test_scenario_deadlines_follow_the_event(scenario):
+    views = build_all_period_views(scenario)
+    assert len(views) == 40
+    event = event_period_index(scenario)
+    meteo = list(scenario.periods[event - 2:event + 1])
+    assert [p for p, _ in views["S1"]["meteo"]["statuses"]] == meteo
+    assert [p for p, view in views.items() if view["meteo"]["critical"]] == meteo
+    assert [p for p, view in views.items() if "R04" in warnings_of(view)] == meteo
+    # Mesures de prévention : aucune dans la première moitié, toutes en place le jour de l'événement
+    assert views["S20"]["prevention"]["taux"] == 0
+    assert views[scenario.periods[event]]["prevention"]["taux"] == 100
+    assert "R02" in warnings_of(views[scenario.periods[event - 2]])
+    assert "R02" not in warnings_of(views[scenario.periods[event - 1]])
@@ -0,0 +1,31 @@
+import tracemalloc
+
+import pytest
+
+from utils import profiling
+
+
+@pytest.fixture
+def enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv(profiling.PROFILE_ENV_VAR, "1")
+    monkeypatch.setattr(profiling, "PROFILE_TRACE_FILE", tmp_path / "reruns.jsonl")
+
+
+class Placeholder:
+    def container(self):
+        raise AssertionError("a failed fragment is not rendered")
+
+
+def test_failed_fragment_stops_tracing(enabled):
+    with pytest.raises(RuntimeError):
+        with profiling.profiled_fragment("Test", "failing", Placeholder()):
+            assert tracemalloc.is_tracing()
+            raise RuntimeError("fragment failed")
+    assert profiling.current_profiler() is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_abandoned_rerun_stops_tracing(enabled):
+    profiling.start_rerun("Test")
+    profiling.start_rerun("Test").finish()
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,10 @@
+def test_mutating_a_table_leaves_the_shared_model_unchanged(demo_data):
+    versions = dict(demo_data.table_versions)
+    before = demo_data.budget
+    budget = demo_data.budget
+    budget.loc[budget.index[0], "initial"] = -1
+    budget["depense"] = 0.0
+    budget.iloc[1, 1] = -1
+    assert demo_data.budget.equals(before)
+    assert demo_data._tables["budget"].iloc[0]["initial"] != -1
+    assert dict(demo_data.table_versions) == versions
@@ -0,0 +1,34 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from utils.schedule import declared_predecessors, topological_order
+
+
+def tasks(*rows):
+    return pd.DataFrame(rows, columns=["Task", "Predecessors"])
+
+
+def test_parent_reference_is_not_a_self_dependency():
+    predecessors = declared_predecessors(tasks(
+        ("3.1 Lieux", None),
+        ("3.12 Matériel", "3.1"),
+        ("3.13 Installation technique", "3"),
+    ))
+    assert predecessors == ((), (0,), (0, 1))
+    topological_order(predecessors)
+
+
+def test_unknown_reference_warns():
+    with pytest.warns(UserWarning, match="'9.9'"):
+        predecessors = declared_predecessors(tasks(("1.1 Budget", "9.9")))
+    assert predecessors == ((),)
+
+
+def test_cycle_raises():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        predecessors = declared_predecessors(tasks(("1.1 Budget", "1.2"), ("1.2 Sponsors", "1.1")))
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order(predecessors)
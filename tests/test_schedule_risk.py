@@ -0,0 +1,14 @@
+from utils.schedule_risk import simulate_schedule
+
+
+def test_probability_changes_with_uncertainty(demo_data):
+    low = simulate_schedule(demo_data, draws=5_000, uncertainty=0.05)["targets"]["probability"]
+    high = simulate_schedule(demo_data, draws=5_000, uncertainty=0.5)["targets"]["probability"]
+    assert high["Phase 3"] < low["Phase 3"]
+    assert high["Phase 4"] < low["Phase 4"]
+
+
+def test_event_day_task_has_no_variance(demo_data):
+    # Sans aucune incertitude sur les autres tâches, l'événement est toujours à l'heure
+    targets = simulate_schedule(demo_data, draws=2_000, uncertainty=0.0)["targets"]
+    assert targets.loc["Phase 3", "probability"] == 1.0
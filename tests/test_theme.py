@@ -0,0 +1,20 @@
+from utils import theme
+
+
+def test_fonts_are_self_hosted():
+    html = theme.fonts_html(base_url=".")
+    assert "fonts.googleapis.com" not in html
+    assert html.count('rel="preload"') == len(theme.FONTS)
+
+
+def test_fonts_are_inlined_without_static_serving(monkeypatch):
+    monkeypatch.setattr(theme, "asset_url", lambda file_path, base_url=None: None)
+    html = theme.fonts_html()
+    assert html.count("data:font/woff2;base64,") == len(theme.FONTS)
+    assert "fonts.googleapis.com" not in html
+
+
+def test_google_fonts_only_for_a_missing_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(theme, "asset_url", lambda file_path, base_url=None: None)
+    monkeypatch.setattr(theme, "FONTS_DIR", tmp_path)
+    assert "fonts.googleapis.com" in theme.fonts_html()
@@ -0,0 +1,19 @@
+import pandas as pd
+import pytest
+
+from utils.wbs import WBSTree
+
+
+def gantt(*tasks):
+    return pd.DataFrame({"Task": tasks, "Start": "2025-03-03", "Finish": "2025-03-04"})
+
+
+def test_completion_rolls_up_to_the_phase():
+    tree = WBSTree.from_gantt(gantt("1 Préparation", "1.1 Budget", "1.2 Sponsors"))
+    tree.set_completion("1.1", 1.0)
+    assert tree.completion("1") == 0.5
+
+
+def test_duplicate_numbers_are_rejected():
+    with pytest.raises(ValueError, match="1.1"):
+        WBSTree.from_gantt(gantt("1 Préparation", "1.1 Budget", "1.1 Sponsors"))
@@ -0,0 +1 @@
+"""Modules partagés entre la page d'accueil et le tableau de bord Jamais Seul."""
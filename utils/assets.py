@@ -0,0 +1,254 @@
+"""Pipeline des fichiers statiques : copies hachées de assets/ servies en fichiers statiques"""
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+ASSETS_DIR = ROOT_DIR / "assets"
+STATIC_DIR = ROOT_DIR / "static"
+
+# Sous-dossier de static/ qui reçoit les copies hachées (ex: images/logo.3f2a9c1b07.png)
+HASHED_DIR_NAME = "hashed"
+# Sous-dossier produit par scripts/optimize_images.py (variantes 1x/2x WebP/AVIF)
+OPTIMIZED_DIR_NAME = "optimized"
+MANIFEST_NAME = "manifest.json"
+
+# URL publique du dossier static/. Streamlit le sert sous "app/static" quand
+# server.enableStaticServing est actif ; pour des en-têtes de cache longue durée,
+# pointer STATIC_BASE_URL vers le sidecar (scripts/static_server.py) ou un CDN.
+STATIC_BASE_URL = os.environ.get("STATIC_BASE_URL", "app/static").rstrip("/")
+
+# Budget mémoire du cache base64 partagé par toutes les sessions du processus
+BASE64_CACHE_MAX_BYTES = int(os.environ.get("BASE64_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+HASH_LENGTH = 10
+HASHED_NAME_PATTERN = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{%d}(?P<suffix>\.[^.]+)$" % HASH_LENGTH)
+
+
+def content_hash(file_path):
+    """Return a short sha256 digest of the file content"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def build_asset_manifest(source_dir=ASSETS_DIR, static_dir=STATIC_DIR):
+    """Copy every asset to static/hashed/ under a content-hashed name and return the manifest
+
+    Le manifeste associe le chemin source ("assets/images/logo.png") au chemin
+    relatif dans static/ ("hashed/images/logo.3f2a9c1b07.png"). Les fichiers déjà
+    copiés ne sont pas réécrits et les anciennes versions sont supprimées.
+    """
+    source_dir = Path(source_dir)
+    target_root = Path(static_dir) / HASHED_DIR_NAME
+    manifest = {}
+
+    for source in sorted(source_dir.rglob("*")):
+        if not source.is_file() or source.name.startswith("."):
+            continue
+        relative = source.relative_to(source_dir)
+        hashed_name = f"{source.stem}.{content_hash(source)}{source.suffix}"
+        target = target_root / relative.parent / hashed_name
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+        key = (Path(source_dir.name) / relative).as_posix()
+        manifest[key] = target.relative_to(static_dir).as_posix()
+
+    # Nettoyer les copies dont le contenu source a changé
+    current = {Path(static_dir) / path for path in manifest.values()}
+    for existing in target_root.rglob("*"):
+        if existing.is_file() and HASHED_NAME_PATTERN.match(existing.name) and existing not in current:
+            existing.unlink()
+
+    target_root.mkdir(parents=True, exist_ok=True)
+    with open(target_root / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def get_asset_manifest():
+    """Build the manifest once per process"""
+    try:
+        return build_asset_manifest()
+    except OSError as e:
+        # static/ en lecture seule : on retombe sur l'intégration base64
+        print(f"Warning: static asset pipeline unavailable ({e})")
+        return {}
+
+
+@lru_cache(maxsize=1)
+def get_responsive_manifest():
+    """Load the manifest written by scripts/optimize_images.py, if it was run"""
+    manifest_path = STATIC_DIR / OPTIMIZED_DIR_NAME / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def static_serving_enabled():
+    """Return True when Streamlit serves the static/ folder"""
+    return STATIC_BASE_URL != "app/static" or bool(st.get_option("server.enableStaticServing"))
+
+
+class Base64Cache:
+    """Process-wide LRU cache of base64-encoded files, bounded by a byte budget
+
+    Chaque entrée est indexée par le chemin et mémorise le mtime et la taille du
+    fichier : une image modifiée sur le disque est relue au prochain accès.
+    """
+
+    def __init__(self, max_bytes=BASE64_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # chemin -> (mtime_ns, taille, base64)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, file_path):
+        """Return the base64 encoding of a file, reading it only if it changed"""
+        path = os.path.abspath(file_path)
+        try:
+            file_stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        with open(path, "rb") as img_file:
+            encoded = base64.b64encode(img_file.read()).decode('utf-8')
+
+        with self._lock:
+            self._discard(path)
+            if len(encoded) <= self.max_bytes:
+                self._entries[path] = (*signature, encoded)
+                self.current_bytes += len(encoded)
+            while self.current_bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return encoded
+
+    def _discard(self, path):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.current_bytes -= len(entry[2])
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return the cache counters as a dictionary"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+base64_cache = Base64Cache()
+
+
+def get_img_as_base64(file_path):
+    """Read an image and return its base64 encoding, memoized in base64_cache"""
+    encoded = base64_cache.get(file_path)
+    if encoded is None:
+        print(f"Warning: Image not found at {file_path}")
+    return encoded
+
+
+def asset_url(file_path, base_url=None):
+    """Return the cacheable static URL of an asset, or None if it is not published
+
+    base_url remplace STATIC_BASE_URL (ex: "." pour l'export statique).
+    """
+    if base_url is None:
+        if not static_serving_enabled():
+            return None
+        base_url = STATIC_BASE_URL
+    hashed_path = get_asset_manifest().get(Path(file_path).as_posix())
+    if hashed_path is None:
+        return None
+    return f"{base_url}/{hashed_path}"
+
+
+def img_src(file_path, base_url=None):
+    """Return a value for <img src>: hashed static URL, or data URI as a fallback"""
+    url = asset_url(file_path, base_url)
+    if url is not None:
+        return url
+
+    img_base64 = get_img_as_base64(file_path)
+    if img_base64 is None:
+        return None
+    mime_type = mimetypes.guess_type(str(file_path))[0] or "image/png"
+    return f"data:{mime_type};base64,{img_base64}"
+
+
+def _srcset(variants, base_url):
+    return ", ".join(f"{base_url}/{path} {density}x" for path, density in variants)
+
+
+def _html_attributes(attrs):
+    return " ".join(f'{name}="{value}"' for name, value in attrs.items() if value is not None)
+
+
+def img_tag(file_path, alt="", width=None, base_url=None, **attrs):
+    """Return an <img> (or responsive <picture>) tag for an asset, or None if it is missing
+
+    Quand scripts/optimize_images.py a été lancé, produit un <picture> avec un
+    srcset 1x/2x par format (AVIF, WebP, puis JPEG/PNG en repli). Sinon, retombe
+    sur une simple balise <img> pointant vers img_src().
+    """
+    entry = None
+    if base_url is not None or static_serving_enabled():
+        entry = get_responsive_manifest().get(Path(file_path).as_posix())
+
+    if entry is None:
+        src = img_src(file_path, base_url)
+        if src is None:
+            return None
+        return f'<img src="{src}" {_html_attributes({"alt": alt, "width": width, **attrs})}>'
+
+    base_url = base_url or STATIC_BASE_URL
+    attrs = {"alt": alt, "width": width or entry["width"], "loading": "lazy", "decoding": "async", **attrs}
+    fallback = entry["sources"][entry["fallback"]]
+    sources = "".join(
+        f'<source type="{mime_type}" srcset="{_srcset(variants, base_url)}">'
+        for mime_type, variants in entry["sources"].items()
+        if mime_type != entry["fallback"]
+    )
+    return (
+        f'<picture>{sources}'
+        f'<img src="{base_url}/{fallback[0][0]}" srcset="{_srcset(fallback, base_url)}" {_html_attributes(attrs)}>'
+        f'</picture>'
+    )
@@ -0,0 +1,124 @@
+"""Simulation Monte Carlo du coût final du budget : risque de dépassement et réserve pour imprévus nécessaire
+
+Le coût final d'une catégorie est ce qu'elle a déjà dépensé plus son reste à
+dépenser (estimation de la valeur acquise : travail restant au CPI observé),
+multiplié par un facteur incertain. Le facteur suit une loi triangulaire
+asymétrique (1 - u, 1, 1 + 2u) : les dépassements sont plus fréquents que les
+économies. Une part commune à toutes les catégories (corrélation) représente
+les aléas qui touchent tout le budget (prix, météo, affluence).
+
+Les lignes "Imprévus" sont la réserve : elles n'ont pas de travail propre, leur
+dépense est comptée telle quelle et la réserve nécessaire est comparée à leur
+budget validé. Tous les tirages sont faits en tableaux NumPy, par blocs pour
+borner la mémoire sur un gros budget.
+"""
+import time
+
+import numpy as np
+import streamlit as st
+
+from utils.earned_value import TOTAL, earned_value, EVM_TABLES
+from utils.profiling import counted_cache
+
+CONTINGENCY_CATEGORY = "Imprévus"
+SIMULATION_SEED = 2025
+DRAW_OPTIONS = (10_000, 25_000, 50_000, 100_000)
+# Tirages x catégories par bloc : environ 16 Mo de facteurs à la fois
+CHUNK_ELEMENTS = 2_000_000
+HISTOGRAM_BINS = 60
+
+
+def is_contingency(category):
+    """Return True for a contingency reserve line ("Imprévus", "Imprévus 2"...)"""
+    return str(category).startswith(CONTINGENCY_CATEGORY)
+
+
+def category_estimates(evm, period):
+    """Return the categories, their spend and their estimated remaining cost at a period
+
+    Reste à dépenser : (BAC - EV) / CPI, nul pour la réserve et pour une
+    catégorie dont le travail est fait ; CPI inconnu (rien dépensé) : 1.
+    """
+    categories = [category for category in evm["bac"].columns if category != TOTAL]
+    bac = evm["bac"].loc[period, categories].to_numpy(float)
+    ev = evm["ev"].loc[period, categories].to_numpy(float)
+    spent = evm["ac"].loc[period, categories].to_numpy(float)
+    cpi = evm["cpi"].loc[period, categories].to_numpy(float)
+    cpi = np.where(np.isfinite(cpi) & (cpi > 0), cpi, 1.0)
+    remaining = np.maximum(bac - ev, 0) / cpi
+    reserve = np.array([is_contingency(category) for category in categories])
+    remaining[reserve] = 0
+    return categories, bac, spent, remaining, reserve
+
+
+def simulate_totals(spent, remaining, draws, uncertainty, correlation, seed=SIMULATION_SEED):
+    """Draw the total final cost draws times and return the sorted totals
+
+    Facteur d'une catégorie : (1 - correlation) x tirage propre + correlation x
+    tirage commun au bloc de tirages. Pas de boucle Python par tirage : un
+    produit matrice-vecteur par bloc. Tirages propres et communs viennent de
+    deux flux séparés : le découpage en blocs ne change pas le résultat.
+    """
+    rng, common_rng = np.random.default_rng(seed).spawn(2)
+    totals = np.empty(draws)
+    if uncertainty <= 0 or not remaining.any():
+        totals[:] = spent.sum() + remaining.sum()
+        return totals
+    left, mode, right = 1 - uncertainty, 1.0, 1 + 2 * uncertainty
+    chunk = max(1, CHUNK_ELEMENTS // len(remaining))
+    for start in range(0, draws, chunk):
+        size = min(chunk, draws - start)
+        factors = rng.triangular(left, mode, right, size=(size, len(remaining)))
+        if correlation:
+            common = common_rng.triangular(left, mode, right, size=(size, 1))
+            factors = (1 - correlation) * factors + correlation * common
+        totals[start:start + size] = factors @ remaining
+    totals += spent.sum()
+    totals.sort()
+    return totals
+
+
+def simulate_budget(data, period, draws=DRAW_OPTIONS[0], uncertainty=0.2, correlation=0.3):
+    """Simulate the final cost of the budget at a period and return the sorted totals and the budget lines"""
+    start = time.perf_counter()
+    categories, bac, spent, remaining, reserve = category_estimates(earned_value(data), period)
+    totals = simulate_totals(spent, remaining, draws, uncertainty, correlation)
+    totals.flags.writeable = False
+    counts, edges = np.histogram(totals, bins=HISTOGRAM_BINS)
+    return {
+        "totals": totals,
+        "validated_total": float(bac.sum()),
+        "reserve": float(bac[reserve].sum()),
+        "base_budget": float(bac[~reserve].sum()),
+        "spent": float(spent.sum()),
+        "histogram": (counts, edges),
+        "draws": draws,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+@counted_cache("budget_simulation", st.cache_resource(max_entries=32, show_spinner=False))
+def _cached_simulation(tables_version, period, draws, uncertainty, correlation, _data):
+    # Une entrée par version des tables, période et paramètres : changer le niveau de confiance ne relance rien
+    return simulate_budget(_data, period, draws, uncertainty, correlation)
+
+
+def budget_simulation(data, period, draws=DRAW_OPTIONS[0], uncertainty=0.2, correlation=0.3):
+    """Return the simulation of a period, run once per version of the budget tables and parameters"""
+    return _cached_simulation(data.tables_version(*EVM_TABLES), period, draws, uncertainty, correlation, data)
+
+
+def summarize_simulation(simulation, confidence=0.9):
+    """Return the overrun probability, the P50/P90 overruns and the reserve needed at a confidence level"""
+    totals = simulation["totals"]
+    validated_total = simulation["validated_total"]
+    p50, p90, at_confidence = np.quantile(totals, [0.5, 0.9, confidence])
+    exceeding = len(totals) - np.searchsorted(totals, validated_total, side="right")
+    return {
+        "overrun_probability": exceeding / len(totals),
+        "overrun_p50": float(p50 - validated_total),
+        "overrun_p90": float(p90 - validated_total),
+        "total_at_confidence": float(at_confidence),
+        # Réserve qui couvre le coût final dans confidence des cas, au-dessus des autres lignes
+        "reserve_needed": max(0.0, float(at_confidence - simulation["base_budget"])),
+    }
@@ -0,0 +1,228 @@
+"""Chemin critique (CPM) du planning et replanification automatique des tâches suivantes
+
+Passe avant : une tâche commence à sa date prévue, ou le lendemain de la fin
+de son dernier prédécesseur s'il finit plus tard. Passe arrière : la date de
+début au plus tard est bornée par la fin du projet et, pour les tâches
+planifiées avant l'événement, par le jour de l'événement. La marge est l'écart
+entre les deux ; les tâches sans marge forment le chemin critique.
+
+Les deux passes sont faites niveau du graphe par niveau, en NumPy. Quand une
+tâche glisse (durée ou début modifiés), reschedule() ne recalcule que ses
+descendants (dates au plus tôt) et ses ancêtres (dates au plus tard), dans
+l'ordre topologique, en s'arrêtant là où plus rien ne change.
+"""
+import copy
+import heapq
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.profiling import counted_cache
+from utils.schedule import (event_date, padded_levels, schedule_tasks, successors_of, task_number,
+                            task_predecessors, topological_levels, topological_order)
+
+# Tables lues par le calcul : la période choisie ne le relance pas
+CPM_TABLES = ("gantt", "milestones")
+
+
+class CriticalPath:
+    """Early and late dates, slack and critical tasks of the Gantt sub-tasks, in days from the first start
+
+    Les dates sont des jours inclus (une tâche d'un jour commence et finit le
+    même jour). Une instance mise en cache est partagée entre les sessions :
+    reschedule() renvoie une nouvelle instance au lieu de la modifier.
+    """
+
+    def __init__(self, tasks, origin, predecessors, deadline_day=np.inf, declared=True):
+        n = len(tasks)
+        self.tasks = tasks
+        self.origin = origin
+        self.predecessors = predecessors
+        self.successors = successors_of(predecessors)
+        self.declared = declared
+        order = topological_order(predecessors)
+        self.rank = np.empty(n, dtype=int)
+        self.rank[order] = np.arange(n)
+        levels = topological_levels(predecessors, order)
+        # Colonne n : prédécesseur ou successeur absent (valeur neutre)
+        self._forward_levels = padded_levels(predecessors, levels, n)
+        self._backward_levels = padded_levels(self.successors, levels[::-1], n)
+
+        self.planned_start = tasks["start_day"].to_numpy(float)
+        self.duration = tasks["duration"].to_numpy(float)
+        planned_finish = self.planned_start + self.duration - 1
+        # Échéance : le jour de l'événement pour les tâches prévues au plus tard ce jour-là
+        self.deadline = np.where(planned_finish <= deadline_day, deadline_day, np.inf)
+        self.start, self.finish = self._forward()
+        self.tail, self.deadline_start = self._backward()
+        self.moved = np.empty(0, dtype=int)
+
+    @classmethod
+    def from_data(cls, data):
+        """Build the schedule of the project's Gantt, the event milestone being the deadline"""
+        tasks, origin = schedule_tasks(data.gantt)
+        predecessors, declared = task_predecessors(tasks)
+        deadline_day = float((event_date(data.milestones) - origin).astype(int))
+        return cls(tasks, origin, predecessors, deadline_day, declared)
+
+    def _forward(self):
+        n = len(self.duration)
+        finish = np.full(n + 1, -np.inf)
+        start = np.empty(n)
+        for level, matrix in self._forward_levels:
+            start[level] = np.maximum(self.planned_start[level], finish[matrix].max(axis=1) + 1)
+            finish[level] = start[level] + self.duration[level] - 1
+        return start, finish[:n]
+
+    def _backward(self):
+        # tail : durée du plus long chemin de la tâche à la fin du projet (début au plus tard = fin - tail + 1)
+        # deadline_start : début au plus tard imposé par les échéances des tâches suivantes
+        n = len(self.duration)
+        tail = np.zeros(n + 1)
+        deadline_start = np.full(n + 1, np.inf)
+        for level, matrix in self._backward_levels:
+            tail[level] = tail[matrix].max(axis=1) + self.duration[level]
+            latest_finish = np.minimum(self.deadline[level], deadline_start[matrix].min(axis=1) - 1)
+            deadline_start[level] = latest_finish - self.duration[level] + 1
+        return tail[:n], deadline_start[:n]
+
+    @property
+    def project_finish(self):
+        """Last day of the project"""
+        return self.finish.max() if len(self.finish) else 0.0
+
+    @property
+    def latest_start(self):
+        """Latest start of each task that keeps the project end and the event deadline"""
+        return np.minimum(self.project_finish - self.tail + 1, self.deadline_start)
+
+    @property
+    def slack(self):
+        """Total slack of each task in days (negative: the deadline is missed)"""
+        return self.latest_start - self.start
+
+    @property
+    def critical(self):
+        """Mask of the tasks without slack"""
+        return self.slack <= 0
+
+    def position(self, task):
+        """Return the row position of a task given by position, WBS number ("3.7") or full name"""
+        if isinstance(task, (int, np.integer)):
+            return int(task)
+        names = self.tasks["Task"]
+        matches = np.flatnonzero((names == task) | (names.map(task_number) == task))
+        if not len(matches):
+            raise KeyError(f"Unknown task {task!r}")
+        return int(matches[0])
+
+    def reschedule(self, task, start=None, duration=None):
+        """Return the schedule after changing the planned start or the duration (days) of one task
+
+        Seuls les descendants de la tâche (passe avant) et, si sa durée change,
+        ses ancêtres (passe arrière) sont recalculés. moved donne les positions
+        des tâches dont les dates ont changé.
+        """
+        i = self.position(task)
+        updated = copy.copy(self)
+        for name in ("planned_start", "duration", "start", "finish", "tail", "deadline_start"):
+            setattr(updated, name, getattr(self, name).copy())
+        if start is not None:
+            updated.planned_start[i] = start
+        if duration is not None:
+            updated.duration[i] = duration
+        updated.moved = np.array(sorted(updated._propagate_forward(i)), dtype=int)
+        if duration is not None:
+            updated._propagate_backward(i)
+        return updated
+
+    def _propagate_forward(self, changed):
+        moved = []
+        heap = [(self.rank[changed], changed)]
+        queued = {changed}
+        while heap:
+            _, task = heapq.heappop(heap)
+            before = self.predecessors[task]
+            start = max(self.planned_start[task], max((self.finish[p] + 1 for p in before), default=-np.inf))
+            finish = start + self.duration[task] - 1
+            if start == self.start[task] and finish == self.finish[task]:
+                continue
+            self.start[task], self.finish[task] = start, finish
+            moved.append(task)
+            for successor in self.successors[task]:
+                if successor not in queued:
+                    queued.add(successor)
+                    heapq.heappush(heap, (self.rank[successor], successor))
+        return moved
+
+    def _propagate_backward(self, changed):
+        heap = [(-self.rank[changed], changed)]
+        queued = {changed}
+        while heap:
+            _, task = heapq.heappop(heap)
+            after = self.successors[task]
+            tail = max((self.tail[s] for s in after), default=0.0) + self.duration[task]
+            latest_finish = min(self.deadline[task], min((self.deadline_start[s] - 1 for s in after), default=np.inf))
+            deadline_start = latest_finish - self.duration[task] + 1
+            if tail == self.tail[task] and deadline_start == self.deadline_start[task]:
+                continue
+            self.tail[task], self.deadline_start[task] = tail, deadline_start
+            for predecessor in self.predecessors[task]:
+                if predecessor not in queued:
+                    queued.add(predecessor)
+                    heapq.heappush(heap, (-self.rank[predecessor], predecessor))
+
+    def _date(self, days):
+        return pd.to_datetime(self.origin + days.astype(int).astype("timedelta64[D]"))
+
+    def table(self):
+        """Return the sub-tasks with their scheduled dates, slack and critical flag"""
+        return pd.DataFrame({
+            "Task": self.tasks["Task"].to_numpy(),
+            "Resource": self.tasks["Resource"].to_numpy(),
+            "Start": self._date(self.start),
+            "Finish": self._date(self.finish),
+            "Slack": self.slack,
+            "Critical": self.critical,
+        })
+
+    def gantt(self, gantt):
+        """Return the Gantt rows with the scheduled dates, main tasks spanning their phase's sub-tasks
+
+        Ajoute les colonnes Slack (jours, plus petite marge des sous-tâches
+        pour une tâche principale) et Critical.
+        """
+        columns = ["Start", "Finish", "Slack", "Critical"]
+        table = self.table()
+        scheduled = table.drop_duplicates("Task").set_index("Task")[columns]
+        phases = table.groupby("Resource", sort=False).agg(
+            Start=("Start", "min"), Finish=("Finish", "max"), Slack=("Slack", "min"), Critical=("Critical", "any"))
+        main = gantt["Level"] == "Main" if "Level" in gantt.columns else pd.Series(False, index=gantt.index)
+        values = scheduled.reindex(gantt["Task"]).set_axis(gantt.index)
+        values = values.mask(main, phases.reindex(gantt["Resource"]).set_axis(gantt.index), axis=0)
+        return gantt.assign(
+            Start=values["Start"].fillna(pd.to_datetime(gantt["Start"])),
+            Finish=values["Finish"].fillna(pd.to_datetime(gantt["Finish"])),
+            Slack=values["Slack"],
+            Critical=values["Critical"].fillna(False).astype(bool),
+        )
+
+
+@counted_cache("critical_path", st.cache_resource(max_entries=8, show_spinner=False))
+def _cached_critical_path(tables_version, _data):
+    # Une entrée par version du planning et des jalons, partagée entre les sessions (jamais modifiée)
+    return CriticalPath.from_data(_data)
+
+
+def critical_path(data):
+    """Return the critical path schedule of the project, computed once per version of CPM_TABLES
+
+    Renvoie None, avec un avertissement sur la page, quand les prédécesseurs
+    déclarés forment un cycle.
+    """
+    try:
+        return _cached_critical_path(data.tables_version(*CPM_TABLES), data)
+    except ValueError as error:
+        st.warning(f"⚠️ Chemin critique non calculé, prédécesseurs du Gantt en cycle : {error}")
+        return None
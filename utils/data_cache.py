@@ -0,0 +1,193 @@
+"""Cache persistant des données du projet et des vues par période, relu au redémarrage du processus
+
+Un redémarrage (déploiement, plantage) vide les caches en mémoire : le premier
+visiteur payait la lecture de la source, la normalisation des tables et le
+calcul des vues. Ce cache les garde sur disque, sous une clé qui combine
+SCHEMA_VERSION (utils/project_model.py) et une empreinte du contenu de la source.
+
+Format : pickle protocole 5, les tableaux (numpy, Arrow) étant écrits hors du
+flux pickle, alignés, à la suite. À la lecture le fichier est projeté en
+mémoire (mmap) et les tableaux pointent directement dans la projection, sans
+copie. Les entrées d'une autre SCHEMA_VERSION sont supprimées à l'ouverture.
+
+JAMAIS_SEUL_DATA_CACHE : dossier du cache (défaut dist/cache/data), "off" pour
+le désactiver.
+"""
+import gc
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+import threading
+from pathlib import Path
+
+from utils.project_model import SCHEMA_VERSION, pickle_dumps
+
+DATA_CACHE_ENV_VAR = "JAMAIS_SEUL_DATA_CACHE"
+DEFAULT_DATA_CACHE_DIR = Path(__file__).resolve().parent.parent / "dist" / "cache" / "data"
+
+# Entrées gardées par espace de noms ("project_data", "period_views"), les plus récemment lues
+DATA_CACHE_MAX_ENTRIES = int(os.environ.get("DATA_CACHE_MAX_ENTRIES", 8))
+
+MAGIC = b"JSPKL5\x00\x01"
+HEADER = struct.Struct("<8sQQ")  # magic, longueur du flux pickle, nombre de tampons
+BUFFER_ENTRY = struct.Struct("<QQ")  # position et longueur d'un tampon
+ALIGNMENT = 64
+DISABLED_VALUES = ("off", "0", "false", "no")
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def dump(value, path):
+    """Write value to path as pickle protocol 5 with its buffers stored out of band, aligned"""
+    buffers = []
+    payload = pickle_dumps(value, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+
+    offset = _aligned(HEADER.size + BUFFER_ENTRY.size * len(raws) + len(payload))
+    entries = []
+    for raw in raws:
+        entries.append((offset, raw.nbytes))
+        offset = _aligned(offset + raw.nbytes)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Écriture dans un fichier temporaire puis renommage : un lecteur ne voit jamais un fichier partiel
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(payload), len(raws)))
+            for entry in entries:
+                f.write(BUFFER_ENTRY.pack(*entry))
+            f.write(payload)
+            for (position, _), raw in zip(entries, raws):
+                f.write(b"\0" * (position - f.tell()))
+                f.write(raw)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load(path):
+    """Read a file written by dump(), its buffers pointing into a read-only memory map"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    magic, payload_size, count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a data cache file")
+    entries = [BUFFER_ENTRY.unpack_from(view, HEADER.size + i * BUFFER_ENTRY.size) for i in range(count)]
+    start = HEADER.size + BUFFER_ENTRY.size * count
+    buffers = [view[position:position + size] for position, size in entries]
+    # Les vues par période sont des dizaines de milliers de petits conteneurs :
+    # sans ramasse-miettes pendant la lecture, elle est plusieurs fois plus rapide
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # Les tableaux gardent leur tranche de la projection : elle vit tant qu'ils vivent
+        return pickle.loads(view[start:start + payload_size], buffers=buffers)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class DataCache:
+    """On-disk cache of pickled objects, one memory-mapped file per entry, per schema version
+
+    Même interface que utils.shared_cache.SharedCache (get_object,
+    set_object) : ProjectDataLoader et les vues par période les utilisent
+    l'un après l'autre.
+    """
+
+    def __init__(self, directory, schema_version=SCHEMA_VERSION, max_entries=DATA_CACHE_MAX_ENTRIES):
+        self.root = Path(directory)
+        self.directory = self.root / f"v{schema_version}"
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._evict_other_versions()
+
+    def _evict_other_versions(self):
+        for entry in self.root.iterdir():
+            if entry.is_dir() and entry != self.directory and entry.name.startswith("v"):
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def _path(self, namespace, key):
+        return self.directory / namespace / f"{key}.pkl5"
+
+    def _count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def get_object(self, namespace, key):
+        """Return the object stored under (namespace, key), or None"""
+        path = self._path(namespace, key)
+        try:
+            value = load(path)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except Exception as e:  # fichier tronqué, classe renommée sans changer SCHEMA_VERSION...
+            print(f"Warning: dropping unreadable data cache entry {path} ({e})")
+            path.unlink(missing_ok=True)
+            self._count("misses")
+            return None
+        try:
+            os.utime(path)  # date de dernière lecture, pour l'éviction
+        except OSError:
+            pass
+        self._count("hits")
+        return value
+
+    def set_object(self, namespace, key, value):
+        """Store an object under (namespace, key), keeping the max_entries most recently used of the namespace"""
+        try:
+            dump(value, self._path(namespace, key))
+            entries = sorted(self._path(namespace, key).parent.glob("*.pkl5"), key=lambda p: p.stat().st_mtime)
+            for stale in entries[:-self.max_entries]:
+                stale.unlink(missing_ok=True)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            # Cache facultatif : une valeur non picklable n'est simplement pas gardée
+            print(f"Warning: cannot write data cache entry {namespace}/{key} ({e})")
+            return
+        self._count("writes")
+
+    def clear(self):
+        """Delete every entry of every schema version"""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def stats(self):
+        """Return the counters of this process and the number and size of the stored entries"""
+        files = list(self.directory.rglob("*.pkl5"))
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "entries": len(files),
+                "bytes": sum(f.stat().st_size for f in files),
+            }
+
+
+def open_data_cache(directory=None):
+    """Return the data cache in directory (default: JAMAIS_SEUL_DATA_CACHE), None when disabled"""
+    directory = directory or os.environ.get(DATA_CACHE_ENV_VAR) or DEFAULT_DATA_CACHE_DIR
+    if str(directory).lower() in DISABLED_VALUES:
+        return None
+    try:
+        return DataCache(directory)
+    except OSError as e:
+        print(f"Warning: data cache disabled, cannot use {directory} ({e})")
+        return None
+
+
+data_cache = open_data_cache()
@@ -0,0 +1,284 @@
+"""Sources des données du tableau de bord : démo intégrée, dossier CSV, classeur Excel ou base SQLite
+
+Chaque source donne une signature par table (date de modification et taille du
+fichier, nombre de lignes et version des lignes en SQLite). ProjectDataLoader
+ne relit que les tables dont la signature a changé.
+
+Les caches partagé et persistant sont indexés par le contenu : les sources
+fichier (CSV, Excel) donnent aussi une empreinte SHA-256 de leurs octets,
+calculée seulement quand la signature du fichier change. Les autres sources
+ont des signatures qui suivent déjà le contenu (code du générateur et
+paramètres, lignes SQLite) et servent d'empreintes.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from utils import demo_data, scenarios
+from utils.demo_data import demo_tables
+from utils.project_model import SCHEMA_VERSION, TABLE_KEYS, ProjectData
+from utils.scenarios import parse_scenario, scenario_tables
+
+TABLE_NAMES = list(TABLE_KEYS)
+
+# Copie exportée du Google Sheet du projet : dossier de CSV, classeur .xlsx ou base .sqlite.
+# "scenario:periods=40,tasks=3000" : scénario synthétique (utils/scenarios.py).
+# Vide : jeu de données de démonstration intégré.
+DATA_SOURCE = os.environ.get("JAMAIS_SEUL_DATA", "")
+
+# Colonne optionnelle des tables SQLite, à incrémenter à chaque modification d'une ligne
+ROW_VERSION_COLUMN = "row_version"
+
+SCENARIO_PREFIX = "scenario:"
+EXCEL_SUFFIXES = (".xlsx", ".xlsm")
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+
+def _file_signature(path):
+    file_stat = os.stat(path)
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _content_digest(path, signature):
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()[:16]
+
+
+def _file_fingerprint(path):
+    # Empreinte du contenu, relue seulement quand la date ou la taille du fichier change
+    return _content_digest(str(path), _file_signature(path))
+
+
+def _module_signature(module):
+    # Données générées par du code : la signature suit le contenu du générateur
+    return hashlib.sha256(Path(module.__file__).read_bytes()).hexdigest()[:12]
+
+
+class DemoSource:
+    """Built-in demo dataset, generated once per process"""
+
+    def __init__(self):
+        self._tables = None
+        self._signature = ("demo", _module_signature(demo_data))
+
+    def signatures(self, tables):
+        """Return the change signature of each table"""
+        return {name: self._signature for name in tables}
+
+    def read(self, tables):
+        """Return the given tables as DataFrames"""
+        if self._tables is None:
+            self._tables = demo_tables()
+        return {name: self._tables[name] for name in tables}
+
+
+class ScenarioSource:
+    """Synthetic scenario generated from its parameters, see utils.scenarios"""
+
+    def __init__(self, **params):
+        self.params = params
+        self._tables = None
+        self._signature = (tuple(sorted(params.items())), _module_signature(scenarios))
+
+    def signatures(self, tables):
+        """Return the change signature of each table"""
+        return {name: self._signature for name in tables}
+
+    def read(self, tables):
+        """Return the given tables as DataFrames"""
+        if self._tables is None:
+            self._tables = scenario_tables(**self.params)
+        return {name: self._tables[name] for name in tables}
+
+
+class CsvSource:
+    """One CSV file per table in a directory (budget.csv, risks.csv...)"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def path(self, table):
+        return self.directory / f"{table}.csv"
+
+    def signatures(self, tables):
+        """Return the change signature of each table"""
+        return {name: _file_signature(self.path(name)) for name in tables}
+
+    def fingerprints(self, tables):
+        """Return a hash of the content of each table"""
+        return {name: _file_fingerprint(self.path(name)) for name in tables}
+
+    def read(self, tables):
+        """Return the given tables as DataFrames"""
+        return {name: pd.read_csv(self.path(name)) for name in tables}
+
+    def write(self, tables):
+        """Write every table to its CSV file"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for name, table in tables.items():
+            table.to_csv(self.path(name), index=False)
+
+
+class ExcelSource:
+    """One sheet per table in an Excel workbook (requires openpyxl)
+
+    Le classeur est un seul fichier : quand il change, les feuilles demandées
+    sont relues, puis ProjectData ne remplace que celles dont le contenu a changé.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def signatures(self, tables):
+        """Return the change signature of each table"""
+        signature = _file_signature(self.path)
+        return {name: signature for name in tables}
+
+    def fingerprints(self, tables):
+        """Return a hash of the content of each table (the whole workbook)"""
+        fingerprint = _file_fingerprint(self.path)
+        return {name: fingerprint for name in tables}
+
+    def read(self, tables):
+        """Return the given tables as DataFrames"""
+        return pd.read_excel(self.path, sheet_name=list(tables))
+
+    def write(self, tables):
+        """Write every table to its own sheet"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with pd.ExcelWriter(self.path) as writer:
+            for name, table in tables.items():
+                table.to_excel(writer, sheet_name=name, index=False)
+
+
+class SQLiteSource:
+    """One table per project table in a SQLite database
+
+    La signature d'une table est son nombre de lignes, son plus grand rowid et,
+    si la colonne existe, le plus grand row_version : une mise à jour en place
+    doit incrémenter row_version pour être vue.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def _connect(self):
+        if not self.path.exists():
+            raise FileNotFoundError(f"SQLite database not found: {self.path}")
+        return closing(sqlite3.connect(self.path))
+
+    def signatures(self, tables):
+        """Return the change signature of each table"""
+        signatures = {}
+        with self._connect() as connection:
+            for name in tables:
+                columns = [row[1] for row in connection.execute(f'PRAGMA table_info("{name}")')]
+                query = f'SELECT count(*), max(rowid) FROM "{name}"'
+                if ROW_VERSION_COLUMN in columns:
+                    query = f'SELECT count(*), max(rowid), max("{ROW_VERSION_COLUMN}") FROM "{name}"'
+                signatures[name] = tuple(connection.execute(query).fetchone())
+        return signatures
+
+    def read(self, tables):
+        """Return the given tables as DataFrames"""
+        with self._connect() as connection:
+            return {
+                name: pd.read_sql_query(f'SELECT * FROM "{name}" ORDER BY rowid', connection)
+                .drop(columns=ROW_VERSION_COLUMN, errors="ignore")
+                for name in tables
+            }
+
+    def write(self, tables):
+        """Write every table, replacing the existing ones"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as connection:
+            for name, table in tables.items():
+                table.assign(**{ROW_VERSION_COLUMN: 1}).to_sql(name, connection, if_exists="replace", index=False)
+            connection.commit()
+
+
+def open_data_source(spec=DATA_SOURCE):
+    """Return the data source described by a path, a scenario spec or "" for the demo dataset"""
+    if not spec:
+        return DemoSource()
+    if spec.startswith(SCENARIO_PREFIX):
+        return ScenarioSource(**parse_scenario(spec[len(SCENARIO_PREFIX):]))
+    path = Path(spec)
+    if path.suffix.lower() in EXCEL_SUFFIXES:
+        return ExcelSource(path)
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        return SQLiteSource(path)
+    if path.is_dir() or not path.suffix:
+        return CsvSource(path)
+    raise ValueError(f"Unsupported data source: {spec} (expected a CSV folder, {', '.join(EXCEL_SUFFIXES + SQLITE_SUFFIXES)})")
+
+
+class ProjectDataLoader:
+    """Incremental loader: re-reads only the tables whose source signature changed
+
+    Les tables inchangées gardent leur version dans ProjectData.table_versions,
+    les caches du tableau de bord qui n'en dépendent pas restent donc valides.
+    caches : caches partagé (utils.shared_cache) ou persistant
+    (utils.data_cache), dans l'ordre de lecture. Le modèle y est rangé sous
+    SCHEMA_VERSION et les empreintes de contenu de la source (fingerprints(),
+    sinon ses signatures) : un autre worker, ou ce processus après un
+    redémarrage, qui voit le même contenu le relit au lieu de relire la
+    source. cache_key distingue les sources.
+    """
+
+    def __init__(self, source, caches=(), cache_key=""):
+        self.source = source
+        self.caches = [cache for cache in caches if cache is not None]
+        self.cache_key = cache_key
+        self.data = None
+        self.reads = {name: 0 for name in TABLE_NAMES}
+        self._signatures = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Return the project data, reloading the changed tables first"""
+        with self._lock:
+            try:
+                signatures = self.source.signatures(TABLE_NAMES)
+                changed = [name for name in TABLE_NAMES if signatures[name] != self._signatures.get(name)]
+                if not changed:
+                    return self.data
+                key = self._cache_key() if self.caches else None
+                data = self._read_cached(key) if key else None
+                if data is None:
+                    tables = self.source.read(changed)
+                    for name in changed:
+                        self.reads[name] += 1
+                    # Tables mal formées (colonne manquante, valeur non numérique) : même repli
+                    data = ProjectData.from_tables(tables) if self.data is None else self.data.with_tables(**tables)
+                    for cache in self.caches:
+                        cache.set_object("project_data", key, data)
+            except (OSError, sqlite3.Error, ValueError, KeyError, TypeError, ImportError) as e:
+                # ImportError : classeur Excel sans openpyxl installé
+                if self.data is None:
+                    raise
+                print(f"Warning: cannot reload project data ({e}), keeping the last version")
+                return self.data
+
+            self.data = data
+            self._signatures = signatures
+            return self.data
+
+    def _cache_key(self):
+        fingerprints = getattr(self.source, "fingerprints", self.source.signatures)(TABLE_NAMES)
+        described = repr((SCHEMA_VERSION, self.cache_key, sorted(fingerprints.items())))
+        return hashlib.sha256(described.encode("utf-8")).hexdigest()[:16]
+
+    def _read_cached(self, key):
+        for cache in self.caches:
+            data = cache.get_object("project_data", key)
+            if data is not None:
+                return data
+        return None
@@ -0,0 +1,280 @@
+"""Jeu de données de démonstration de la course Jamais Seul (S1 à S14)"""
+import numpy as np
+import pandas as pd
+
+# Graine des variations aléatoires (impact des risques) : le jeu est identique à chaque chargement
+DEMO_SEED = 2025
+
+
+def demo_tables(seed=DEMO_SEED):
+    """Build the demo project tables, in the long format of utils.project_model"""
+    rng = np.random.default_rng(seed)
+    # Generate periods - S1 à S14
+    periods = ["S1", "S2", "S3", "S4", "S5", "S6", "S7", "S8", "S9", "S10", "S11", "S12", "S13", "S14"]
+    
+    # Project progress data
+    project_progress = {
+        "S1": 7, "S2": 14, "S3": 21, "S4": 28, 
+        "S5": 35, "S6": 42, "S7": 50, "S8": 60, 
+        "S9": 70, "S10": 80, "S11": 86, "S12": 92,
+        "S13": 96, "S14": 100
+    }
+    
+    # Budget data with realistic scaled increases
+    budget_categories_new = [
+    "Logistique", "Sécurité & secours", "Communication", "Inscriptions/plateforme", 
+    "Animation", "Prévention des risques", "Imprévus"
+    ]   
+
+    budget_rows = []
+    # Une ligne par (période, catégorie) : budget initial, dernier budget validé, estimé, consommé
+    fixed_budgets = {
+        "Logistique": [2000, 1900, 1900],
+        "Sécurité & secours": [900, 900, 900],
+        "Communication": [1490, 1490, 1490],
+        "Inscriptions/plateforme": [600, 600, 600],
+        "Animation": [1000, 1100, 1100],
+        "Prévention des risques": [1000, 1000, 1000],
+        "Imprévus": [200, 200, 200]
+    }
+
+    for period in periods:
+        # Calculate spending scale factor - increases with each period
+        spend_factor = (periods.index(period) + 1) / len(periods)
+        
+        for category, values in fixed_budgets.items():
+            budget_initial, budget_valide, estime = values
+            
+            # Calculate spending based on period progress
+            # Special case for communication which might exceed budget
+            if category == "Communication":
+                max_spend = 2070  # Known communication overspend
+                spend = min(max_spend, max_spend * spend_factor)
+            else:
+                # For other categories, spending increases proportionally, up to the validated budget
+                spend = min(budget_valide, budget_valide * spend_factor * 1.1)  # 1.1 to allow some overspend
+            
+            budget_rows.append({
+                "period": period,
+                "category": category,
+                "initial": budget_initial,
+                "valide": budget_valide,
+                "estime": estime,
+                "depense": spend
+            })
+    
+    # Risk data with evolving profile
+    # Risk data with evolving profile
+    risk_levels = ["Mineur", "Modéré", "Majeur"]
+    risk_trends = ["↓", "→", "↑"]
+    risk_rows = []
+
+    # Define risk evolution patterns - Replace with specific risks
+    risk_patterns = {
+        "R01_Désistement des bénévoles": [0, 0, 0, 1, 1, 2, 2, 2, 1, 1, 0, 0, 0, 0],
+        "R02_Risques sanitaires": [2, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        "R03_Nombre de participants": [0, 0, 1, 1, 2, 2, 2, 2, 1, 1, 0, 0, 0, 0],
+        "R04_Conditions extremes": [0, 0, 0, 0, 1, 2, 2, 1, 1, 0, 0, 0, 0, 0]
+    }
+    
+    for i, period in enumerate(periods):
+        for risk, pattern in risk_patterns.items():
+            level = risk_levels[pattern[i]]
+            # Determine trend
+            if i < len(periods) - 1:
+                if pattern[i] < pattern[i+1]:
+                    trend = risk_trends[2]  # Upward
+                elif pattern[i] > pattern[i+1]:
+                    trend = risk_trends[0]  # Downward
+                else:
+                    trend = risk_trends[1]  # Stable
+            else:
+                trend = risk_trends[1]  # Stable for last period
+                
+            impact = 9 - pattern[i] * 2 + int(rng.integers(-1, 2))
+            impact = max(1, min(10, impact))
+            
+            priority = "Urgent" if level == "Majeur" else "Élevé" if level == "Modéré" and impact > 6 else "Normal" if level == "Modéré" else "Faible"
+            
+            risk_rows.append({
+                "period": period,
+                "risk": risk,
+                "niveau": level, 
+                "tendance": trend, 
+                "impact": impact, 
+                "priorité": priority
+            })
+    
+    # Objectives data with realistic progression
+    # Objectives data with SMART objectives
+    objective_rows = []
+    objectives = {
+        "Participants": {"cible": 700, "max": 1000},
+        "Bénévoles": {"cible": 40},
+        "Partenaires": {"cible": 10},
+        "Satisfaction": {"cible": 100}
+    }
+
+    # Define growth curves for 14 periods based on SMART criteria
+    growth_curves = {
+        # Progressive increase up to potentially 1000 participants
+        "Participants": [0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80, 0.90, 1.00, 1.20, 1.30],
+        # Steady recruitment of volunteers
+        "Bénévoles": [0.10, 0.20, 0.25, 0.30, 0.40, 0.50, 0.60, 0.75, 0.80, 0.85, 0.90, 0.95, 1.00, 1.05],
+        # 5 partners by S8 (50%), then growing to target
+        "Partenaires": [0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.45, 0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 1.00],
+        # Zero until S10, then rapid growth
+        "Satisfaction": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.60, 0.70, 0.80, 0.90]
+    }
+
+    for i, period in enumerate(periods):
+        for obj, details in objectives.items():
+            target = details["cible"]
+            percentage = growth_curves[obj][i] * 100
+            actual = int(target * growth_curves[obj][i])
+            objective_rows.append({
+                "period": period,
+                "objective": obj,
+                "cible": target,
+                "actuel": actual,
+                "pourcentage": int(percentage)
+            })
+    
+    # Team performance data (1=Formation, 2=Confrontation, 3=Normalisation, 4=Performance, 0=Absent)
+    team_states = {
+        "Adèle": [1, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],     
+        "Alexia": [1, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4],    
+        "Hoang": [1, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],     
+        "Margaux": [1, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],   
+        "Salma": [1, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4],     
+        "Nordine": [1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 4, 4, 4],   
+        "Antoine": [1, 1, 1, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4],   
+        "Alexandre": [1, 1, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 4, 4], 
+        "Moumene": [1, 1, 0, 2, 2, 0, 3, 3, 0, 3, 0, 4, 0, 4]    
+    }
+    
+    # Create detailed GANTT data with the exact task specifications provided
+    gantt_data = []
+    
+    # Task definitions with start and end dates
+    task_definitions = [
+        # Phase 1
+        {"name": "1 Conception et mise en route du projet", "start": "2025-02-24", "end": "2025-03-14", "phase": "Phase 1", "level": "Main"},
+        {"name": "1.1 Identification des besoins des bénéficiaires", "start": "2025-02-24", "end": "2025-02-26", "phase": "Phase 1", "level": "Sub"},
+        {"name": "1.2 Création d'un canal de communication interne", "start": "2025-02-26", "end": "2025-02-28", "phase": "Phase 1", "level": "Sub"},
+        {"name": "1.3 Estimation des coûts par poste", "start": "2025-02-27", "end": "2025-03-06", "phase": "Phase 1", "level": "Sub", "after": "1.1"},
+        {"name": "1.4 Rédaction de la charte du projet", "start": "2025-03-07", "end": "2025-03-10", "phase": "Phase 1", "level": "Sub", "after": "1.3"},
+        {"name": "1.5 Elaboration d'un plan de contact", "start": "2025-03-07", "end": "2025-03-11", "phase": "Phase 1", "level": "Sub", "after": "1.2"},
+        {"name": "1.6 Mise en route du projet", "start": "2025-03-12", "end": "2025-03-14", "phase": "Phase 1", "level": "Sub", "after": "1.4, 1.5"},
+        
+        # Phase 2
+        {"name": "2 Définition et planification du projet", "start": "2025-03-17", "end": "2025-04-04", "phase": "Phase 2", "level": "Main"},
+        {"name": "2.1 Définition des critères d'éligibilité", "start": "2025-03-17", "end": "2025-03-17", "phase": "Phase 2", "level": "Sub", "after": "1.6"},
+        {"name": "2.2 Définition des indicateurs de succès", "start": "2025-03-17", "end": "2025-03-19", "phase": "Phase 2", "level": "Sub", "after": "1.6"},
+        {"name": "2.3 Mise en place d'un diagramme de GANTT", "start": "2025-03-20", "end": "2025-03-21", "phase": "Phase 2", "level": "Sub", "after": "2.2"},
+        {"name": "2.4 Attribution des rôles et des responsabilités", "start": "2025-03-21", "end": "2025-03-28", "phase": "Phase 2", "level": "Sub", "after": "2.1, 2.2"},
+        {"name": "2.5 Repérage terrain", "start": "2025-03-28", "end": "2025-04-01", "phase": "Phase 2", "level": "Sub", "after": "2.3"},
+        {"name": "2.6 Préparation des dossiers de demande", "start": "2025-04-02", "end": "2025-04-04", "phase": "Phase 2", "level": "Sub", "after": "2.1, 2.5"},
+        {"name": "2.7 Planification des réunions régulières", "start": "2025-04-04", "end": "2025-04-04", "phase": "Phase 2", "level": "Sub", "after": "2.4"},
+        
+        # Phase 3
+        {"name": "3 Mise en œuvre du projet", "start": "2025-04-07", "end": "2025-05-10", "phase": "Phase 3", "level": "Main"},
+        {"name": "3.1 Réservation des lieux", "start": "2025-04-07", "end": "2025-04-08", "phase": "Phase 3", "level": "Sub", "after": "2.5, 2.6"},
+        {"name": "3.2 Conception graphique des affiches", "start": "2025-04-08", "end": "2025-04-09", "phase": "Phase 3", "level": "Sub", "after": "2.5"},
+        {"name": "3.3 Enregistrement et appariement selon centre d'intérêt", "start": "2025-04-08", "end": "2025-04-10", "phase": "Phase 3", "level": "Sub", "after": "2.1"},
+        {"name": "3.4 Suivi des validations administratives", "start": "2025-04-09", "end": "2025-04-11", "phase": "Phase 3", "level": "Sub", "after": "2.6"},
+        {"name": "3.5 Location de matériel (barnums, barrières, etc.)", "start": "2025-04-14", "end": "2025-04-14", "phase": "Phase 3", "level": "Sub", "after": "3.1"},
+        {"name": "3.6 Réalisation de vidéos promotionnelles", "start": "2025-04-10", "end": "2025-04-15", "phase": "Phase 3", "level": "Sub", "after": "3.2"},
+        {"name": "3.7 Recrutement des bénévoles", "start": "2025-04-16", "end": "2025-04-22", "phase": "Phase 3", "level": "Sub", "after": "3.6"},
+        {"name": "3.8 Session de présentation du parcours", "start": "2025-04-23", "end": "2025-04-23", "phase": "Phase 3", "level": "Sub", "after": "3.7"},
+        {"name": "3.9 Organisation d'ateliers de préparation", "start": "2025-04-23", "end": "2025-04-23", "phase": "Phase 3", "level": "Sub", "after": "3.7"},
+        {"name": "3.10 Coordination avec les pompiers et SAMU", "start": "2025-04-23", "end": "2025-04-28", "phase": "Phase 3", "level": "Sub", "after": "3.4, 3.7"},
+        {"name": "3.11 Mises en relation avant l'évènement", "start": "2025-04-30", "end": "2025-05-02", "phase": "Phase 3", "level": "Sub", "after": "3.3, 3.10"},
+        {"name": "3.12 Briefing des bénévoles sur la sécurité", "start": "2025-05-05", "end": "2025-05-06", "phase": "Phase 3", "level": "Sub", "after": "3.8, 3.10"},
+        {"name": "3.13 Installation technique (signalétique, barrières…)", "start": "2025-05-07", "end": "2025-05-10", "phase": "Phase 3", "level": "Sub", "after": "3.5, 3.12"},
+        {"name": "3.14 Installation de stands thématiques", "start": "2025-05-09", "end": "2025-05-10", "phase": "Phase 3", "level": "Sub", "after": "3.12"},
+        {"name": "3.15 Journée de l'évènement", "start": "2025-05-10", "end": "2025-05-10", "phase": "Phase 3", "level": "Sub", "after": "3.11, 3.12"},
+        
+        # Phase 4
+        {"name": "4 Performances/contrôle du projet", "start": "2025-05-12", "end": "2025-05-21", "phase": "Phase 4", "level": "Main"},
+        {"name": "4.1 Création d'un questionnaire de satisfaction", "start": "2025-05-12", "end": "2025-05-13", "phase": "Phase 4", "level": "Sub", "after": "3.15"},
+        {"name": "4.2 Analyse des retours", "start": "2025-05-14", "end": "2025-05-16", "phase": "Phase 4", "level": "Sub", "after": "4.1"},
+        {"name": "4.3 Performances du projet", "start": "2025-05-15", "end": "2025-05-16", "phase": "Phase 4", "level": "Sub", "after": "4.1"},
+        {"name": "4.4 Présentation aux parties prenantes", "start": "2025-05-19", "end": "2025-05-21", "phase": "Phase 4", "level": "Sub", "after": "4.2, 4.3"},
+    ]
+    
+    # Add tasks to gantt data
+    for task in task_definitions:
+        gantt_data.append({
+            "Task": task["name"],
+            "Start": task["start"],
+            "Finish": task["end"],
+            "Resource": task["phase"],
+            "Level": task["level"],
+            # Numéros WBS des tâches à terminer avant celle-ci (voir utils/schedule.py)
+            "Predecessors": task.get("after", "")
+        })
+    # Ajouter après la section GANTT data dans la fonction load_project_data
+
+    # Map periods to dates for GANTT chart reference
+    period_dates = {
+        "S1": "2025-02-24", "S2": "2025-03-03", "S3": "2025-03-10",
+        "S4": "2025-03-17", "S5": "2025-03-24", "S6": "2025-03-31",
+        "S7": "2025-04-07", "S8": "2025-04-14", "S9": "2025-04-21",
+        "S10": "2025-04-28", "S11": "2025-05-05", "S12": "2025-05-12", 
+        "S13": "2025-05-19", "S14": "2025-05-26"
+    }
+    
+    # Satisfaction data
+    satisfaction_rows = []
+    for i, period in enumerate(periods):
+        very_satisfied_base = 3 + i * 2
+        satisfied_base = 3 - i * 0.3
+        neutral_base = max(0, 1 - i * 0.1)
+        unsatisfied_base = max(0, 1 - i * 0.08)
+        very_unsatisfied_base = max(0, 1 - i * 0.07)
+        
+        # Make sure none are negative and they add up to 100
+        very_unsatisfied = max(0, round(very_unsatisfied_base))
+        unsatisfied = max(0, round(unsatisfied_base))
+        neutral = max(0, round(neutral_base))
+        satisfied = max(0, round(satisfied_base))
+        very_satisfied = 100 - (satisfied + neutral + unsatisfied + very_unsatisfied)
+        
+        answers = {
+            "Très satisfait": very_satisfied,
+            "Satisfait": satisfied,
+            "Neutre": neutral,
+            "Insatisfait": unsatisfied,
+            "Très insatisfait": very_unsatisfied
+        }
+        for answer, percentage in answers.items():
+            satisfaction_rows.append({"period": period, "answer": answer, "pourcentage": percentage})
+
+    # Définition des jalons clés du projet
+    milestones = [
+        {"Milestone": "Validation de la charte", "Date": "2025-03-14", "Phase": "Phase 1"},
+        {"Milestone": "Planification complétée", "Date": "2025-04-04", "Phase": "Phase 2"},
+        {"Milestone": "Recrutement bénévoles finalisé", "Date": "2025-04-22", "Phase": "Phase 3"},
+        {"Milestone": "Jour de l'événement", "Date": "2025-05-10", "Phase": "Phase 3"},
+        {"Milestone": "Rapport final", "Date": "2025-05-21", "Phase": "Phase 4"}
+    ]
+
+    team_rows = [
+        {"period": period, "member": member, "state": states[i]}
+        for member, states in team_states.items()
+        for i, period in enumerate(periods)
+    ]
+
+    # Complete dataset, one long-format table per topic
+    return {
+        "period_dates": pd.DataFrame({"period": list(period_dates), "date": list(period_dates.values())}),
+        "progress": pd.DataFrame({"period": list(project_progress), "progress": list(project_progress.values())}),
+        "budget": pd.DataFrame(budget_rows),
+        "risks": pd.DataFrame(risk_rows),
+        "objectives": pd.DataFrame(objective_rows),
+        "team": pd.DataFrame(team_rows),
+        "satisfaction": pd.DataFrame(satisfaction_rows),
+        "gantt": pd.DataFrame(gantt_data),
+        "milestones": pd.DataFrame(milestones)
+    }
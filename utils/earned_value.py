@@ -0,0 +1,112 @@
+"""Valeur acquise : PV, EV, AC, CPI, SPI et estimation à terminaison par catégorie de budget et par période
+
+Pour chaque catégorie, le budget à terminaison (BAC) est le dernier budget
+validé. La valeur planifiée (PV) le répartit selon le planning du Gantt (part
+de la durée des tâches qui devait être terminée à la fin de la période), la
+valeur acquise (EV) selon l'avancement réel du projet, et le coût réel (AC)
+est le montant dépensé. Tout est calculé en une passe NumPy sur une matrice
+période x catégorie, colonne "Total" comprise.
+"""
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.profiling import counted_cache
+from utils.schedule import period_ends
+
+# Tables lues par le calcul : une modification des risques ou de l'équipe ne le relance pas
+EVM_TABLES = ("period_dates", "progress", "budget", "gantt")
+
+# En dessous de cet indice de performance des coûts (plus de 15 % de surcoût
+# pour le travail fait), la catégorie est en alerte
+CPI_ALERT = 0.85
+
+TOTAL = "Total"
+EVM_MEASURES = ("bac", "pv", "ev", "ac", "cpi", "spi", "eac", "vac")
+
+
+def planned_progress(data):
+    """Return the planned completion (0 to 1) at the end of each period, from the Gantt task durations
+
+    Seules les sous-tâches comptent quand il y en a (une tâche principale
+    couvre ses sous-tâches). Sans planning, l'avancement prévu est linéaire.
+    """
+    periods = len(data.periods)
+    gantt = data.gantt
+    if "Level" in gantt.columns and (gantt["Level"] == "Sub").any():
+        gantt = gantt[gantt["Level"] == "Sub"]
+    if gantt.empty:
+        return np.arange(1, periods + 1) / periods
+
+    start = pd.to_datetime(gantt["Start"]).to_numpy("datetime64[D]")
+    finish = pd.to_datetime(gantt["Finish"]).to_numpy("datetime64[D]") + np.timedelta64(1, "D")
+    ends = period_ends(data.period_dates)
+
+    duration = (finish - start).astype(float)
+    elapsed = (ends[:, None] - start[None, :]).astype(float)
+    done = np.clip(elapsed, 0, duration[None, :])
+    return done.sum(axis=1) / duration.sum()
+
+
+def compute_earned_value(data):
+    """Compute the earned value measures of every budget category and period, Total included
+
+    Renvoie un dictionnaire mesure -> DataFrame période x catégorie (bac, pv,
+    ev, ac, cpi, spi, eac, vac), les périodes de première alerte par catégorie
+    et l'avancement prévu et réel du projet.
+    """
+    periods = list(data.periods)
+    budget = data.budget
+    planned = planned_progress(data)
+    actual = data.progress.reindex(periods).to_numpy(float) / 100
+
+    bac = budget["valide"].unstack("category").reindex(periods)
+    categories = list(bac.columns) + [TOTAL]
+    bac = bac.to_numpy(float)
+    ac = budget["depense"].unstack("category").reindex(periods).to_numpy(float)
+    bac = np.column_stack([bac, bac.sum(axis=1)])
+    ac = np.column_stack([ac, ac.sum(axis=1)])
+
+    pv = bac * planned[:, None]
+    ev = bac * actual[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cpi = np.where(ac > 0, ev / ac, np.nan)
+        spi = np.where(pv > 0, ev / pv, np.nan)
+        # Estimation à terminaison : le reste du travail au rendement observé
+        eac = np.where(cpi > 0, bac / cpi, bac)
+    vac = bac - eac
+
+    measures = {
+        name: pd.DataFrame(values, index=pd.Index(periods, name="period"), columns=categories)
+        for name, values in zip(EVM_MEASURES, (bac, pv, ev, ac, cpi, spi, eac, vac))
+    }
+    # Première période où le CPI passe sous le seuil, par catégorie
+    alert = measures["cpi"] < CPI_ALERT
+    first_alerts = {category: alert[category].idxmax() for category in categories if alert[category].any()}
+    return {
+        **measures,
+        "planned_progress": pd.Series(planned, index=measures["bac"].index),
+        "actual_progress": pd.Series(actual, index=measures["bac"].index),
+        "first_alerts": MappingProxyType(first_alerts),
+    }
+
+
+@counted_cache("earned_value", st.cache_resource(max_entries=8, show_spinner=False))
+def _cached_earned_value(tables_version, _data):
+    # Une entrée par version des tables lues (les 8 dernières), partagée entre les sessions
+    return compute_earned_value(_data)
+
+
+def earned_value(data):
+    """Return the earned value measures, computed once per version of EVM_TABLES
+
+    Les DataFrame renvoyés sont des vues superficielles : les modifier copie
+    les colonnes touchées sans toucher au résultat partagé.
+    """
+    result = _cached_earned_value(data.tables_version(*EVM_TABLES), data)
+    return MappingProxyType({
+        name: value.copy(deep=False) if isinstance(value, (pd.DataFrame, pd.Series)) else value
+        for name, value in result.items()
+    })
@@ -0,0 +1,118 @@
+"""Cache des figures Plotly du tableau de bord, partagé par toutes les sessions"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from utils import profiling
+from utils.lazy import LazyModule
+from utils.shared_cache import shared_cache
+
+# Importés au premier accès : la page d'accueil et les onglets sans figure n'en ont pas besoin
+go = LazyModule("plotly.graph_objects")
+pio = LazyModule("plotly.io")
+
+# Budget mémoire et nombre maximal de figures sérialisées gardées par le processus
+FIGURE_CACHE_MAX_BYTES = int(os.environ.get("FIGURE_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+FIGURE_CACHE_MAX_ENTRIES = int(os.environ.get("FIGURE_CACHE_MAX_ENTRIES", 256))
+
+
+class FigureCache:
+    """Process-wide LRU cache of serialized Plotly figures, bounded by entries and bytes
+
+    Les figures sont gardées en JSON : une figure déjà construite est relue sans
+    repasser par plotly.express ni par la validation des add_shape/add_annotation.
+    Avec un cache partagé (plusieurs workers), une figure absente de la mémoire
+    est d'abord cherchée dans la base commune, puis y est écrite une fois construite.
+    """
+
+    def __init__(self, max_bytes=FIGURE_CACHE_MAX_BYTES, max_entries=FIGURE_CACHE_MAX_ENTRIES, shared=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.shared = shared
+        self._entries = OrderedDict()  # clé -> JSON de la figure
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """Return the figure cached under key, calling build() to create it on a miss"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if payload is not None:
+            # JSON produit par Plotly lui-même : la validation peut être sautée
+            return go.Figure(json.loads(payload), _validate=False)
+
+        shared_key = json.dumps(key) if self.shared is not None else None
+        if shared_key is not None:
+            with profiling.span("shared_cache"):
+                shared_payload = self.shared.get("figures", shared_key)
+            if shared_payload is not None:
+                payload = shared_payload.decode("utf-8")
+                self._store(key, payload)
+                return go.Figure(json.loads(payload), _validate=False)
+
+        with profiling.span("build"):
+            fig = build()
+        with profiling.span("to_json"):
+            payload = pio.to_json(fig, validate=False)
+        if shared_key is not None:
+            self.shared.set("figures", shared_key, payload.encode("utf-8"))
+        self._store(key, payload)
+        return fig
+
+    def _store(self, key, payload):
+        with self._lock:
+            self._discard(key)
+            if len(payload) <= self.max_bytes:
+                self._entries[key] = payload
+                self.current_bytes += len(payload)
+            while self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _discard(self, key):
+        payload = self._entries.pop(key, None)
+        if payload is not None:
+            self.current_bytes -= len(payload)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return the cache counters as a dictionary"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+figure_cache = FigureCache(shared=shared_cache)
+
+
+def cached_figure(figure_id, build, tables_version=None, period=None, phases=None, show_details=None):
+    """Return the figure built by build() for this view, reusing the cached copy when possible
+
+    La clé réunit l'identifiant de la figure, la version des tables qu'elle lit
+    (ProjectData.tables_version), la période et les filtres du planning (phases
+    sélectionnées, affichage des sous-tâches).
+    """
+    key = (figure_id, tables_version, period, tuple(phases) if phases is not None else None, show_details)
+    with profiling.span(f"figure:{figure_id}"):
+        return figure_cache.get(key, build)
@@ -0,0 +1,350 @@
+"""Contenu HTML de la page d'accueil, partagé par Accueil.py et l'export statique"""
+
+# Lien vers le tableau de bord ; l'export statique le remplace par une URL absolue
+DASHBOARD_URL = "/Jamais_Seul"
+
+PAGE_TITLE = "Les Saisons des Anciens | Course Jamais Seul"
+
+def nav_html(logo_img, dashboard_url=DASHBOARD_URL):
+    """Navigation bar"""
+    return f"""
+<div class="nav-container">
+    <div class="logo-title">
+        {logo_img or ''}
+        <h1>Les Saisons des Anciens</h1>
+    </div>
+    <div class="nav-links">
+        <a href="" class="nav-link active">Accueil</a>
+        <a href="#about" class="nav-link">Qui sommes-nous ?</a>
+        <a href="#rejoindre" class="nav-link">Nous rejoindre</a>
+        <a href="{dashboard_url}" class="nav-link">Projet Jamais Seul</a>
+        <a href="#contact" class="nav-link">Contact</a>
+    </div>
+</div>
+"""
+
+
+# Hero section
+HERO_HTML = """
+<div class="hero">
+    <h1>Courir ensemble, à tout âge</h1>
+    <p>Bienvenue sur le site de notre association "Les Saisons des Anciens".</p>
+    <h2> Notre événement phare, la course Jamais Seul, permet aux personnes âgées de participer à une expérience sportive adaptée et conviviale.</h2>
+    <a href="https://docs.google.com/forms/d/1P-mFD5ikxn6eCV_--sGzoYzzb738qJpeY7wqeuE45dQ/viewform?edit_requested=true" class="cta-button">Participer à la course</a>
+</div>
+"""
+
+# Stats section
+STATS_HTML = """
+<div class="section">
+    <h2 class="section-title">Notre impact</h2>
+    <div class="stat-container">
+        <div class="stat-item">
+            <div class="stat-number">300+</div>
+            <div class="stat-label">Participants seniors</div>
+        </div>
+        <div class="stat-item">
+            <div class="stat-number">30</div>
+            <div class="stat-label">Bénévoles engagés</div>
+        </div>
+        <div class="stat-item">
+            <div class="stat-number">7</div>
+            <div class="stat-label">Années d'expérience</div>
+        </div>
+        <div class="stat-item">
+            <div class="stat-number">5+</div>
+            <div class="stat-label">Partenaires</div>
+        </div>
+    </div>
+</div>
+"""
+
+# Qui sommes-nous (formerly Notre mission)
+ABOUT_HTML = """
+<div class="section" id="about">
+    <h2 class="section-title">Qui sommes-nous ?</h2>
+    <div class="row">
+        <p>L'association "Les Saisons des Anciens" a été fondée en 2010 par un groupe de professionnels de la santé et d'amateurs de course à pied, avec une vision commune : créer des opportunités sportives et sociales pour les personnes âgées.</p>
+        <p>Notre équipe est composée de bénévoles passionnés, de kinésithérapeutes, de médecins et de professionnels du sport adaptés aux seniors. Ensemble, nous travaillons pour proposer des activités qui maintiennent la forme physique et créent du lien social.</p>
+        <p>Notre course annuelle "Jamais Seul" est conçue pour permettre aux seniors de pratiquer une activité physique adaptée tout en créant des liens intergénérationnels. Nous croyons fermement que l'âge ne devrait jamais être un obstacle à la pratique sportive et au maintien d'une vie sociale épanouissante.</p>
+    </div>
+</div>
+"""
+
+# Activities section with cards
+ACTIVITIES = [
+    {
+        "image": "assets/images/course.jpg",
+        "placeholder": "https://via.placeholder.com/400x200?text=Course+Jamais+Seul",
+        "title": "La course Jamais Seul",
+        "text": "Notre événement phare annuel qui permet aux seniors de participer à une course adaptée avec le soutien de bénévoles.",
+    },
+    {
+        "image": "assets/images/ateliers.jpg",
+        "placeholder": "https://via.placeholder.com/400x200?text=Ateliers+Bien-être",
+        "title": "Ateliers bien-être",
+        "text": "Des séances hebdomadaires de gymnastique douce, yoga et relaxation spécialement conçues pour les seniors.",
+    },
+    {
+        "image": "assets/images/rencontres.jpg",
+        "placeholder": "https://via.placeholder.com/400x200?text=Rencontres+Intergénérationnelles",
+        "title": "Rencontres intergénérationnelles",
+        "text": "Des événements qui favorisent les échanges et le partage d'expériences entre générations.",
+    },
+]
+
+
+def activity_card_html(activity, img):
+    """Activity card, with a placeholder picture when the image is missing"""
+    img = img or f'<img src="{activity["placeholder"]}" width="100%">'
+    return f"""
+        <div class="card">
+            {img}
+            <div class="card-content">
+                <h3>{activity["title"]}</h3>
+                <p>{activity["text"]}</p>
+            </div>
+        </div>
+        """
+
+
+# Quote
+QUOTE_HTML = """
+<div style="margin-top: 50px;"></div>
+<div class="section">
+    <div class="quote">
+        L'âge n'est qu'un chiffre. Ce qui compte vraiment, c'est de rester actif, entouré et jamais seul dans sa passion pour la vie.
+    </div>
+</div>
+"""
+
+# Upcoming events
+EVENTS_HTML = """
+<div class="section">
+    <h2 class="section-title" id="evenement">Événements à venir</h2>
+    <div class="event-card">
+        <div class="event-date">
+            <div style="font-weight: bold; font-size: 1.5rem;">2</div>
+            <div>MAI</div>
+        </div>
+        <div class="event-content">
+            <h3 style="margin-top: 0;">Atelier préparation physique</h3>
+            <p>Séance spéciale pour préparer la course avec nos coaches spécialisés en activité physique adaptée.</p>
+            <a href="#contact" class="cta-button" style="padding: 8px 20px; font-size: 0.9rem;">En savoir plus</a>
+        </div>
+    </div>
+    <div class="event-card">
+        <div class="event-date">
+            <div style="font-weight: bold; font-size: 1.5rem;">9</div>
+            <div>MAI</div>
+        </div>
+        <div class="event-content">
+            <h3 style="margin-top: 0;">Course Jamais Seul 2025</h3>
+            <p>Notre événement annuel revient pour sa 15ème édition au Parc Municipal. Inscriptions ouvertes!</p>
+            <a href="https://docs.google.com/forms/d/1P-mFD5ikxn6eCV_--sGzoYzzb738qJpeY7wqeuE45dQ/viewform?edit_requested=true" class="cta-button" style="padding: 8px 20px; font-size: 0.9rem;">S'inscrire</a>
+        </div>
+    </div>
+    <div class="event-card">
+        <div class="event-date">
+            <div style="font-weight: bold; font-size: 1.5rem;">17</div>
+            <div>MAI</div>
+        </div>
+        <div class="event-content">
+            <h3 style="margin-top: 0;">Conférence bien-vieillir</h3>
+            <p>Intervention de spécialistes sur les bienfaits de l'activité physique chez les seniors.</p>
+            <a href="#contact" class="cta-button" style="padding: 8px 20px; font-size: 0.9rem;">En savoir plus</a>
+        </div>
+    </div>
+</div>
+"""
+
+# Testimonials
+TESTIMONIALS_TITLE_HTML = "<h2 class='section-title'>Témoignages</h2>"
+
+TESTIMONIALS = [
+    {
+        "text": "Grâce à l'association, j'ai retrouvé le goût de l'activité physique à 78 ans. Les bénévoles sont extraordinaires et l'ambiance est tellement chaleureuse !",
+        "author": "Jeanne, 78 ans",
+    },
+    {
+        "text": "Accompagner les seniors pendant cette course est une expérience humaine incroyable. On donne beaucoup, mais on reçoit encore plus en retour.",
+        "author": "Marc, bénévole depuis 5 ans",
+    },
+]
+
+
+def testimonial_html(testimonial):
+    """Testimonial card"""
+    return f"""
+    <div class="testimonial">
+        <p>"{testimonial["text"]}"</p>
+        <div class="testimonial-author">{testimonial["author"]}</div>
+    </div>
+    """
+
+
+# Partners - 6 partners with horizontal scrolling
+PARTNERS = [
+    {"image": "assets/images/AXA_Logo.png", "name": "AXA"},
+    {"image": "assets/images/Logo-bureau-vallee-2021.png", "name": "Bureau Vallée"},
+    {"image": "assets/images/logo-cave.jpg", "name": "La Cave"},
+    {"image": "assets/images/logo-joseph.png", "name": "Joseph"},
+    {"image": "assets/images/logo-Leclerc.jpg", "name": "Leclerc"},
+    {"image": "assets/images/Logo-Sodebo.png", "name": "Sodebo"},
+]
+
+
+def partners_html(logo_imgs):
+    """Partners section, logo_imgs holding one <img> tag (or None) per entry of PARTNERS"""
+    logos = "".join(f"""
+    <div class="partner-logo">
+        {img or ''}
+    </div>""" for img in logo_imgs)
+    return f"""
+<h2 class='section-title'>Nos partenaires</h2>
+<div class="partners-container">{logos}
+</div>
+"""
+
+
+# Rejoignez-nous section
+JOIN_HTML = """
+<div class="section" id="rejoindre">
+    <h2 class="section-title">Rejoignez-nous</h2>
+    </br>
+    <p>L'association Les Saisons des Anciens est toujours à la recherche de nouvelles personnes souhaitant s'impliquer, que ce soit comme :</p>
+    <div style="display: flex; flex-wrap: wrap; margin-top: 20px; gap: 20px;">
+        <div style="flex: 1; min-width: 250px; background-color: #f5f5f5; padding: 20px; border-radius: 10px;">
+            <h3 style="color: #34a0a2;">Participant</h3>
+            <p>Vous avez plus de 60 ans et souhaitez participer à nos activités ? Rejoignez nos séances hebdomadaires ou inscrivez-vous à nos événements spéciaux.</p>
+            <a href="#contact" class="cta-button" style="padding: 8px 20px; font-size: 0.9rem;">Devenir participant</a>
+        </div>
+        <div style="flex: 1; min-width: 250px; background-color: #f5f5f5; padding: 20px; border-radius: 10px;">
+            <h3 style="color: #34a0a2;">Bénévole</h3>
+            <p>Envie de donner de votre temps pour une cause qui a du sens ? Nos bénévoles sont essentiels au bon déroulement de toutes nos activités.</p>
+            <a href="#contact" class="cta-button" style="padding: 8px 20px; font-size: 0.9rem;">Devenir bénévole</a>
+        </div>
+        <div style="flex: 1; min-width: 250px; background-color: #f5f5f5; padding: 20px; border-radius: 10px;">
+            <h3 style="color: #34a0a2;">Partenaire</h3>
+            <p>Vous représentez une entreprise et souhaitez soutenir notre cause ? Découvrez nos différentes formules de partenariat.</p>
+            <a href="#contact" class="cta-button" style="padding: 8px 20px; font-size: 0.9rem;">Devenir partenaire</a>
+        </div>
+    </div>
+</div>
+"""
+
+# Newsletter
+NEWSLETTER_HTML = """
+<div class="newsletter">
+    <h2>Restez informé</h2>
+    <p>Inscrivez-vous à notre newsletter pour recevoir les dernières actualités de l'association et les informations sur nos prochains événements.</p>
+    <div style="display: flex; max-width: 500px; margin-top: 20px;">
+        <input type="email" placeholder="Votre adresse email" style="flex-grow: 1; padding: 12px; border: none; border-radius: 50px 0 0 50px; outline: none;">
+        <button class="cta-button" style="border-radius: 0 50px 50px 0; margin: 0;">S'abonner</button>
+    </div>
+</div>
+"""
+
+# Contact section
+CONTACT_HTML = """
+<div class="section" id="contact">
+    <h2 class="section-title">Contact</h2>
+    <div style="display: flex; flex-wrap: wrap; gap: 40px;">
+        <div style="flex: 1; min-width: 300px;">
+            <h3 style="color: #34a0a2;">Nos coordonnées</h3>
+            <p><strong>Adresse :</strong> 7B Pl. Francheville, 24000 Périgeux</p>
+            <p><strong>Téléphone :</strong> 05 23 45 67 89</p>
+            <p><strong>Email :</strong> contact@saisons-anciens.fr</p>
+            <p><strong>Horaires d'ouverture :</strong><br>
+            Lundi au vendredi : 9h00 - 18h00<br>
+            Samedi : 10h00 - 16h00</p>
+        </div>
+        <div style="flex: 1; min-width: 300px;">
+            <h3 style="color: #34a0a2;">Formulaire de contact</h3>
+            <div class="contact-form">
+                <input type="text" placeholder="Nom" />
+                <input type="email" placeholder="Email" />
+                <input type="text" placeholder="Sujet" />
+                <textarea placeholder="Votre message"></textarea>
+                <button class="cta-button" style="width: 100%;">Envoyer</button>
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+
+def footer_html(dashboard_url=DASHBOARD_URL):
+    """Footer with fixed social icons using emoji for reliability"""
+    return f"""
+<div class="footer">
+    <div style="max-width: 1200px; margin: 0 auto; padding: 0 20px;">
+        <div style="display: flex; flex-wrap: wrap; justify-content: space-between;">
+            <div class="footer-section" style="flex: 1; min-width: 200px; margin-right: 20px;">
+                <h3 class="footer-title">Les Saisons des Anciens</h3>
+                <p>Association dédiée au bien-être et à l'inclusion des seniors à travers des activités sportives et sociales adaptées.</p>
+                <div class="social-links">
+                    <a href="#" class="social-link">📘</a>
+                    <a href="#" class="social-link">🔗</a>
+                    <a href="#" class="social-link">🐦</a>
+                    <a href="#" class="social-link">📷</a>
+                </div>
+            </div>
+            <div class="footer-section" style="flex: 1; min-width: 200px; margin-right: 20px;">
+                <h3 class="footer-title">Navigation</h3>
+                <a href="#accueil" class="footer-link">Accueil</a>
+                <a href="#about" class="footer-link">Qui sommes-nous ?</a>
+                <a href="{dashboard_url}" class="footer-link">Jamais Seul</a>
+                <a href="#rejoindre" class="footer-link">Nous rejoindre</a>
+                <a href="#contact" class="footer-link">Contact</a>
+            </div>
+            <div class="footer-section" style="flex: 1; min-width: 200px;">
+                <h3 class="footer-title">Contact</h3>
+                <p>7B Pl. Francheville<br>24000 Périgeux</p>
+                <p>Tél: 05 23 45 67 89<br>Email: contact@saisons-anciens.fr</p>
+            </div>
+        </div>
+        <div class="copyright">
+            © 2025 Les Saisons des Anciens - Tous droits réservés
+            <div style="margin-top: 10px;">
+                <a href="#" style="color: rgba(255,255,255,0.6); margin-right: 20px; text-decoration: none;">Mentions légales</a>
+                <a href="#" style="color: rgba(255,255,255,0.6); text-decoration: none;">Politique de confidentialité</a>
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+
+def render_body(image, dashboard_url=DASHBOARD_URL):
+    """Return the whole landing page as one HTML fragment, for the static export
+
+    `image(path, **attrs)` renvoie la balise <img> d'une image (voir utils.assets.img_tag).
+    Les colonnes Streamlit sont remplacées par des rangées flex.
+    """
+    logo_img = image("assets/images/logo.png", alt="Logo Les Saisons des Anciens", width="60", loading="eager")
+    cards = "".join(
+        f'<div class="landing-column">{activity_card_html(activity, image(activity["image"], width="100%"))}</div>'
+        for activity in ACTIVITIES
+    )
+    testimonials = "".join(
+        f'<div class="landing-column">{testimonial_html(testimonial)}</div>'
+        for testimonial in TESTIMONIALS
+    )
+    partner_imgs = [image(partner["image"], alt=partner["name"], width="150") for partner in PARTNERS]
+    return "\n".join([
+        nav_html(logo_img, dashboard_url),
+        HERO_HTML,
+        STATS_HTML,
+        ABOUT_HTML,
+        f'<div class="landing-row">{cards}</div>',
+        QUOTE_HTML,
+        EVENTS_HTML,
+        TESTIMONIALS_TITLE_HTML,
+        f'<div class="landing-row">{testimonials}</div>',
+        partners_html(partner_imgs),
+        JOIN_HTML,
+        NEWSLETTER_HTML,
+        CONTACT_HTML,
+        footer_html(dashboard_url),
+    ])
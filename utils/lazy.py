@@ -0,0 +1,20 @@
+"""Imports différés : le module n'est importé qu'à la première lecture d'un de ses attributs"""
+import importlib
+
+
+class LazyModule:
+    """Stand-in for a module, imported on first attribute access (px = LazyModule("plotly.express"))"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            # import_module passe par le verrou d'import : sûr entre sessions concurrentes
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "imported" if self._module is not None else "not imported yet"
+        return f"<lazy module {self._name!r} ({state})>"
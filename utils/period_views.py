@@ -0,0 +1,240 @@
+"""Vues précalculées par période : tous les KPI, deltas et alertes des onglets du tableau de bord
+
+Les échéances des risques (mesures de prévention, validation de la météo) sont
+comptées en périodes avant celle du jour de l'événement, quel que soit le
+nombre de périodes de la source (démo, CSV, scénario).
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.profiling import counted_cache
+from utils.project_model import TEAM_STATE_NAMES, freeze
+from utils.data_cache import data_cache
+from utils.schedule import event_date
+from utils.shared_cache import shared_cache
+
+ACTIVE_TEAM_STATES = TEAM_STATE_NAMES[1:]
+
+# Tables lues par les vues : une modification du Gantt ne les recalcule pas (les jalons donnent l'événement)
+VIEW_TABLES = ("period_dates", "progress", "budget", "risks", "objectives", "team", "milestones")
+
+# Périodes avant celle de l'événement où la météo doit être validée (risque R04) : S9 à S11 dans la démo
+METEO_PERIODS_BEFORE_EVENT = (2, 1, 0)
+
+# Mesures de prévention du risque R02 et nombre de périodes avant l'événement où chacune est en place
+PREVENTION_STEPS = [
+    ("Plan de secours établi", 4),
+    ("Équipe médicale confirmée", 3),
+    ("Matériel de premiers soins préparé", 2),
+    ("Formation des bénévoles aux gestes de premiers secours", 1),
+    ("Coordination avec hôpitaux locaux", 0),
+]
+# Alerte R02 tant que les mesures prévues jusqu'à cette échéance ne sont pas en place
+PREVENTION_READY_BEFORE_EVENT = 1
+
+
+def event_period_index(data):
+    """Return the index of the period holding the event day (the last milestone when there is none)"""
+    starts = pd.to_datetime(data.period_dates).to_numpy("datetime64[D]")
+    index = np.searchsorted(starts, event_date(data.milestones), side="right") - 1
+    return int(np.clip(index, 0, len(starts) - 1))
+
+
+def compute_aggregates(data):
+    """Compute the per-period series shared by all views, one vectorized operation each"""
+    average_objective = data.average_objective()
+    major_risks = data.risk_counts()["Majeur"]
+    return {
+        "budget_totals": data.budget_totals(),
+        "average_objective": average_objective,
+        "objective_delta": data.delta(average_objective),
+        "major_risks": major_risks,
+        "risk_delta": data.delta(major_risks),
+        "participants_delta": data.delta(data.objective_table("actuel")["Participants"]),
+        "progress_delta": data.delta(data.progress),
+        "risk_counts": data.risk_counts(),
+        "team_counts": data.team_counts(),
+        "team_states": data.team_states(),
+        "event_index": event_period_index(data),
+    }
+
+
+def compute_period_view(data, period_index, aggregates=None):
+    """Compute every KPI, delta and alert displayed for one period"""
+    if aggregates is None:
+        aggregates = compute_aggregates(data)
+    periods = data.periods
+    period = periods[period_index]
+
+    objectives = data.at("objectives", period)
+    budget = data.at("budget", period)
+    budget_totals = {key: float(value) for key, value in aggregates["budget_totals"].loc[period].items()}
+
+    # Tableau de bord : métriques principales
+    participants = int(objectives.at['Participants', 'actuel'])
+    participants_objectif = int(objectives.at['Participants', 'cible'])
+    participants_ratio = participants / participants_objectif if participants_objectif > 0 else 0
+    benevoles_actuels = int(objectives.at['Bénévoles', 'actuel'])
+    benevoles_objectif = int(objectives.at['Bénévoles', 'cible'])
+    benevoles_ratio = benevoles_actuels / benevoles_objectif if benevoles_objectif > 0 else 0
+
+    event_index = aggregates["event_index"]
+    prevention_completed = [period_index >= event_index - before for _, before in PREVENTION_STEPS]
+    meteo_indexes = [event_index - before for before in METEO_PERIODS_BEFORE_EVENT if event_index - before >= 0]
+    meteo_periods = [periods[i] for i in meteo_indexes]
+
+    # Alertes sur les risques critiques
+    risk_warnings = []
+    if benevoles_ratio < 0.75:  # Moins de 75% des bénévoles ont répondu
+        risk_warnings.append({
+            "Risque": "R01_Désistement des bénévoles",
+            "Description": f"Seulement {benevoles_actuels}/{benevoles_objectif} bénévoles confirmés"
+        })
+    if period_index < event_index - PREVENTION_READY_BEFORE_EVENT:  # Mesures de prévention pas encore en place
+        risk_warnings.append({
+            "Risque": "R02_Risques sanitaires",
+            "Description": "Mesures de prévention incomplètes"
+        })
+    if participants_ratio < 0.7:
+        risk_warnings.append({
+            "Risque": "R03_Nombre de participants",
+            "Description": f"Seulement {participants}/{participants_objectif} participants inscrits"
+        })
+    if period_index in meteo_indexes:  # Météo non validée (S9-S11 dans la démo)
+        risk_warnings.append({
+            "Risque": "R04_Conditions extremes",
+            "Description": "Prévisions météo non validées"
+        })
+
+    # Budget : ratios calculés en colonnes sur toutes les catégories
+    total_depense = budget_totals["depense"]
+    consumed = (budget["depense"] / budget["valide"].where(budget["valide"] != 0) * 100).fillna(0)
+    share = budget["depense"] / total_depense * 100 if total_depense > 0 else budget["depense"] * 0
+    budget_categories = [
+        {
+            "Catégorie": category,
+            "Budget initial": float(row["initial"]),
+            "Budget validé": float(row["valide"]),
+            "Estimé": float(row["estime"]),
+            "Dépensé": float(row["depense"]),
+            "% Consommé": float(consumed[category]),
+            "% des dépenses": float(share[category]),
+            "Statut": "Dépassement" if row["depense"] > row["valide"] else "Dans le budget"
+        }
+        for category, row in budget.iterrows()
+    ]
+    budget_evolution = [
+        {
+            "Période": p,
+            "Budget initial": float(totals["initial"]),
+            "Budget validé": float(totals["valide"]),
+            "Dépensé": float(totals["depense"])
+        }
+        for p, totals in aggregates["budget_totals"].iloc[:period_index + 1].iterrows()
+    ]
+
+    # Équipe
+    team_counts = aggregates["team_counts"]
+    team_states = aggregates["team_states"]
+    member_status = [
+        {
+            "Membre": member,
+            "État": TEAM_STATE_NAMES[state],
+            "Tendance": "↑" if state > prev_state else "↓" if state < prev_state else "→"
+        }
+        for member, state, prev_state in zip(
+            team_states.columns, team_states.iloc[period_index], team_states.iloc[max(0, period_index - 1)]
+        )
+    ]
+    team_evolution = [
+        {"Période": p, **{state: int(counts[state]) for state in reversed(ACTIVE_TEAM_STATES)}}
+        for p, counts in team_counts.iloc[:period_index + 1].iterrows()
+    ]
+    counts = {state: int(count) for state, count in team_counts.loc[period].items()}
+
+    return {
+        "period": period,
+        "period_index": period_index,
+        "date": data.period_dates[period],
+        "progress": int(data.progress[period]),
+        "progress_delta": float(aggregates["progress_delta"][period]),
+        "avg_objective": int(aggregates["average_objective"][period]),
+        "objective_delta": float(aggregates["objective_delta"][period]),
+        "high_risks": int(aggregates["major_risks"][period]),
+        "risk_delta": float(aggregates["risk_delta"][period]),
+        "participants": participants,
+        "participants_delta": float(aggregates["participants_delta"][period]),
+        "objectives": {name: int(value) for name, value in objectives["pourcentage"].items()},
+        "risk_counts": {level: int(count) for level, count in aggregates["risk_counts"].loc[period].items()},
+        "risk_warnings": risk_warnings,
+        "budget_totals": budget_totals,
+        "budget_categories": budget_categories,
+        "budget_evolution": budget_evolution,
+        "benevoles": {
+            "cible": benevoles_objectif,
+            "actuel": benevoles_actuels,
+            "taux": benevoles_ratio * 100,
+        },
+        "participation": {
+            "cible": participants_objectif,
+            "actuel": participants,
+            "taux": participants_ratio * 100,
+        },
+        "prevention": {
+            "steps": [(name, done) for (name, _), done in zip(PREVENTION_STEPS, prevention_completed)],
+            "taux": sum(prevention_completed) / len(prevention_completed) * 100,
+        },
+        "meteo": {
+            "critical": period in meteo_periods,
+            "statuses": [
+                (p, "validated" if p_index < period_index else "current" if p_index == period_index else "pending")
+                for p, p_index in zip(meteo_periods, meteo_indexes)
+            ],
+        },
+        "team": {
+            "actifs": sum(counts[state] for state in ACTIVE_TEAM_STATES),
+            "counts": counts,
+            "evolution": team_evolution,
+            "members": member_status,
+        },
+    }
+
+
+def build_all_period_views(data):
+    """Precompute the view of every period, as read-only mappings shared by all sessions"""
+    aggregates = compute_aggregates(data)
+    return freeze({period: compute_period_view(data, i, aggregates) for i, period in enumerate(data.periods)})
+
+
+def stored_period_views(caches, data):
+    """Return the views of every period from the first on-disk cache that has them, computing them on a miss
+
+    caches : cache partagé par les workers, cache persistant (None ignorés).
+    Les vues calculées, ou lues plus loin dans la liste, sont écrites dans les
+    caches précédents.
+    """
+    tables_version = data.tables_version(*VIEW_TABLES)
+    caches = [cache for cache in caches if cache is not None]
+    views = None
+    for found_in, cache in enumerate(caches):
+        views = cache.get_object("period_views", tables_version)
+        if views is not None:
+            break
+    else:
+        views = build_all_period_views(data)
+        found_in = len(caches)
+    for cache in caches[:found_in]:
+        cache.set_object("period_views", tables_version, views)
+    return views
+
+
+@counted_cache("period_views", st.cache_resource(max_entries=8, show_spinner=False))
+def _cached_period_views(tables_version, _data):
+    # Une entrée par version des tables lues (les 8 dernières), partagée sans copie entre les sessions
+    return stored_period_views((shared_cache, data_cache), _data)
+
+
+def build_period_view(data, period):
+    """Return the precomputed view of a period, computing all periods once per version of VIEW_TABLES"""
+    return _cached_period_views(data.tables_version(*VIEW_TABLES), data)[period]
@@ -0,0 +1,272 @@
+"""Profilage optionnel des reruns : durée et allocations par section, compteurs des caches
+
+Activé par JAMAIS_SEUL_PROFILE=1 ou par ?profile=1 dans l'URL. Désactivé, span()
+ne coûte qu'un test. Activé, chaque rerun affiche sa décomposition dans la
+barre latérale et ajoute une ligne JSON au fichier de trace.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+PROFILE_ENV_VAR = "JAMAIS_SEUL_PROFILE"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_TRACE_FILE = Path(os.environ.get("JAMAIS_SEUL_PROFILE_TRACE", "dist/profiling/reruns.jsonl"))
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+# Appels et exécutions (ratés) des fonctions en st.cache_data / st.cache_resource, par nom
+cache_counters = {}
+_counters_lock = threading.Lock()
+
+# Profileur du rerun en cours, par thread (Streamlit exécute chaque session dans son thread)
+_current = threading.local()
+
+# Reruns profilés en cours : tracemalloc est global au processus. Un rerun
+# interrompu (st.rerun, st.stop) disparaît de l'ensemble avec son thread.
+_tracing_lock = threading.Lock()
+_tracing_profilers = weakref.WeakSet()
+
+_NO_SPAN = nullcontext()
+
+
+def _increment(name, field):
+    with _counters_lock:
+        counters = cache_counters.setdefault(name, {"calls": 0, "misses": 0})
+        counters[field] += 1
+
+
+def counted_cache(name, cache):
+    """Wrap a function in a Streamlit cache decorator, counting its calls and misses
+
+    Usage : @counted_cache("period_views", st.cache_resource(max_entries=8, show_spinner=False)).
+    Le corps de la fonction ne s'exécute que sur un raté : les succès sont
+    calls - misses.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def on_miss(*args, **kwargs):
+            _increment(name, "misses")
+            return func(*args, **kwargs)
+
+        cached = cache(on_miss)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            _increment(name, "calls")
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return decorate
+
+
+def cache_stats():
+    """Return the calls, misses and hits of every counted cache"""
+    with _counters_lock:
+        return {
+            name: {**counters, "hits": counters["calls"] - counters["misses"]}
+            for name, counters in cache_counters.items()
+        }
+
+
+def profiling_enabled():
+    """Return True when profiling is requested by the environment or the page URL"""
+    if os.environ.get(PROFILE_ENV_VAR, "").lower() in TRUE_VALUES:
+        return True
+    return st.query_params.get(PROFILE_QUERY_PARAM, "").lower() in TRUE_VALUES
+
+
+def _numeric_items(values, prefix=""):
+    # Aplatit {"figure_cache": {"hits": 3}} en {"figure_cache.hits": 3}
+    items = {}
+    for key, value in values.items():
+        if isinstance(value, dict):
+            items.update(_numeric_items(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            items[f"{prefix}{key}"] = value
+    return items
+
+
+class RerunProfiler:
+    """Timing spans, allocations and counter deltas of one script rerun
+
+    counters : nom -> fonction renvoyant un dictionnaire de compteurs (stats()
+    d'un cache, lectures du chargeur...). Seules leurs variations pendant le
+    rerun sont rapportées ; avec plusieurs sessions simultanées, elles incluent
+    l'activité des autres sessions.
+    """
+
+    def __init__(self, page, enabled=False, counters=None):
+        self.page = page
+        self.enabled = enabled
+        self.counters = {"st_cache": cache_stats, **(counters or {})}
+        self.spans = []
+        self._depth = 0
+        if enabled:
+            self._counters_before = self._read_counters()
+            self._start_tracing()
+            self._start = time.perf_counter()
+
+    def _read_counters(self):
+        return _numeric_items({name: read() for name, read in self.counters.items()})
+
+    def _start_tracing(self):
+        with _tracing_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            _tracing_profilers.add(self)
+            tracemalloc.reset_peak()
+        self._memory_before = tracemalloc.get_traced_memory()[0]
+
+    def _stop_tracing(self):
+        with _tracing_lock:
+            _tracing_profilers.discard(self)
+            if not _tracing_profilers and tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    @contextmanager
+    def span(self, name):
+        """Time a block of the rerun and measure the memory it allocated"""
+        if not self.enabled:
+            yield
+            return
+        depth = self._depth
+        self._depth += 1
+        memory_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            memory_after = tracemalloc.get_traced_memory()[0]
+            self._depth = depth
+            self.spans.append({
+                "name": name,
+                "depth": depth,
+                "ms": round(elapsed, 2),
+                "alloc_kib": round((memory_after - memory_before) / 1024, 1) + 0.0,  # pas de -0.0
+                "start_ms": round((start - self._start) * 1000, 2),
+            })
+
+    def finish(self, **context):
+        """Close the rerun, append it to the trace file and return its record"""
+        if getattr(_current, "profiler", None) is self:
+            _current.profiler = None
+        if not self.enabled:
+            return None
+        total_ms = (time.perf_counter() - self._start) * 1000
+        memory_after, peak = tracemalloc.get_traced_memory()
+        self._stop_tracing()
+
+        before = self._counters_before
+        after = self._read_counters()
+        counter_deltas = {
+            name: value - before.get(name, 0)
+            for name, value in after.items()
+            if value != before.get(name, 0)
+        }
+        # Spans dans l'ordre d'ouverture (ils sont enregistrés à leur fermeture)
+        spans = sorted(self.spans, key=lambda span: span["start_ms"])
+
+        self.record = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "page": self.page,
+            **context,
+            "total_ms": round(total_ms, 2),
+            "alloc_kib": round((memory_after - self._memory_before) / 1024, 1),
+            "peak_kib": round(peak / 1024, 1),
+            "spans": spans,
+            "counters": counter_deltas,
+        }
+        try:
+            PROFILE_TRACE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(PROFILE_TRACE_FILE, "a", encoding="utf-8") as trace:
+                trace.write(json.dumps(self.record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Warning: cannot write profiling trace {PROFILE_TRACE_FILE} ({e})")
+        return self.record
+
+    def render(self, container):
+        """Show the breakdown of the finished rerun in a container (sidebar placeholder)"""
+        if not self.enabled:
+            return
+        record = self.record
+        with container.container():
+            st.subheader("⏱️ Profilage" + (f" ({record['scope']})" if record.get("scope", "app") != "app" else ""))
+            st.caption(
+                f"Rerun : {record['total_ms']:.0f} ms · alloué {record['alloc_kib']:.0f} Kio"
+                f" · pic {record['peak_kib']:.0f} Kio"
+            )
+            if record["spans"]:
+                st.dataframe(
+                    pd.DataFrame({
+                        "Section": ["  " * span["depth"] + span["name"] for span in record["spans"]],
+                        "ms": [span["ms"] for span in record["spans"]],
+                        "Kio": [span["alloc_kib"] for span in record["spans"]],
+                    }),
+                    hide_index=True,
+                )
+            if record["counters"]:
+                st.caption(" · ".join(f"{name} +{value}" for name, value in record["counters"].items()))
+            st.caption(f"Trace : {PROFILE_TRACE_FILE}")
+
+
+def start_rerun(page, counters=None):
+    """Create the profiler of the current rerun (inactive unless profiling is enabled)"""
+    abandoned = current_profiler()
+    if abandoned is not None and abandoned.enabled:
+        # Rerun précédent interrompu avant son dernier fragment : arrêter son suivi mémoire
+        abandoned._stop_tracing()
+    profiler = RerunProfiler(page, enabled=profiling_enabled(), counters=counters)
+    _current.profiler = profiler
+    return profiler
+
+
+def current_profiler():
+    """Return the profiler of the rerun in progress on this thread, None once it is finished"""
+    return getattr(_current, "profiler", None)
+
+
+@contextmanager
+def profiled_fragment(page, name, placeholder, counters=None, ends_script=False):
+    """Profile a st.fragment body and yield a dict of context fields for its record
+
+    Rerun du fragment seul : il a son propre profileur, affiché dans placeholder
+    (un conteneur de la barre latérale). Sinon ses spans s'ajoutent au rerun en
+    cours ; ends_script=True pour le fragment qui termine le script et clôt ce
+    rerun. Un fragment ne peut écrire dans un conteneur extérieur qu'à la place
+    réservée lors du rerun complet : elle est réservée même vide.
+    """
+    profiler = current_profiler()
+    alone = profiler is None
+    if alone:
+        profiler = start_rerun(page, counters=counters)
+    context = {"scope": f"fragment:{name}" if alone else "app"}
+    try:
+        yield context
+    finally:
+        # Même si le fragment lève (ou st.rerun()) : le profileur et tracemalloc sont arrêtés
+        if alone or ends_script:
+            profiler.finish(**context)
+    if alone or ends_script:
+        profiler.render(placeholder)
+    elif profiler.enabled:
+        placeholder.container()
+
+
+def span(name):
+    """Time a block under the profiler of the current rerun, if any"""
+    profiler = getattr(_current, "profiler", None)
+    if profiler is None or not profiler.enabled:
+        return _NO_SPAN
+    return profiler.span(name)
+
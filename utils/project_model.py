@@ -0,0 +1,266 @@
+"""Modèle en colonnes des données du projet : tables pandas indexées par (période, clé)"""
+import copy
+import copyreg
+import hashlib
+import io
+import pickle
+from collections import ChainMap
+from types import MappingProxyType
+
+import pandas as pd
+
+# Version du format des données en cache sur disque (ProjectData, vues par période) :
+# à incrémenter quand la normalisation des tables ou le contenu des vues change
+SCHEMA_VERSION = 2
+
+TEAM_STATE_NAMES = ["Absent", "Formation", "Confrontation", "Normalisation", "Performance"]
+RISK_LEVELS = ["Mineur", "Modéré", "Majeur"]
+BUDGET_COLUMNS = ["initial", "valide", "estime", "depense"]
+
+# Tables du modèle et clé secondaire de chacune (None : une ligne par période ou table à plat)
+TABLE_KEYS = {
+    "period_dates": None,
+    "progress": None,
+    "budget": "category",
+    "risks": "risk",
+    "objectives": "objective",
+    "team": "member",
+    "satisfaction": "answer",
+    "gantt": None,
+    "milestones": None,
+}
+
+# Types des colonnes, identiques quelle que soit la source (démo, CSV, Excel, SQLite)
+TABLE_DTYPES = {
+    "progress": {"progress": "int64"},
+    "budget": {column: "float64" for column in BUDGET_COLUMNS},
+    "risks": {"impact": "int64"},
+    "objectives": {"cible": "int64", "actuel": "int64", "pourcentage": "int64"},
+    "team": {"state": "int8"},
+    "satisfaction": {"pourcentage": "int64"},
+}
+# Colonnes de dates, gardées au format texte AAAA-MM-JJ
+DATE_COLUMNS = {
+    "period_dates": ["date"],
+    "gantt": ["Start", "Finish"],
+    "milestones": ["Date"],
+}
+
+
+def _ordered_categorical(values, categories=None):
+    """Categorical keeping the order of first appearance (or the given order)"""
+    if categories is None:
+        categories = pd.unique(pd.Series(values))
+    return pd.Categorical(values, categories=categories, ordered=True)
+
+
+def periods_of(period_dates):
+    """Return the period labels of a period_dates table, in row order"""
+    if "period" in getattr(period_dates, "columns", []):
+        return [str(period) for period in period_dates["period"]]
+    return [str(period) for period in period_dates.index]
+
+
+def _flatten(table):
+    """Turn a normalized table back into the raw long format (index as columns)"""
+    if isinstance(table, pd.Series):
+        table = table.to_frame()
+    if table.index.names == [None]:
+        return table.reset_index(drop=True)
+    table = table.reset_index()
+    for column in table.columns:
+        if isinstance(table[column].dtype, pd.CategoricalDtype):
+            table[column] = table[column].astype(str)
+    return table
+
+
+def table_hash(table):
+    """Return a short sha256 digest of a DataFrame or Series, index included"""
+    hashed = pd.util.hash_pandas_object(table, index=True)
+    digest = hashlib.sha256(hashed.values.tobytes())
+    columns = table.columns if isinstance(table, pd.DataFrame) else [table.name]
+    digest.update(",".join(map(str, columns)).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def freeze(value):
+    """Return a read-only copy of nested dicts, lists and tuples (MappingProxyType, tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _mapping_proxy(items):
+    return MappingProxyType(items)
+
+
+def _reduce_mapping_proxy(proxy):
+    return _mapping_proxy, (dict(proxy),)
+
+
+# Vues figées picklables par les caches sur disque, relues sans repasser par freeze() ;
+# réducteur propre à leurs Pickler, copyreg n'est pas modifié pour tout le processus
+PICKLE_DISPATCH_TABLE = ChainMap({MappingProxyType: _reduce_mapping_proxy}, copyreg.dispatch_table)
+
+
+def pickle_dumps(value, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=None):
+    """Pickle a value that may hold frozen views (MappingProxyType), for the on-disk caches"""
+    stream = io.BytesIO()
+    pickler = pickle.Pickler(stream, protocol=protocol, buffer_callback=buffer_callback)
+    pickler.dispatch_table = PICKLE_DISPATCH_TABLE
+    pickler.dump(value)
+    return stream.getvalue()
+
+
+class ProjectData:
+    """Project tables in long format, with accessors vectorized over all periods
+
+    budget, risks, objectives, team et satisfaction sont des DataFrame indexés
+    par (period, clé). Les niveaux d'index sont catégoriels et ordonnés : les
+    périodes restent dans l'ordre S1..S14 et les catégories, risques et membres
+    dans l'ordre de saisie.
+
+    Une instance est partagée par toutes les sessions et n'est jamais modifiée :
+    data.budget renvoie une vue sans copie des données, et grâce au
+    copy-on-write de pandas (le comportement par défaut depuis pandas 3, requis
+    par requirements.txt), la modifier copie les colonnes touchées au lieu
+    d'écrire dans la table partagée. with_tables() renvoie un nouveau modèle.
+    """
+
+    def __init__(self, periods, **tables):
+        self.periods = tuple(periods)
+        missing = set(TABLE_KEYS) - set(tables)
+        if missing:
+            raise ValueError(f"Missing project tables: {', '.join(sorted(missing))}")
+        self._tables = {}
+        self._table_versions = {}
+        for name in TABLE_KEYS:
+            self._set_table(name, tables[name])
+        self._update_version()
+
+    def __getattr__(self, name):
+        # Tables : vue superficielle, les données restent partagées en lecture seule
+        if name in TABLE_KEYS and "_tables" in self.__dict__:
+            return self._tables[name].copy(deep=False)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name, value):
+        if name in TABLE_KEYS:
+            raise AttributeError(f"ProjectData is read-only, use with_tables({name}=...) to replace a table")
+        super().__setattr__(name, value)
+
+    @property
+    def table_versions(self):
+        """Version (content hash) of each table, read-only"""
+        return MappingProxyType(self._table_versions)
+
+    @classmethod
+    def from_tables(cls, tables):
+        """Build the model from raw tables, the periods being the rows of period_dates in order"""
+        return cls(periods_of(tables["period_dates"]), **tables)
+
+    def with_tables(self, **tables):
+        """Return a model where the given tables are replaced, reusing every other table
+
+        Une table dont le contenu n'a pas changé garde sa version : les caches qui
+        en dépendent restent valides. Renvoie self si aucune table n'a changé.
+        """
+        if "period_dates" in tables and periods_of(tables["period_dates"]) != list(self.periods):
+            # Nouvelles périodes : tous les index catégoriels sont à refaire
+            current = {name: getattr(self, name) for name in TABLE_KEYS}
+            return ProjectData.from_tables({**{name: _flatten(table) for name, table in current.items()}, **tables})
+
+        updated = copy.copy(self)
+        updated._tables = dict(self._tables)
+        updated._table_versions = dict(self._table_versions)
+        for name, table in tables.items():
+            updated._set_table(name, table)
+        if updated._table_versions == self._table_versions:
+            return self
+        updated._update_version()
+        return updated
+
+    def tables_version(self, *names):
+        """Return a short hash of the versions of the given tables, to key caches per table"""
+        return hashlib.sha256(
+            "".join(self._table_versions[name] for name in names).encode("utf-8")
+        ).hexdigest()[:12]
+
+    def _set_table(self, name, table):
+        key = TABLE_KEYS[name]
+        missing = {"period", key} - set(table.columns) if key is not None else set()
+        if missing:
+            raise KeyError(f"Table {name!r} is missing the columns {', '.join(sorted(missing))}")
+        table = table.astype(TABLE_DTYPES.get(name, {})).assign(**{
+            column: pd.to_datetime(table[column]).dt.strftime("%Y-%m-%d") for column in DATE_COLUMNS.get(name, [])
+        })
+        table = self._normalize(table, key)
+        version = table_hash(table)
+        if self._table_versions.get(name) != version:
+            self._tables[name] = table
+            self._table_versions[name] = version
+
+    def _update_version(self):
+        self.version = self.tables_version(*TABLE_KEYS)
+
+    def _normalize(self, table, key):
+        if "period" not in getattr(table, "columns", []):
+            return table.reset_index(drop=True)
+        table = table.copy()
+        table["period"] = _ordered_categorical(table["period"], list(self.periods))
+        if key is None:
+            table = table.set_index("period")
+            # Tables à une valeur par période : Series indexée par période
+            return table.iloc[:, 0] if table.shape[1] == 1 else table
+        table[key] = _ordered_categorical(table[key])
+        return table.set_index(["period", key]).sort_index()
+
+    # --- Accès par période -------------------------------------------------
+
+    def at(self, table, period):
+        """Return the rows of a (period, key) table for one period, indexed by key"""
+        return getattr(self, table).xs(period, level="period")
+
+    def keys(self, table):
+        """Return the secondary keys of a table (categories, risks, members...) in order"""
+        return list(getattr(self, table).index.levels[1])
+
+    # --- Agrégats sur toutes les périodes ----------------------------------
+
+    def budget_totals(self):
+        """Return the budget columns summed per period, with the spent ratio and remainder"""
+        totals = self.budget[BUDGET_COLUMNS].groupby(level="period", observed=True).sum()
+        totals["pourcentage"] = (totals["depense"] / totals["valide"].where(totals["valide"] != 0)).fillna(0) * 100
+        totals["reste"] = totals["valide"] - totals["depense"]
+        return totals
+
+    def objective_table(self, column="pourcentage"):
+        """Return one objective column as a period x objective table"""
+        return self.objectives[column].unstack("objective")
+
+    def average_objective(self):
+        """Return the truncated average completion of the objectives per period"""
+        return self.objective_table().mean(axis=1).astype(int)
+
+    def risk_counts(self):
+        """Return the number of risks of each level per period"""
+        counts = self.risks.groupby(["period", "niveau"], observed=True).size().unstack(fill_value=0)
+        return counts.reindex(columns=RISK_LEVELS, fill_value=0)
+
+    def team_states(self):
+        """Return the team states as a period x member table of state codes"""
+        return self.team["state"].unstack("member")
+
+    def team_counts(self):
+        """Return the number of members in each state per period"""
+        counts = self.team.groupby(["period", "state"], observed=True).size().unstack(fill_value=0)
+        counts = counts.reindex(columns=range(len(TEAM_STATE_NAMES)), fill_value=0)
+        counts.columns = TEAM_STATE_NAMES
+        return counts
+
+    @staticmethod
+    def delta(series):
+        """Return the change from the previous period (0 for the first one)"""
+        return series.diff().fillna(0)
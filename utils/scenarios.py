@@ -0,0 +1,199 @@
+"""Générateur de scénarios synthétiques et déterministes, au schéma de utils.project_model
+
+Sert à tester le tableau de bord à l'échelle d'une édition multi-sites : des
+dizaines de périodes, des centaines de lignes de budget et de risques, des
+milliers de tâches et de bénévoles. Une même graine donne toujours les mêmes tables.
+"""
+import numpy as np
+import pandas as pd
+
+# Valeurs par défaut : la taille de l'édition 2025 (jeu de démonstration)
+SCENARIO_DEFAULTS = {
+    "periods": 14,
+    "budget_lines": 7,
+    "risks": 4,
+    "tasks": 37,
+    "members": 9,
+    "volunteers": 40,
+    "participants": 700,
+    "partners": 10,
+    "seed": 0,
+}
+
+START_DATE = "2025-02-24"
+PHASES = ["Phase 1", "Phase 2", "Phase 3", "Phase 4"]
+# Part du calendrier occupée par chaque phase (d'après le planning 2025)
+PHASE_SHARES = [0.2, 0.2, 0.45, 0.15]
+BUDGET_THEMES = ["Logistique", "Sécurité & secours", "Communication", "Inscriptions/plateforme",
+                 "Animation", "Prévention des risques", "Imprévus"]
+RISK_THEMES = ["Désistement des bénévoles", "Risques sanitaires", "Nombre de participants",
+               "Conditions extremes"]
+
+# Courbes de progression des objectifs du jeu de démonstration, ré-échantillonnées sur n périodes
+GROWTH_CURVES = {
+    "Participants": [0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80, 0.90, 1.00, 1.20, 1.30],
+    "Bénévoles": [0.10, 0.20, 0.25, 0.30, 0.40, 0.50, 0.60, 0.75, 0.80, 0.85, 0.90, 0.95, 1.00, 1.05],
+    "Partenaires": [0.05, 0.10, 0.15, 0.20, 0.30, 0.40, 0.45, 0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 1.00],
+    "Satisfaction": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.60, 0.70, 0.80, 0.90],
+}
+
+
+def parse_scenario(spec):
+    """Parse "periods=40,tasks=3000" into scenario parameters (defaults for the missing keys)"""
+    params = dict(SCENARIO_DEFAULTS)
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        if name not in SCENARIO_DEFAULTS:
+            raise ValueError(f"Unknown scenario parameter {name!r} (expected one of {', '.join(SCENARIO_DEFAULTS)})")
+        params[name] = int(value)
+    return params
+
+
+def _resample(curve, n):
+    return np.interp(np.linspace(0, len(curve) - 1, n), np.arange(len(curve)), curve)
+
+
+def _cycled_names(themes, count):
+    # Les premiers noms reprennent les thèmes tels quels, les suivants sont numérotés
+    return [
+        themes[k % len(themes)] + (f" {k // len(themes) + 1}" if k >= len(themes) else "")
+        for k in range(count)
+    ]
+
+
+def scenario_tables(periods=14, budget_lines=7, risks=4, tasks=37, members=9,
+                    volunteers=40, participants=700, partners=10, seed=0):
+    """Generate the project tables of a synthetic scenario"""
+    rng = np.random.default_rng(seed)
+    n = periods
+    period_labels = [f"S{i + 1}" for i in range(n)]
+    period_dates = pd.date_range(START_DATE, periods=n, freq="7D")
+    ratio = np.arange(1, n + 1) / n
+
+    progress = pd.DataFrame({"period": period_labels, "progress": np.round(ratio * 100).astype(int)})
+
+    # Budget : montants validés tirés au hasard, dépenses proportionnelles à l'avancement
+    categories = _cycled_names(BUDGET_THEMES, budget_lines)
+    valide = rng.integers(20, 300, budget_lines) * 10
+    initial = np.round(valide * rng.uniform(0.9, 1.1, budget_lines), -1)
+    overspend = rng.uniform(0.8, 1.4, budget_lines)
+    spend = np.minimum(valide * overspend, valide * overspend * np.outer(ratio, np.ones(budget_lines)) * 1.1)
+    budget = pd.DataFrame({
+        "period": np.repeat(period_labels, budget_lines),
+        "category": np.tile(categories, n),
+        "initial": np.tile(initial, n),
+        "valide": np.tile(valide, n).astype(float),
+        "estime": np.tile(valide, n).astype(float),
+        "depense": spend.ravel(),
+    })
+
+    # Risques : niveau en marche aléatoire bornée (0 Mineur, 1 Modéré, 2 Majeur)
+    risk_names = _cycled_names(RISK_THEMES, risks)
+    risk_names = [f"R{k + 1:02d}_{name}" for k, name in enumerate(risk_names)]
+    steps = rng.choice([-1, 0, 0, 1], size=(risks, n))
+    levels = np.clip(np.cumsum(steps, axis=1) + rng.integers(0, 3, (risks, 1)), 0, 2)
+    next_levels = np.concatenate([levels[:, 1:], levels[:, -1:]], axis=1)
+    trends = np.where(next_levels > levels, "↑", np.where(next_levels < levels, "↓", "→"))
+    impacts = np.clip(9 - levels * 2 + rng.integers(-1, 2, (risks, n)), 1, 10)
+    level_names = np.array(["Mineur", "Modéré", "Majeur"])[levels]
+    priorities = np.where(
+        level_names == "Majeur", "Urgent",
+        np.where(level_names == "Modéré", np.where(impacts > 6, "Élevé", "Normal"), "Faible")
+    )
+    risks_table = pd.DataFrame({
+        "period": np.tile(period_labels, risks),
+        "risk": np.repeat(risk_names, n),
+        "niveau": level_names.ravel(),
+        "tendance": trends.ravel(),
+        "impact": impacts.ravel(),
+        "priorité": priorities.ravel(),
+    })
+
+    # Objectifs SMART
+    targets = {"Participants": participants, "Bénévoles": volunteers, "Partenaires": partners, "Satisfaction": 100}
+    objective_rows = []
+    for name, target in targets.items():
+        curve = _resample(GROWTH_CURVES[name], n)
+        objective_rows.append(pd.DataFrame({
+            "period": period_labels,
+            "objective": name,
+            "cible": target,
+            "actuel": (target * curve).astype(int),
+            "pourcentage": (curve * 100).astype(int),
+        }))
+    objectives = pd.concat(objective_rows, ignore_index=True)
+
+    # Équipe : chaque membre passe de Formation à Performance, avec quelques absences
+    stage_length = rng.uniform(0.15, 0.35, (members, 1)) * n
+    states = np.clip(1 + (np.arange(n) / stage_length).astype(int), 1, 4)
+    states[rng.random((members, n)) < 0.05] = 0
+    team = pd.DataFrame({
+        "period": np.tile(period_labels, members),
+        "member": np.repeat([f"Membre {k + 1}" for k in range(members)], n),
+        "state": states.ravel(),
+    })
+
+    # Satisfaction : même répartition que le jeu de démonstration
+    i = np.arange(n)
+    very_unsatisfied = np.maximum(0, np.round(np.maximum(0, 1 - i * 0.07)))
+    unsatisfied = np.maximum(0, np.round(np.maximum(0, 1 - i * 0.08)))
+    neutral = np.maximum(0, np.round(np.maximum(0, 1 - i * 0.1)))
+    satisfied = np.maximum(0, np.round(3 - i * 0.3))
+    answers = {
+        "Très satisfait": 100 - (satisfied + neutral + unsatisfied + very_unsatisfied),
+        "Satisfait": satisfied,
+        "Neutre": neutral,
+        "Insatisfait": unsatisfied,
+        "Très insatisfait": very_unsatisfied,
+    }
+    satisfaction = pd.DataFrame({
+        "period": np.repeat(period_labels, len(answers)),
+        "answer": np.tile(list(answers), n),
+        "pourcentage": np.column_stack(list(answers.values())).ravel().astype(int),
+    })
+
+    # Planning : une tâche principale par phase, sous-tâches tirées dans la fenêtre de la phase
+    total_days = 7 * n
+    phase_bounds = np.round(np.cumsum([0] + PHASE_SHARES) * total_days).astype(int)
+    start = pd.Timestamp(START_DATE)
+    sub_counts = np.bincount(
+        np.searchsorted(np.cumsum(PHASE_SHARES), rng.random(max(0, tasks - len(PHASES))), side="right").clip(0, 3),
+        minlength=len(PHASES),
+    )
+    gantt_rows, milestones = [], []
+    for p, phase in enumerate(PHASES):
+        phase_start, phase_end = phase_bounds[p], max(phase_bounds[p], phase_bounds[p + 1] - 1)
+        gantt_rows.append({
+            "Task": f"{p + 1} {phase}",
+            "Start": start + pd.Timedelta(days=int(phase_start)),
+            "Finish": start + pd.Timedelta(days=int(phase_end)),
+            "Resource": phase,
+            "Level": "Main",
+        })
+        offsets = np.sort(rng.integers(phase_start, phase_end + 1, sub_counts[p]))
+        durations = rng.integers(0, 6, sub_counts[p])
+        for k, (offset, duration) in enumerate(zip(offsets, durations)):
+            gantt_rows.append({
+                "Task": f"{p + 1}.{k + 1} Tâche {p + 1}.{k + 1}",
+                "Start": start + pd.Timedelta(days=int(offset)),
+                "Finish": start + pd.Timedelta(days=int(min(offset + duration, phase_end))),
+                "Resource": phase,
+                "Level": "Sub",
+            })
+        milestones.append({
+            "Milestone": f"Fin de la phase {p + 1}",
+            "Date": start + pd.Timedelta(days=int(phase_end)),
+            "Phase": phase,
+        })
+
+    return {
+        "period_dates": pd.DataFrame({"period": period_labels, "date": period_dates.strftime("%Y-%m-%d")}),
+        "progress": progress,
+        "budget": budget,
+        "risks": risks_table,
+        "objectives": objectives,
+        "team": team,
+        "satisfaction": satisfaction,
+        "gantt": pd.DataFrame(gantt_rows),
+        "milestones": pd.DataFrame(milestones),
+    }
@@ -0,0 +1,163 @@
+"""Graphe des tâches du planning : numéros WBS, durées en jours et dépendances entre tâches
+
+Les dépendances sont lues dans la colonne "Predecessors" du Gantt (numéros WBS
+séparés par des virgules, "3.6, 3.4" ; un numéro de tâche principale vaut
+toutes ses sous-tâches). Sans cette colonne, elles sont déduites des dates :
+une tâche dépend des tâches terminées avant le jour où elle commence, en ne
+gardant que les dernières terminées.
+
+Une tâche commence au plus tôt le lendemain de la fin de ses prédécesseurs.
+"""
+import warnings
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+PREDECESSORS_COLUMN = "Predecessors"
+# Jalon de l'événement : échéance des tâches planifiées avant lui
+EVENT_MILESTONE = "Jour de l'événement"
+
+
+def task_number(task):
+    """Return the WBS number of a task name ("3.13" for "3.13 Installation technique"), or "" """
+    number = str(task).split(" ", 1)[0]
+    return number if number and all(part.isdigit() for part in number.split(".")) else ""
+
+
+def event_date(milestones):
+    """Return the date of the event milestone, or the last milestone when there is none"""
+    dates = pd.to_datetime(milestones["Date"])
+    event = dates[milestones["Milestone"] == EVENT_MILESTONE]
+    return (event.iloc[0] if len(event) else dates.max()).to_datetime64().astype("datetime64[D]")
+
+
+def period_ends(period_dates):
+    """Return the end of each period (start of the next one, a week after the last start), as days"""
+    starts = pd.to_datetime(period_dates).to_numpy("datetime64[D]")
+    return np.append(starts[1:], starts[-1] + np.timedelta64(7, "D"))
+
+
+def schedule_tasks(gantt):
+    """Return the tasks to schedule, with their start day and duration in days from the first start
+
+    Seules les sous-tâches comptent quand il y en a (une tâche principale
+    couvre ses sous-tâches). Les dates de fin sont incluses : une tâche du
+    10 au 10 dure un jour. Les tâches sont triées par date de début.
+    """
+    if "Level" in gantt.columns and (gantt["Level"] == "Sub").any():
+        gantt = gantt[gantt["Level"] == "Sub"]
+    start = pd.to_datetime(gantt["Start"]).to_numpy("datetime64[D]")
+    finish = pd.to_datetime(gantt["Finish"]).to_numpy("datetime64[D]")
+    order = np.argsort(start, kind="stable")
+    origin = start.min() if len(start) else np.datetime64("today", "D")
+    tasks = gantt.iloc[order].reset_index(drop=True)
+    return tasks.assign(
+        start_day=(start[order] - origin).astype(int),
+        duration=(finish[order] - start[order]).astype(int) + 1,
+    ), origin
+
+
+def infer_predecessors(tasks):
+    """Return the predecessors of each task (tuples of row positions), deduced from the dates"""
+    start = tasks["start_day"].to_numpy()
+    last_day = start + tasks["duration"].to_numpy() - 1
+    predecessors = []
+    for i in range(len(tasks)):
+        done = last_day < start[i]
+        if done.any():
+            latest = last_day[done].max()
+            predecessors.append(tuple(np.flatnonzero(done & (last_day == latest))))
+        else:
+            predecessors.append(())
+    return tuple(predecessors)
+
+
+def declared_predecessors(tasks):
+    """Return the predecessors of each task read from the Predecessors column (tuples of row positions)
+
+    Une référence inconnue est ignorée avec un avertissement ; une tâche
+    n'est jamais son propre prédécesseur ("3" déclaré sur 3.13).
+    """
+    positions = {}
+    for position, number in enumerate(tasks["Task"].map(task_number)):
+        # "3.13" désigne la tâche, "3" et "3.1" toutes les tâches numérotées en dessous
+        parts = number.split(".")
+        for depth in range(1, len(parts) + 1):
+            positions.setdefault(".".join(parts[:depth]), []).append(position)
+
+    predecessors = []
+    for position, (task, declared) in enumerate(zip(tasks["Task"], tasks[PREDECESSORS_COLUMN])):
+        before = set()
+        for reference in str(declared).split(",") if pd.notna(declared) else ():
+            reference = reference.strip()
+            if not reference:
+                continue
+            if reference not in positions:
+                warnings.warn(f"Unknown predecessor {reference!r} of task {task!r}, ignored", stacklevel=2)
+                continue
+            before.update(positions[reference])
+        # "3" ou "3.1" déclaré sur 3.13 désigne aussi 3.13
+        before.discard(position)
+        predecessors.append(tuple(sorted(before)))
+    return tuple(predecessors)
+
+
+def task_predecessors(tasks):
+    """Return the predecessors of each task and whether they were declared (True) or deduced from the dates"""
+    if PREDECESSORS_COLUMN in tasks.columns and tasks[PREDECESSORS_COLUMN].fillna("").astype(str).str.strip().any():
+        return declared_predecessors(tasks), True
+    return infer_predecessors(tasks), False
+
+
+def successors_of(predecessors):
+    """Return the successors of each task, from its predecessors"""
+    successors = [[] for _ in predecessors]
+    for task, before in enumerate(predecessors):
+        for predecessor in before:
+            successors[predecessor].append(task)
+    return tuple(tuple(after) for after in successors)
+
+
+def topological_order(predecessors):
+    """Return the task positions in topological order (Kahn), raise ValueError on a dependency cycle"""
+    remaining = np.array([len(before) for before in predecessors])
+    successors = successors_of(predecessors)
+    ready = deque(np.flatnonzero(remaining == 0).tolist())
+    order = []
+    while ready:
+        task = ready.popleft()
+        order.append(task)
+        for successor in successors[task]:
+            remaining[successor] -= 1
+            if remaining[successor] == 0:
+                ready.append(successor)
+    if len(order) < len(predecessors):
+        raise ValueError(f"Dependency cycle between tasks at positions {np.flatnonzero(remaining > 0).tolist()}")
+    return np.array(order, dtype=int)
+
+
+def topological_levels(predecessors, order=None):
+    """Group the tasks by depth in the graph: a task's predecessors are all in earlier levels"""
+    order = topological_order(predecessors) if order is None else order
+    depth = np.zeros(len(predecessors), dtype=int)
+    for task in order:
+        if predecessors[task]:
+            depth[task] = depth[list(predecessors[task])].max() + 1
+    return [np.flatnonzero(depth == level) for level in range(depth.max() + 1)] if len(depth) else []
+
+
+def padded_levels(neighbours, levels, sentinel):
+    """Return each level with the neighbours of its tasks as a matrix, padded with sentinel
+
+    Une matrice par niveau permet de calculer tout le niveau d'un bloc :
+    values[:, matrix].max(axis=-1), la colonne sentinel portant la valeur neutre.
+    """
+    padded = []
+    for level in levels:
+        width = max(1, max(len(neighbours[i]) for i in level))
+        matrix = np.full((len(level), width), sentinel)
+        for row, i in enumerate(level):
+            matrix[row, :len(neighbours[i])] = neighbours[i]
+        padded.append((level, matrix))
+    return padded
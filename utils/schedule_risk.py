@@ -0,0 +1,164 @@
+"""Risque de planning : simulation Monte Carlo (PERT) des dates de fin des phases face au jour de l'événement
+
+Chaque tâche reçoit trois durées : optimiste, probable (la durée du Gantt) et
+pessimiste. Sans colonnes "Optimistic" / "Pessimistic" (en jours) dans le
+Gantt, elles valent probable x (1 - OPTIMISTIC_MARGIN) et probable x (1 + 2u) :
+l'avance possible est fixe, seul le retard possible grandit avec l'incertitude
+u, ce qui déforme la loi (et pas seulement son échelle) et fait varier les
+probabilités. La durée tirée suit une loi bêta-PERT. Les tâches du jour de
+l'événement (l'événement lui-même) ont une durée certaine.
+
+Une tâche ne commence pas avant sa date prévue (lieux, bénévoles réservés)
+mais attend la fin de ses prédécesseurs (utils/schedule.py) : leur retard se
+propage au-delà de la marge qui les sépare, leur avance non. Les tirages sont calculés en tableaux NumPy, niveau du graphe
+par niveau, toutes les tâches d'un niveau et tous les tirages d'un bloc à la fois.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.budget_simulation import CHUNK_ELEMENTS, DRAW_OPTIONS, SIMULATION_SEED
+from utils.profiling import counted_cache
+from utils.schedule import event_date, padded_levels, schedule_tasks, task_number, task_predecessors, topological_levels
+
+# Tables lues par la simulation : la période choisie ne la relance pas
+SCHEDULE_TABLES = ("gantt", "milestones")
+# Tâche suivie à part : la dernière installation avant l'ouverture
+KEY_TASK = "3.13"
+# Avance maximale d'une tâche sur sa durée prévue, quelle que soit l'incertitude
+OPTIMISTIC_MARGIN = 0.1
+
+
+def three_point_durations(tasks, uncertainty, fixed=None):
+    """Return the optimistic, likely and pessimistic durations of the tasks, in days
+
+    fixed : masque des tâches à durée certaine (l'événement lui-même).
+    """
+    likely = tasks["duration"].to_numpy(float)
+    optimistic = likely * (1 - OPTIMISTIC_MARGIN)
+    pessimistic = likely * (1 + 2 * uncertainty)
+    if "Optimistic" in tasks.columns:
+        optimistic = tasks["Optimistic"].fillna(pd.Series(optimistic)).to_numpy(float)
+    if "Pessimistic" in tasks.columns:
+        pessimistic = tasks["Pessimistic"].fillna(pd.Series(pessimistic)).to_numpy(float)
+    optimistic, pessimistic = np.minimum(optimistic, likely), np.maximum(pessimistic, likely)
+    if fixed is not None:
+        optimistic, pessimistic = np.where(fixed, likely, optimistic), np.where(fixed, likely, pessimistic)
+    return optimistic, likely, pessimistic
+
+
+def simulate_finishes(start, durations, predecessors, targets, draws, seed=SIMULATION_SEED):
+    """Draw the schedule draws times and return the finish day of each target (draws x targets)
+
+    start : jour de début prévu de chaque tâche ; durations : (optimiste,
+    probable, pessimiste) ; targets : positions des tâches de chaque cible,
+    dont la fin est celle de sa dernière tâche. Fin exclusive : une tâche
+    commencée le jour 0 et qui dure 1,5 jour finit au jour 1,5.
+    """
+    optimistic, likely, pessimistic = durations
+    n = len(start)
+    span = pessimistic - optimistic
+    # Paramètres de la loi bêta-PERT ; durée certaine : bêta(1, 1) x 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = np.where(span > 0, 1 + 4 * (likely - optimistic) / span, 1.0)
+        beta = np.where(span > 0, 1 + 4 * (pessimistic - likely) / span, 1.0)
+
+    # Prédécesseurs de chaque niveau en matrice, complétée par la colonne n (fin au jour 0)
+    levels = padded_levels(predecessors, topological_levels(predecessors), n)
+
+    rng = np.random.default_rng(seed)
+    finishes = np.empty((draws, len(targets)))
+    chunk = max(1, CHUNK_ELEMENTS // max(n, 1))
+    for first in range(0, draws, chunk):
+        size = min(chunk, draws - first)
+        duration = optimistic + rng.beta(alpha, beta, size=(size, n)) * span
+        finish = np.zeros((size, n + 1))
+        for level, padded in levels:
+            begin = np.maximum(start[level], finish[:, padded].max(axis=2))
+            finish[:, level] = begin + duration[:, level]
+        finish = finish[:, :n]
+        for t, positions in enumerate(targets):
+            finishes[first:first + size, t] = finish[:, positions].max(axis=1)
+    return finishes
+
+
+def simulate_schedule(data, draws=DRAW_OPTIONS[0], uncertainty=0.25):
+    """Simulate the schedule and return, per phase and for KEY_TASK, the chance to finish in time
+
+    Échéance d'une cible : le jour de l'événement (fin de journée comprise),
+    ou sa propre fin prévue quand elle est planifiée après l'événement (bilan).
+    """
+    started = time.perf_counter()
+    tasks, origin = schedule_tasks(data.gantt)
+    deadline_day = int((event_date(data.milestones) - origin).astype(int))
+    start = tasks["start_day"].to_numpy(float)
+
+    targets = {}
+    for phase, positions in tasks.groupby("Resource", sort=False).indices.items():
+        targets[str(phase)] = positions
+    key_task = np.flatnonzero(tasks["Task"].map(task_number) == KEY_TASK)
+    if len(key_task):
+        targets[str(tasks["Task"].iloc[key_task[0]])] = key_task[:1]
+
+    predecessors, declared = task_predecessors(tasks)
+    # L'événement (tâches qui commencent le jour de l'événement et le finissent) ne dure pas plus ou moins longtemps
+    on_event_day = (tasks["start_day"] == deadline_day).to_numpy() & (tasks["duration"] == 1).to_numpy()
+    durations = three_point_durations(tasks, uncertainty, fixed=on_event_day)
+    finishes = simulate_finishes(start, durations, predecessors, list(targets.values()), draws)
+
+    def as_date(end_day):
+        # Dernier jour travaillé d'une fin exclusive (1,5 -> jour 1)
+        return pd.Timestamp(origin + np.timedelta64(int(np.ceil(end_day)) - 1, "D"))
+
+    rows = []
+    for t, (target, positions) in enumerate(targets.items()):
+        planned_end = float((start[positions] + durations[1][positions]).max())
+        due = deadline_day + 1 if planned_end <= deadline_day + 1 else planned_end
+        p50, p90 = np.quantile(finishes[:, t], [0.5, 0.9])
+        rows.append({
+            "target": target,
+            "planned": as_date(planned_end),
+            "deadline": as_date(due),
+            "probability": float((finishes[:, t] <= due).mean()),
+            "p50": as_date(p50),
+            "p90": as_date(p90),
+            "before_event": due == deadline_day + 1,
+        })
+
+    # Histogrammes sur des classes d'un jour communes à toutes les cibles, pour les superposer
+    edges = np.arange(np.floor(finishes.min()), np.ceil(finishes.max()) + 1)
+    if len(edges) < 2:
+        edges = np.array([edges[0], edges[0] + 1])
+    histograms = {target: np.histogram(finishes[:, t], bins=edges)[0] for t, target in enumerate(targets)}
+    return {
+        "targets": pd.DataFrame(rows).set_index("target"),
+        "histograms": histograms,
+        "bin_dates": pd.to_datetime(origin + edges.astype(int).astype("timedelta64[D]")),
+        "event_date": pd.Timestamp(origin + np.timedelta64(deadline_day, "D")),
+        "draws": draws,
+        "tasks": len(tasks),
+        "dependencies": sum(len(before) for before in predecessors),
+        "declared_dependencies": declared,
+        "elapsed_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+@counted_cache("schedule_risk", st.cache_resource(max_entries=32, show_spinner=False))
+def _cached_schedule_risk(tables_version, draws, uncertainty, _data):
+    # Une entrée par version du planning et des jalons et par paramètres, partagée entre les sessions
+    return simulate_schedule(_data, draws, uncertainty)
+
+
+def schedule_risk(data, draws=DRAW_OPTIONS[0], uncertainty=0.25):
+    """Return the schedule simulation, run once per version of SCHEDULE_TABLES and parameters
+
+    Renvoie None, avec un avertissement sur la page, quand les prédécesseurs
+    déclarés forment un cycle.
+    """
+    try:
+        return _cached_schedule_risk(data.tables_version(*SCHEDULE_TABLES), draws, uncertainty, data)
+    except ValueError as error:
+        st.warning(f"⚠️ Risque de retard non simulé, prédécesseurs du Gantt en cycle : {error}")
+        return None
@@ -0,0 +1,173 @@
+"""Cache partagé sur disque entre les workers : une base SQLite lue et écrite par tous les processus
+
+Activé par JAMAIS_SEUL_SHARED_CACHE (chemin de la base), que pose
+scripts/serve_workers.py. Il double les caches en mémoire de chaque processus :
+données du projet, vues par période et figures sérialisées. Un worker qui
+démarre, ou qui redémarre, relit ce qu'un autre a déjà calculé au lieu de tout
+reconstruire. Sans la variable, shared_cache vaut None et rien ne change.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from utils.project_model import pickle_dumps
+
+SHARED_CACHE_ENV_VAR = "JAMAIS_SEUL_SHARED_CACHE"
+
+# Taille maximale des valeurs gardées dans la base, toutes catégories confondues
+SHARED_CACHE_MAX_BYTES = int(os.environ.get("SHARED_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Attente maximale (s) quand un autre worker écrit
+BUSY_TIMEOUT = 10
+# Une lecture ne met à jour la date d'accès (pour l'éviction) que si elle date de plus de (s)
+ACCESS_RESOLUTION = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class SharedCache:
+    """Key-value store in a SQLite database shared by every worker process
+
+    Les valeurs sont des octets rangés par espace de noms ("figures",
+    "period_views"...). Le mode WAL laisse les lectures se faire pendant une
+    écriture ; au-delà de max_bytes, les entrées lues le moins récemment sont
+    supprimées. Une connexion par thread : Streamlit exécute chaque session
+    dans son propre thread.
+    """
+
+    def __init__(self, path, max_bytes=SHARED_CACHE_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def get(self, namespace, key):
+        """Return the bytes stored under (namespace, key), or None"""
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, accessed FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            now = time.time()
+            if row is not None and now - row[1] > ACCESS_RESOLUTION:
+                # Écriture évitée à chaque lecture : les workers ne se bloquent pas sur les succès
+                connection.execute(
+                    "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+                )
+        except sqlite3.Error as e:
+            # Base verrouillée ou abîmée : le worker recalcule, comme sans cache partagé
+            print(f"Warning: shared cache read failed ({e})")
+            self._count("errors")
+            return None
+        self._count("hits" if row is not None else "misses")
+        return row[0] if row is not None else None
+
+    def set(self, namespace, key, value):
+        """Store bytes under (namespace, key), evicting the least recently read entries if needed"""
+        if len(value) > self.max_bytes:
+            return
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, value, len(value), time.time()),
+                )
+                total = connection.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0]
+                if total > self.max_bytes:
+                    self._evict(connection, total - self.max_bytes)
+        except sqlite3.Error as e:
+            print(f"Warning: shared cache write failed ({e})")
+            self._count("errors")
+            return
+        self._count("writes")
+
+    def _evict(self, connection, excess):
+        freed = 0
+        rows = connection.execute("SELECT namespace, key, size FROM entries ORDER BY accessed").fetchall()
+        for namespace, key, size in rows:
+            if freed >= excess:
+                break
+            connection.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            freed += size
+
+    def get_object(self, namespace, key):
+        """Return the object pickled under (namespace, key), or None"""
+        value = self.get(namespace, key)
+        if value is None:
+            return None
+        try:
+            return pickle.loads(value)
+        except Exception as e:  # entrée d'une autre version du code
+            print(f"Warning: cannot unpickle shared cache entry {namespace}/{key} ({e})")
+            return None
+
+    def set_object(self, namespace, key, value):
+        """Pickle an object and store it under (namespace, key)"""
+        self.set(namespace, key, pickle_dumps(value))
+
+    def clear(self):
+        """Delete every entry (at deployment, the entries of the previous code version)"""
+        connection = self._connection()
+        connection.execute("DELETE FROM entries")
+        connection.execute("VACUUM")
+
+    def stats(self):
+        """Return the counters of this process and the content of the shared database"""
+        with self._lock:
+            counters = {"hits": self.hits, "misses": self.misses, "writes": self.writes, "errors": self.errors}
+        try:
+            entries, size = self._connection().execute(
+                "SELECT count(*), coalesce(sum(size), 0) FROM entries"
+            ).fetchone()
+        except sqlite3.Error:
+            entries = size = None
+        return {**counters, "entries": entries, "bytes": size, "max_bytes": self.max_bytes}
+
+
+def open_shared_cache(path=None):
+    """Return the shared cache at path (default: JAMAIS_SEUL_SHARED_CACHE), None when disabled"""
+    path = path or os.environ.get(SHARED_CACHE_ENV_VAR)
+    if not path:
+        return None
+    try:
+        return SharedCache(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: shared cache disabled, cannot open {path} ({e})")
+        return None
+
+
+shared_cache = open_shared_cache()
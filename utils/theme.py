@@ -0,0 +1,124 @@
+"""Feuilles de style partagées : minifiées une fois par processus et servies en fichiers statiques"""
+import hashlib
+import re
+from functools import lru_cache
+
+from utils.assets import (ASSETS_DIR, HASH_LENGTH, STATIC_BASE_URL, STATIC_DIR, asset_url, base64_cache,
+                          static_serving_enabled)
+
+CSS_DIR = ASSETS_DIR / "css"
+FONTS_DIR = ASSETS_DIR / "fonts"
+# Sous-dossier de static/ qui reçoit les feuilles minifiées (ex: css/landing.9b1e0c27aa.css)
+CSS_STATIC_DIR_NAME = "css"
+
+# Polices de la page d'accueil, auto-hébergées en woff2 (assets/fonts, générés par
+# scripts/subset_fonts.py). "google" ne sert de repli que si le fichier manque.
+FONTS = [
+    {"family": "Anton", "file": "anton-latin1.woff2", "weight": "400", "google": "Anton"},
+    {"family": "Montserrat", "file": "montserrat-latin1.woff2", "weight": "300 700",
+     "google": "Montserrat:wght@300;400;500;600;700"},
+]
+
+# Glyphes conservés par le sous-ensemble : Latin-1, plus les caractères du français
+# hors Latin-1 (œ, Œ, Ÿ), la ponctuation typographique (’ “ ” … – —) et l'euro
+FONT_UNICODE_RANGES = [
+    (0x0020, 0x007E), (0x00A0, 0x00FF), (0x0152, 0x0153), (0x0178, 0x0178),
+    (0x2013, 0x2014), (0x2018, 0x201E), (0x2022, 0x2022), (0x2026, 0x2026),
+    (0x2039, 0x203A), (0x20AC, 0x20AC),
+]
+
+
+def minify_css(css):
+    """Strip comments and whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(name):
+    """Read assets/css/<name>.css and return it minified"""
+    with open(CSS_DIR / f"{name}.css", encoding="utf-8") as f:
+        return minify_css(f.read())
+
+
+@lru_cache(maxsize=None)
+def publish_stylesheet(name):
+    """Write the minified stylesheet to static/css/ under a content-hashed name
+
+    Retourne le chemin relatif à static/, ou None si le dossier n'est pas accessible en écriture.
+    """
+    css = load_stylesheet(name)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    target = STATIC_DIR / CSS_STATIC_DIR_NAME / f"{name}.{digest}.css"
+    try:
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            for old in target.parent.glob(f"{name}.*.css"):
+                old.unlink()
+            target.write_text(css, encoding="utf-8")
+    except OSError as e:
+        print(f"Warning: cannot publish stylesheet {name} ({e})")
+        return None
+    return target.relative_to(STATIC_DIR).as_posix()
+
+
+def stylesheet_html(name, base_url=None):
+    """Return the HTML that loads a stylesheet
+
+    Avec le service statique, un simple <link> vers le fichier haché : le navigateur
+    le met en cache et chaque rerun n'envoie qu'une centaine d'octets. Sinon, la
+    feuille minifiée est intégrée dans une balise <style>.
+    """
+    if base_url is not None or static_serving_enabled():
+        path = publish_stylesheet(name)
+        if path is not None:
+            return f'<link rel="stylesheet" href="{base_url or STATIC_BASE_URL}/{path}">'
+    return f"<style>{load_stylesheet(name)}</style>"
+
+
+def font_unicode_range():
+    """Return FONT_UNICODE_RANGES as a CSS unicode-range value"""
+    return ", ".join(
+        f"U+{start:04X}" if start == end else f"U+{start:04X}-{end:04X}"
+        for start, end in FONT_UNICODE_RANGES
+    )
+
+
+def fonts_html(base_url=None):
+    """Return the HTML that loads the landing page fonts
+
+    Les polices de assets/fonts sont préchargées et déclarées avec
+    font-display: swap ; sans service statique, elles sont intégrées en data
+    URI. Seule une famille dont le woff2 manque passe par Google Fonts.
+    """
+    preloads, font_faces, missing = [], [], []
+    for font in FONTS:
+        url = asset_url(f"{ASSETS_DIR.name}/fonts/{font['file']}", base_url)
+        if url is not None:
+            preloads.append(f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin>')
+        else:
+            encoded = base64_cache.get(FONTS_DIR / font["file"])
+            if encoded is None:
+                missing.append(font)
+                continue
+            url = f"data:font/woff2;base64,{encoded}"
+        font_faces.append(
+            f"@font-face{{font-family:'{font['family']}';src:url(\"{url}\") format(\"woff2\");"
+            f"font-weight:{font['weight']};font-style:normal;font-display:swap;"
+            f"unicode-range:{font_unicode_range()}}}"
+        )
+
+    html = "".join(preloads)
+    if font_faces:
+        html += f"<style>{''.join(font_faces)}</style>"
+    if missing:
+        families = "&".join(f"family={font['google']}" for font in missing)
+        html += (
+            '<link rel="preconnect" href="https://fonts.googleapis.com">'
+            '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+            f'<link href="https://fonts.googleapis.com/css2?{families}&display=swap" rel="stylesheet">'
+        )
+    return html
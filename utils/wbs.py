@@ -0,0 +1,180 @@
+"""Arbre WBS du planning : avancement pondéré par la durée, agrégé des sous-tâches vers les phases
+
+L'arbre suit la numérotation des tâches du Gantt ("3" est le parent de "3.1"
+et de "3.10", "3.1.2" celui de "3.1" s'il existe). Seules les feuilles portent
+un avancement ; chaque nœud garde en cache sa durée totale et ses jours
+réalisés (somme de ses enfants), son avancement étant leur rapport. Modifier
+une feuille ne met à jour que ses ancêtres : O(profondeur).
+
+L'avancement d'une feuille à une période est la part de sa durée écoulée à la
+fin de la période, d'après les dates du Gantt.
+"""
+import copy
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.profiling import counted_cache
+from utils.schedule import period_ends, task_number
+
+WBS_TABLES = ("gantt", "period_dates")
+ROOT = ""
+
+
+class WBSTree:
+    """WBS tree of the Gantt tasks with duration-weighted completion cached on every node
+
+    Les nœuds sont des positions dans des tableaux NumPy (parent, profondeur,
+    durée, jours réalisés) ; le nœud 0 est la racine (le projet).
+    """
+
+    def __init__(self, numbers, names, parents, durations):
+        self.numbers = tuple(numbers)
+        self.names = tuple(names)
+        self.parent = np.asarray(parents, dtype=int)
+        self.index = {number: node for node, number in enumerate(self.numbers)}
+        self.children = [[] for _ in self.numbers]
+        for node, parent in enumerate(self.parent):
+            if parent >= 0:
+                self.children[parent].append(node)
+        self.leaf = np.array([not children for children in self.children])
+        self.leaf[0] = False
+
+        self.depth = np.zeros(len(self.numbers), dtype=int)
+        for node in range(1, len(self.numbers)):
+            parent, depth = self.parent[node], 1
+            while parent > 0:
+                parent, depth = self.parent[parent], depth + 1
+            self.depth[node] = depth
+        # Nœuds par profondeur, des feuilles les plus profondes vers la racine
+        self._levels = [np.flatnonzero(self.depth == depth) for depth in range(self.depth.max(), 0, -1)]
+
+        # Durée d'un nœud : celle de ses feuilles (une tâche principale couvre ses sous-tâches)
+        self.weight = np.where(self.leaf, np.asarray(durations, dtype=float), 0.0)
+        self._roll_up(self.weight)
+        self.done = np.zeros(len(self.numbers))
+
+    @classmethod
+    def from_gantt(cls, gantt):
+        """Build the tree from the task numbers of the Gantt, tasks without number hanging from the root
+
+        Lève ValueError si deux tâches ont le même numéro : chaque nœud n
+        correspond à la ligne n - 1 du Gantt.
+        """
+        names = [str(task) for task in gantt["Task"]]
+        numbers = [task_number(task) or f"#{row}" for row, task in enumerate(names)]
+        counts = Counter(numbers)
+        duplicates = [number for number, count in counts.items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Duplicate WBS numbers in the Gantt: {', '.join(duplicates)}")
+        durations = (pd.to_datetime(gantt["Finish"]) - pd.to_datetime(gantt["Start"])).dt.days.to_numpy() + 1
+        known = set(numbers)
+
+        def parent_number(number):
+            # Plus proche ancêtre présent dans le Gantt ("3.1.2" -> "3.1", sinon "3"), sinon la racine
+            parts = number.split(".")
+            for depth in range(len(parts) - 1, 0, -1):
+                if ".".join(parts[:depth]) in known:
+                    return ".".join(parts[:depth])
+            return ROOT
+
+        index = {number: node for node, number in enumerate([ROOT, *numbers])}
+        parents = [-1] + [index[parent_number(number)] for number in numbers]
+        return cls([ROOT, *numbers], ["Projet", *names], parents, [0, *durations])
+
+    def _roll_up(self, values):
+        # Agrégation ascendante d'un niveau de profondeur à la fois
+        values[~self.leaf] = 0
+        for level in self._levels:
+            np.add.at(values, self.parent[level], values[level])
+
+    def node(self, task):
+        """Return the node of a task given by node position, WBS number ("3.10") or full name"""
+        if isinstance(task, (int, np.integer)):
+            return int(task)
+        if task in self.index:
+            return self.index[task]
+        number = task_number(task)
+        if number in self.index:
+            return self.index[number]
+        raise KeyError(f"Unknown WBS task {task!r}")
+
+    def set_completions(self, completions):
+        """Set the completion (0 to 1) of every leaf, in node order, and roll everything up"""
+        self.done = np.where(self.leaf, self.weight * np.clip(completions, 0, 1), 0.0)
+        self._roll_up(self.done)
+
+    def set_completion(self, task, completion):
+        """Set the completion (0 to 1) of one leaf and refresh only its ancestors"""
+        node = self.node(task)
+        if not self.leaf[node]:
+            raise ValueError(f"{self.names[node]!r} has sub-tasks, its completion is rolled up from them")
+        delta = self.weight[node] * min(max(completion, 0.0), 1.0) - self.done[node]
+        while node >= 0:
+            self.done[node] += delta
+            node = self.parent[node]
+
+    def completion(self, task=ROOT):
+        """Return the completion (0 to 1) of a node, read from the cached sums"""
+        node = self.node(task)
+        return self.done[node] / self.weight[node] if self.weight[node] else 0.0
+
+    def top_level(self):
+        """Return the nodes directly under the project (the phases)"""
+        return self.children[0]
+
+    def copy(self):
+        """Return a tree sharing the structure, with its own completions"""
+        copied = copy.copy(self)
+        copied.done = self.done.copy()
+        return copied
+
+
+def progress_by_period(tree, data):
+    """Return the completion (0 to 100) of every node at the end of every period, as a period x node table
+
+    D'une période à la suivante, seules les feuilles dont l'avancement change
+    (tâches en cours) sont mises à jour, chacune en O(profondeur).
+    """
+    tree = tree.copy()
+    leaves = np.flatnonzero(tree.leaf)
+    gantt = data.gantt
+    rows = leaves - 1  # nœud n : ligne n - 1 du Gantt
+    start = pd.to_datetime(gantt["Start"]).to_numpy("datetime64[D]")[rows]
+    duration = tree.weight[leaves]
+    ends = period_ends(data.period_dates)
+    elapsed = (ends[:, None] - start[None, :]).astype(float)
+    completions = np.clip(elapsed / np.where(duration > 0, duration, 1), 0, 1)
+
+    progress = np.empty((len(ends), len(tree.numbers)))
+    current = np.zeros(len(leaves))
+    for p, values in enumerate(completions):
+        for changed in np.flatnonzero(values != current):
+            tree.set_completion(leaves[changed], values[changed])
+        current = values
+        progress[p] = np.divide(tree.done, tree.weight, out=np.zeros_like(tree.done), where=tree.weight > 0) * 100
+    return pd.DataFrame(progress, index=pd.Index(data.periods, name="period"), columns=list(tree.names))
+
+
+@counted_cache("wbs_progress", st.cache_resource(max_entries=8, show_spinner=False))
+def _cached_wbs_progress(tables_version, _data):
+    # Une entrée par version du planning et des périodes (les 8 dernières), partagée entre les sessions
+    tree = WBSTree.from_gantt(_data.gantt)
+    return tree, progress_by_period(tree, _data)
+
+
+def phase_progress(data, period):
+    """Return the completion (0 to 100) of each top-level task of the WBS at the end of a period
+
+    Renvoie une série vide, avec un avertissement sur la page, quand des
+    numéros de tâche sont en double.
+    """
+    try:
+        tree, progress = _cached_wbs_progress(data.tables_version(*WBS_TABLES), data)
+    except ValueError as error:
+        st.warning(f"⚠️ Avancement des phases non calculé : {error}")
+        return pd.Series(dtype=float)
+    phases = [tree.names[node] for node in tree.top_level()]
+    return progress.loc[period, phases]